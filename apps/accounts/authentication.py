@@ -0,0 +1,29 @@
+# apps/accounts/authentication.py
+from django.core.exceptions import ValidationError
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from .tokens import is_revoked, user_from_claims
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    `Authorization: Bearer <access token>` without a query: request.user is built
+    from the token claims (tokens.py) and loads any other field on first access.
+    """
+
+    def get_validated_token(self, raw_token):
+        token = super().get_validated_token(raw_token)
+        if is_revoked(token):
+            raise InvalidToken("Token has been revoked.")
+        return token
+
+    def get_user(self, validated_token):
+        try:
+            user = user_from_claims(validated_token)
+        except (KeyError, ValidationError):
+            raise InvalidToken("Token contained no recognizable user identification.")
+        if not user.is_active:
+            raise AuthenticationFailed("User is inactive.", code="user_inactive")
+        return user
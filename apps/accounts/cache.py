@@ -0,0 +1,52 @@
+# apps/accounts/cache.py
+# cached public user cards for the user serializers (invalidated in signals.py)
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+
+from core.cache import DEFAULT_TIMEOUT, read_through
+from core.images import READY, pick
+from .models import User
+
+
+def user_brief_key(user_id):
+    return f"user:brief:{user_id}"
+
+
+def _load_user_briefs(user_ids):
+    rows = User.objects.filter(pk__in=user_ids).values(
+        "id", "username", "first_name", "last_name", "profile__avatar", "profile__avatar_meta"
+    )
+    # ids with no row are cached as None, like read_through does
+    briefs = dict.fromkeys(user_ids)
+    for row in rows:
+        full = f"{row['first_name'] or ''} {row['last_name'] or ''}".strip()
+        avatar = row["profile__avatar"]
+        meta = row["profile__avatar_meta"] or {}
+        if avatar and meta.get("status") == READY:
+            # cards are shown small: use the smallest WebP rendition
+            avatar = pick(meta, 0)
+        briefs[row["id"]] = {
+            "id": row["id"],
+            "username": row["username"],
+            "display_name": full if full else row["username"],
+            # relative media url; serializers make it absolute per request
+            "avatar": default_storage.url(avatar) if avatar else None,
+        }
+    return briefs
+
+
+def get_user_brief(user_id):
+    return read_through(user_brief_key(user_id), lambda: _load_user_briefs([user_id])[user_id])
+
+
+def get_user_briefs(user_ids):
+    """Cards for many users: one cache round trip, one query for the misses."""
+    user_ids = list(dict.fromkeys(user_ids))
+    keys = {user_brief_key(uid): uid for uid in user_ids}
+    briefs = {keys[k]: card for k, card in cache.get_many(keys).items()}
+    missing = [uid for uid in user_ids if uid not in briefs]
+    if missing:
+        loaded = _load_user_briefs(missing)
+        cache.set_many({user_brief_key(uid): card for uid, card in loaded.items()}, DEFAULT_TIMEOUT)
+        briefs.update(loaded)
+    return briefs
@@ -3,6 +3,10 @@ from django.contrib.auth import authenticate, password_validation
 from datetime import date
 from .models import User
 from apps.profiles.models import Profile
+from core.images import RenditionSerializerMixin
+from rest_framework_simplejwt import serializers as jwt_serializers
+from rest_framework_simplejwt.exceptions import InvalidToken
+from .tokens import claim, is_revoked
 
 #controlling the functions of the registeruser
 class RegisterSerializer(serializers.ModelSerializer):
@@ -48,12 +52,13 @@ class LoginSerializer(serializers.Serializer):
         return data
 
 #creating the function of the profile viewing
-class ProfileSerializer(serializers.ModelSerializer):
+class ProfileSerializer(RenditionSerializerMixin, serializers.ModelSerializer):
     age = serializers.ReadOnlyField()
 
     class Meta:
         model = Profile
         fields = ("bio", "dob", "gender", "avatar", "age")
+    rendition_fields = {"avatar": ("avatar_meta", 320)}
 
     def validate_dob(self, value):
         if value is None:
@@ -74,3 +79,14 @@ class DeleteAccountSerializer(serializers.Serializer):
         if not authenticate(username=user.username, password=password):
             raise serializers.ValidationError("Password is incorrect.")
         return data
+
+#refreshing the access token (SIMPLE_JWT["TOKEN_REFRESH_SERIALIZER"])
+class TokenRefreshSerializer(jwt_serializers.TokenRefreshSerializer):
+    """With ROTATE_REFRESH_TOKENS every refresh token works once: the used one is denied."""
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        # claim() is one atomic add, so of two concurrent refreshes only one gets through
+        if is_revoked(refresh) or not claim(refresh):
+            raise InvalidToken("Token has been revoked.")
+        return super().validate(attrs)
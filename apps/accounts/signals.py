@@ -1,16 +1,46 @@
 # apps/accounts/signals.py
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
 from django.conf import settings
 from apps.profiles.models import Profile
 
+from core.cache import invalidate
+from core.images import renditions_ready
+from .cache import user_brief_key
+from .tokens import FLAG_CLAIMS, revoke_user_tokens
+
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
 def create_user_profile(sender, instance, created, **kwargs):
     if created:
         Profile.objects.create(user=instance)
 
+# drop cached user cards when the name or avatar may have changed
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
-def save_user_profile(sender, instance, **kwargs):
-    # ensure profile exists; if not, create it
-    Profile.objects.get_or_create(user=instance)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_user_brief(sender, instance, **kwargs):
+    invalidate(user_brief_key(instance.pk))
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_user_brief_on_profile(sender, instance, **kwargs):
+    invalidate(user_brief_key(instance.user_id))
+
+@receiver(renditions_ready, sender=Profile)
+def invalidate_user_brief_on_avatar(sender, pk, **kwargs):
+    # the worker writes avatar_meta with update(), which doesn't fire post_save
+    user_id = Profile.objects.filter(pk=pk).values_list("user_id", flat=True).first()
+    if user_id:
+        invalidate(user_brief_key(user_id))
 
+# tokens carry the flags, so a new password or changed flags revoke the ones issued so far
+@receiver(pre_save, sender=settings.AUTH_USER_MODEL)
+def revoke_tokens_on_change(sender, instance, update_fields=None, **kwargs):
+    if instance._state.adding:
+        return
+    fields = [f for f in ("password", *FLAG_CLAIMS) if update_fields is None or f in update_fields]
+    if not fields:
+        return
+    old = sender.objects.filter(pk=instance.pk).values(*fields).first()
+    if old and any(old[f] != getattr(instance, f) for f in fields):
+        transaction.on_commit(lambda: revoke_user_tokens(instance.pk))
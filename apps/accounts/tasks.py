@@ -0,0 +1,12 @@
+# apps/accounts/tasks.py
+from apps.tasks.queue import task
+from .models import User
+
+
+@task(max_attempts=3, backoff=60)
+def purge_user(user_id):
+    """Hard delete a deactivated account (cascades through posts, likes, comments, timelines ...)."""
+    # only accounts DeleteAccountView deactivated; a reactivated user is left alone
+    user = User.objects.filter(pk=user_id, is_active=False).first()
+    if user is not None:
+        user.delete()
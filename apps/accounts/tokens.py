@@ -0,0 +1,84 @@
+# apps/accounts/tokens.py
+# signed access / refresh tokens (SimpleJWT) that carry the user id and account flags,
+# so a request authenticates without reading the DB; revocation is a denylist of
+# self-expiring keys in the non-evicting "revocations" cache: one per revoked token,
+# plus a per-user "issued before" cutoff
+import time
+
+from django.core.cache import caches
+from django.db import router
+from django.utils.connection import ConnectionProxy
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .models import User
+
+# copied into every token; request.user is rebuilt from them (authentication.py)
+FLAG_CLAIMS = ("username", "is_staff", "is_superuser", "is_active", "is_email_verified")
+
+# login time in integer milliseconds, kept through refresh / rotation; `iat` is whole
+# seconds, too coarse to order a token against a revocation in the same second
+AUTH_TIME_CLAIM = "auth_ms"
+
+revocations = ConnectionProxy(caches, "revocations")
+
+
+def _now_ms():
+    return time.time_ns() // 1_000_000
+
+
+def deny_key(jti):
+    return f"jwt:deny:{jti}"
+
+
+def cutoff_key(user_id):
+    return f"jwt:cutoff:{user_id}"
+
+
+def refresh_token_for(user):
+    refresh = RefreshToken.for_user(user)
+    for claim in FLAG_CLAIMS:
+        refresh[claim] = getattr(user, claim)
+    refresh[AUTH_TIME_CLAIM] = _now_ms()
+    # access tokens derived from it (now or on refresh) copy these claims
+    return refresh
+
+
+def tokens_for(user):
+    refresh = refresh_token_for(user)
+    return {"access": str(refresh.access_token), "refresh": str(refresh)}
+
+
+def user_from_claims(token):
+    """A User with the id and flags from the token; every other field is deferred."""
+    claims = {"id": User._meta.pk.to_python(token[api_settings.USER_ID_CLAIM])}
+    claims.update((claim, token[claim]) for claim in FLAG_CLAIMS if claim in token)
+    fields = [f.attname for f in User._meta.concrete_fields if f.attname in claims]
+    return User.from_db(router.db_for_read(User), fields, [claims[f] for f in fields])
+
+
+def _ttl(token):
+    # until the token would have expired anyway
+    return max(int(token["exp"] - time.time()), 1)
+
+
+def revoke(token):
+    """Deny one token."""
+    revocations.set(deny_key(token[api_settings.JTI_CLAIM]), 1, _ttl(token))
+
+
+def claim(token):
+    """Deny a single-use token; True only for the one caller that denied it first."""
+    return revocations.add(deny_key(token[api_settings.JTI_CLAIM]), 1, _ttl(token))
+
+
+def revoke_user_tokens(user_id):
+    """Deny every token issued to the user so far (password, flags or account changed)."""
+    revocations.set(cutoff_key(user_id), _now_ms(), int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds()))
+
+
+def is_revoked(token):
+    deny, cutoff = deny_key(token.get(api_settings.JTI_CLAIM)), cutoff_key(token.get(api_settings.USER_ID_CLAIM))
+    hits = revocations.get_many([deny, cutoff])
+    # both sides in integer ms: issued strictly before the cutoff is revoked
+    return deny in hits or token.get(AUTH_TIME_CLAIM, 0) < hits.get(cutoff, 0)
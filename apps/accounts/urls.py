@@ -1,7 +1,8 @@
 #creating the api for the user reg, login, logout 
 
 from django.urls import path
-from .views import RegisterView, LoginView, LogoutView, MyProfileView, DeleteAccountView
+from rest_framework_simplejwt.views import TokenRefreshView
+from .views import RegisterView, LoginView, LogoutView, MyProfileView, DeleteAccountView, TokenObtainView
 
 app_name = "accounts"
 
@@ -9,6 +10,8 @@ urlpatterns = [
     path("register/", RegisterView.as_view(), name="register"),
     path("login/", LoginView.as_view(), name="login"),
     path("logout/", LogoutView.as_view(), name="logout"),
+    path("token/", TokenObtainView.as_view(), name="token-obtain"),
+    path("token/refresh/", TokenRefreshView.as_view(), name="token-refresh"),
     path("profile/me/", MyProfileView.as_view(), name="my-profile"),
     path("delete/", DeleteAccountView.as_view(), name="delete-account"),
 ]
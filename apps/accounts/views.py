@@ -9,6 +9,11 @@ from django.conf import settings
 from rest_framework.permissions import IsAuthenticated
 
 from .serializers import RegisterSerializer, LoginSerializer, ProfileSerializer, DeleteAccountSerializer
+from .tasks import purge_user
+from .tokens import revoke, tokens_for
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.tokens import RefreshToken, Token
 
 #things imported for the profile watching
 from rest_framework import generics, permissions
@@ -54,6 +59,22 @@ class LoginView(APIView):
 
 
 
+#view for the token login (native clients): no session, a bearer access token + a refresh token
+class TokenObtainView(APIView):
+    permission_classes = [permissions.AllowAny]
+    authentication_classes = []
+
+    def post(self, request):
+        serializer = LoginSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        user = serializer.validated_data["user"]
+
+        return Response({
+            **tokens_for(user),
+            "user": {"id": user.id, "username": user.username, "email": user.email},
+        }, status=status.HTTP_200_OK)
+
+
 #view for the logout
 class LogoutView(APIView):
     permission_classes = [permissions.IsAuthenticated]
@@ -65,8 +86,19 @@ class LogoutView(APIView):
         - flush the session (removes session data and invalidates cookie)
         - return response with strict no-cache headers
         - delete session cookie explicitly
+        - revoke the bearer access token and the posted refresh token (token clients)
         Note: the client should also clear localStorage/sessionStorage and any client-side caches.
         """
+        # token clients: deny the access token of this request and the refresh token, if sent
+        if isinstance(request.auth, Token):
+            revoke(request.auth)
+        try:
+            refresh = RefreshToken(request.data.get("refresh") or "")
+            if refresh.get(jwt_settings.USER_ID_CLAIM) == str(request.user.pk):
+                revoke(refresh)
+        except TokenError:
+            pass
+
         # server-side session/session key invalidation
         try:
             request.session.flush()   # deletes the session data and the session cookie
@@ -96,8 +128,9 @@ class MyProfileView(generics.RetrieveUpdateAPIView):
     serializer_class = ProfileSerializer
 
     def get_object(self):
-        # ensures profile exists via signal
-        return self.request.user.profile
+        # created with the user (signals.py); get_or_create covers accounts from before that
+        profile, _ = Profile.objects.get_or_create(user=self.request.user)
+        return profile
     
 
 #view for the deleting the acc
@@ -117,10 +150,13 @@ class DeleteAccountView(APIView):
             pass
         auth_logout(request)
 
-        # hard delete user (cascades to profile)
-        user.delete()
+        # deactivate now (can't log in, sessions are gone) and leave the cascade delete
+        # of everything the user owns to the task worker (in-process when TASKS_EAGER)
+        user.is_active = False
+        user.save(update_fields=["is_active"])
+        purge_user.enqueue([user.pk], key=f"purge_user:{user.pk}")
 
-        resp = Response({"detail": "Account deleted permanently."}, status=status.HTTP_200_OK)
+        resp = Response({"detail": "Account deactivated; deletion scheduled."}, status=status.HTTP_202_ACCEPTED)
         # instruct browsers not to cache and remove cookies
         resp["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0, private"
         resp["Pragma"] = "no-cache"
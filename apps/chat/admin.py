@@ -0,0 +1,19 @@
+from django.contrib import admin
+from .models import Conversation, ConversationMember, Message
+
+@admin.register(Conversation)
+class ConversationAdmin(admin.ModelAdmin):
+    list_display = ("id", "kind", "title", "created_by", "created_at", "updated_at")
+    list_filter = ("kind",)
+    search_fields = ("title", "created_by__username")
+
+@admin.register(ConversationMember)
+class ConversationMemberAdmin(admin.ModelAdmin):
+    list_display = ("id", "conversation", "user", "unread_count", "joined_at")
+    search_fields = ("user__username",)
+
+@admin.register(Message)
+class MessageAdmin(admin.ModelAdmin):
+    list_display = ("id", "conversation", "sender", "created_at")
+    search_fields = ("sender__username", "text")
+    readonly_fields = ("created_at",)
@@ -0,0 +1,48 @@
+# apps/chat/consumers.py
+from channels.db import database_sync_to_async
+
+from core.consumers import UserStreamConsumer
+from . import services
+from .models import Message
+
+
+class ChatConsumer(UserStreamConsumer):
+    """
+    One socket per browser tab, subscribed to the user's chat stream.
+
+    Client -> server frames:
+      {"action": "send", "conversation": <id>, "text": "..."}
+      {"action": "read", "conversation": <id>, "message_id": <id|null>}
+    Server -> client frames are the published payloads ({"type": "chat.message", ...}).
+    """
+    stream = services.STREAM
+
+    async def receive_json(self, content, **kwargs):
+        action = content.get("action")
+        try:
+            conversation_id = int(content.get("conversation"))
+        except (TypeError, ValueError):
+            await self.send_json({"type": "error", "detail": "conversation is required."})
+            return
+
+        if not await database_sync_to_async(services.is_member)(conversation_id, self.user_id):
+            await self.send_json({"type": "error", "detail": "Not a member of this conversation."})
+            return
+
+        if action == "send":
+            text = (content.get("text") or "").strip()
+            if not text:
+                await self.send_json({"type": "error", "detail": "text is required."})
+                return
+            await database_sync_to_async(services.send_message)(conversation_id, self.user_id, text[:5000])
+        elif action == "read":
+            message_id = content.get("message_id")
+            if message_id is not None and not isinstance(message_id, int):
+                await self.send_json({"type": "error", "detail": "message_id must be an integer."})
+                return
+            try:
+                await database_sync_to_async(services.mark_read)(conversation_id, self.user_id, message_id)
+            except Message.DoesNotExist:
+                await self.send_json({"type": "error", "detail": "message_id is not in this conversation."})
+        else:
+            await self.send_json({"type": "error", "detail": "Unknown action."})
@@ -0,0 +1,63 @@
+# apps/chat/models.py
+from django.db import models
+from django.conf import settings
+
+User = settings.AUTH_USER_MODEL
+
+
+class Conversation(models.Model):
+    DIRECT = "direct"
+    GROUP = "group"
+    KIND_CHOICES = [(DIRECT, "Direct"), (GROUP, "Group")]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES, default=DIRECT)
+    title = models.CharField(max_length=150, blank=True)
+    created_by = models.ForeignKey(User, related_name="created_conversations", on_delete=models.CASCADE)
+    # "<low user id>:<high user id>" for direct chats so each pair has exactly one conversation
+    direct_key = models.CharField(max_length=50, unique=True, null=True, blank=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # bumped on every message so conversation lists sort by last activity
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-updated_at"]
+
+    @staticmethod
+    def direct_key_for(user_a_id, user_b_id):
+        low, high = sorted((user_a_id, user_b_id))
+        return f"{low}:{high}"
+
+    def __str__(self):
+        return self.title or f"Conversation {self.pk}"
+
+
+class ConversationMember(models.Model):
+    conversation = models.ForeignKey(Conversation, related_name="members", on_delete=models.CASCADE)
+    user = models.ForeignKey(User, related_name="conversation_memberships", on_delete=models.CASCADE)
+    joined_at = models.DateTimeField(auto_now_add=True)
+    # denormalized unread counter (F() increments on send, reset on read)
+    unread_count = models.PositiveIntegerField(default=0)
+    last_read_message_id = models.BigIntegerField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ("conversation", "user")
+
+    def __str__(self):
+        return f"{self.user_id} in conversation {self.conversation_id}"
+
+
+class Message(models.Model):
+    conversation = models.ForeignKey(Conversation, related_name="messages", on_delete=models.CASCADE)
+    sender = models.ForeignKey(User, related_name="chat_messages", on_delete=models.CASCADE)
+    text = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            # history: one conversation, newest first (keyset on created_at, id)
+            models.Index(fields=["conversation", "-created_at", "-id"], name="message_history_idx"),
+        ]
+
+    def __str__(self):
+        return f"Message {self.pk} in {self.conversation_id} by {self.sender_id}"
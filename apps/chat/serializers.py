@@ -0,0 +1,48 @@
+# apps/chat/serializers.py
+from rest_framework import serializers
+
+from apps.accounts.cache import get_user_brief
+from .models import Conversation, Message
+
+
+class MessageSerializer(serializers.ModelSerializer):
+    sender = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Message
+        fields = ("id", "conversation", "sender", "text", "created_at")
+        read_only_fields = ("id", "conversation", "sender", "created_at")
+
+    def get_sender(self, obj):
+        # cached user card; avoids joining the user row for every message
+        return get_user_brief(obj.sender_id)
+
+
+class ConversationSerializer(serializers.ModelSerializer):
+    members = serializers.SerializerMethodField()
+    unread_count = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Conversation
+        fields = ("id", "kind", "title", "created_by", "members", "unread_count", "created_at", "updated_at")
+        read_only_fields = ("id", "kind", "created_by", "created_at", "updated_at")
+
+    def get_members(self, obj):
+        return [get_user_brief(m.user_id) for m in obj.members.all()]
+
+    def get_unread_count(self, obj):
+        # annotated by the list view; 0 for freshly created conversations
+        return getattr(obj, "my_unread_count", 0) or 0
+
+
+class GroupCreateSerializer(serializers.Serializer):
+    title = serializers.CharField(max_length=150)
+    members = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=200)
+
+
+class DirectCreateSerializer(serializers.Serializer):
+    user = serializers.IntegerField()
+
+
+class MessageCreateSerializer(serializers.Serializer):
+    text = serializers.CharField(max_length=5000)
@@ -0,0 +1,100 @@
+# apps/chat/services.py
+# write paths shared by the REST views and the websocket consumer
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import F, Max, Sum
+from django.utils import timezone
+
+from core.broker import publish
+from .models import Conversation, ConversationMember, Message
+from .serializers import MessageSerializer
+
+User = get_user_model()
+
+STREAM = "chat"
+
+
+def member_ids(conversation_id):
+    return list(ConversationMember.objects.filter(conversation_id=conversation_id).values_list("user_id", flat=True))
+
+
+def is_member(conversation_id, user_id):
+    return ConversationMember.objects.filter(conversation_id=conversation_id, user_id=user_id).exists()
+
+
+def get_or_create_direct(user, other):
+    key = Conversation.direct_key_for(user.pk, other.pk)
+    with transaction.atomic():
+        conversation, created = Conversation.objects.get_or_create(
+            direct_key=key, defaults={"kind": Conversation.DIRECT, "created_by": user}
+        )
+        if created:
+            ConversationMember.objects.bulk_create(
+                [ConversationMember(conversation=conversation, user_id=uid) for uid in {user.pk, other.pk}]
+            )
+    return conversation, created
+
+
+def create_group(user, title, user_ids):
+    ids = set(User.objects.filter(pk__in=user_ids).values_list("pk", flat=True)) | {user.pk}
+    with transaction.atomic():
+        conversation = Conversation.objects.create(kind=Conversation.GROUP, title=title, created_by=user)
+        ConversationMember.objects.bulk_create(
+            [ConversationMember(conversation=conversation, user_id=uid) for uid in ids]
+        )
+    return conversation
+
+
+def send_message(conversation_id, sender_id, text):
+    """
+    Store a message, bump the other members' unread counters and push it to every
+    member's sockets once the transaction commits.
+    """
+    with transaction.atomic():
+        message = Message.objects.create(conversation_id=conversation_id, sender_id=sender_id, text=text)
+        Conversation.objects.filter(pk=conversation_id).update(updated_at=message.created_at)
+        (
+            ConversationMember.objects.filter(conversation_id=conversation_id)
+            .exclude(user_id=sender_id)
+            .update(unread_count=F("unread_count") + 1)
+        )
+        recipients = member_ids(conversation_id)
+        payload = {"type": "chat.message", "message": MessageSerializer(message).data}
+        transaction.on_commit(lambda: publish(STREAM, recipients, payload))
+    return message
+
+
+def mark_read(conversation_id, user_id, message_id=None):
+    """
+    Move the member's read pointer up to `message_id` (default: the latest message) and
+    recount unread as the other members' messages after it. The pointer never moves
+    back; a `message_id` from another conversation raises Message.DoesNotExist.
+    """
+    messages = Message.objects.filter(conversation_id=conversation_id)
+    if message_id is None:
+        message_id = messages.aggregate(m=Max("id"))["m"]
+    elif not messages.filter(pk=message_id).exists():
+        raise Message.DoesNotExist(f"Message {message_id} is not in conversation {conversation_id}.")
+    with transaction.atomic():
+        # the row lock orders us against send_message's unread_count + 1
+        member = ConversationMember.objects.select_for_update().get(conversation_id=conversation_id, user_id=user_id)
+        if member.last_read_message_id is not None and (message_id is None or message_id < member.last_read_message_id):
+            message_id = member.last_read_message_id
+        unread = messages.filter(pk__gt=message_id or 0).exclude(sender_id=user_id).count()
+        ConversationMember.objects.filter(pk=member.pk).update(unread_count=unread, last_read_message_id=message_id)
+        payload = {
+            "type": "chat.read",
+            "conversation": conversation_id,
+            "user": user_id,
+            "message_id": message_id,
+            "at": timezone.now().isoformat(),
+        }
+        # other members see the read receipt, the reader's other devices clear their badge
+        recipients = member_ids(conversation_id)
+        transaction.on_commit(lambda: publish(STREAM, recipients, payload))
+    return message_id
+
+
+def unread_total(user_id):
+    total = ConversationMember.objects.filter(user_id=user_id).aggregate(n=Sum("unread_count"))["n"]
+    return total or 0
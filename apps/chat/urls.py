@@ -0,0 +1,16 @@
+# apps/chat/urls.py
+from django.urls import path
+from .views import (
+    ConversationListCreateView, DirectConversationView,
+    MessageListCreateView, MarkReadView, UnreadCountView,
+)
+
+app_name = "chat"
+
+urlpatterns = [
+    path("conversations/", ConversationListCreateView.as_view(), name="conversation-list"),
+    path("conversations/direct/", DirectConversationView.as_view(), name="conversation-direct"),
+    path("conversations/<int:pk>/messages/", MessageListCreateView.as_view(), name="conversation-messages"),
+    path("conversations/<int:pk>/read/", MarkReadView.as_view(), name="conversation-read"),
+    path("unread/", UnreadCountView.as_view(), name="unread"),
+]
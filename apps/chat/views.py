@@ -0,0 +1,110 @@
+# apps/chat/views.py
+from django.contrib.auth import get_user_model
+from django.db.models import F, Prefetch
+from django.shortcuts import get_object_or_404
+from rest_framework import generics, permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.pagination import KeysetPagination
+from . import services
+from .models import Conversation, ConversationMember, Message
+from .serializers import (
+    ConversationSerializer, DirectCreateSerializer, GroupCreateSerializer,
+    MessageCreateSerializer, MessageSerializer,
+)
+
+User = get_user_model()
+
+
+def _conversation_for(user, pk):
+    return get_object_or_404(Conversation, pk=pk, members__user=user)
+
+
+class ConversationListCreateView(generics.ListCreateAPIView):
+    """
+    GET  -> the user's conversations, most recently active first, with their unread counts
+    POST -> create a group chat {"title": "...", "members": [user ids]}
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = ConversationSerializer
+    pagination_class = KeysetPagination
+    cursor_ordering = ("-updated_at", "-id")
+
+    def get_queryset(self):
+        # the members__user filter and the annotation share one join, so
+        # my_unread_count is the requesting user's own counter
+        return (
+            Conversation.objects.filter(members__user=self.request.user)
+            .annotate(my_unread_count=F("members__unread_count"))
+            .prefetch_related(Prefetch("members", queryset=ConversationMember.objects.only("conversation_id", "user_id")))
+        )
+
+    def create(self, request, *args, **kwargs):
+        data = GroupCreateSerializer(data=request.data)
+        data.is_valid(raise_exception=True)
+        conversation = services.create_group(request.user, data.validated_data["title"], data.validated_data["members"])
+        return Response(ConversationSerializer(conversation).data, status=status.HTTP_201_CREATED)
+
+
+class DirectConversationView(APIView):
+    """POST {"user": <id>} -> the one direct conversation with that user (created on first use)."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        data = DirectCreateSerializer(data=request.data)
+        data.is_valid(raise_exception=True)
+        if data.validated_data["user"] == request.user.pk:
+            return Response({"detail": "Cannot start a conversation with yourself."}, status=status.HTTP_400_BAD_REQUEST)
+        other = get_object_or_404(User, pk=data.validated_data["user"])
+        conversation, created = services.get_or_create_direct(request.user, other)
+        return Response(
+            ConversationSerializer(conversation).data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+
+class MessageListCreateView(generics.ListCreateAPIView):
+    """
+    GET  -> message history, newest first (keyset pagination; follow `next` to scroll back)
+    POST -> send {"text": "..."}; members' sockets receive it through the broker
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = MessageSerializer
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        conversation = _conversation_for(self.request.user, self.kwargs["pk"])
+        return Message.objects.filter(conversation=conversation)
+
+    def create(self, request, *args, **kwargs):
+        conversation = _conversation_for(request.user, kwargs["pk"])
+        data = MessageCreateSerializer(data=request.data)
+        data.is_valid(raise_exception=True)
+        message = services.send_message(conversation.pk, request.user.pk, data.validated_data["text"])
+        return Response(MessageSerializer(message).data, status=status.HTTP_201_CREATED)
+
+
+class MarkReadView(APIView):
+    """POST {"message_id": <id>} (optional) -> mark the conversation read up to that message."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, pk):
+        conversation = _conversation_for(request.user, pk)
+        message_id = request.data.get("message_id")
+        try:
+            message_id = int(message_id) if message_id is not None else None
+        except (TypeError, ValueError):
+            return Response({"detail": "message_id must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            message_id = services.mark_read(conversation.pk, request.user.pk, message_id)
+        except Message.DoesNotExist:
+            return Response({"detail": "message_id is not in this conversation."}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"conversation": conversation.pk, "last_read_message_id": message_id})
+
+
+class UnreadCountView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        return Response({"unread": services.unread_total(request.user.pk)})
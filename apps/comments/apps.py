@@ -5,6 +5,5 @@ class CommentsConfig(AppConfig):
     name = "apps.comments"
 
     def ready(self):
-        # import signals here if you have them, e.g.:
-        # from . import signals  # noqa: F401
-        pass
+        # response-cache invalidation for anonymous reads
+        from . import signals  # noqa: F401
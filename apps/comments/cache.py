@@ -0,0 +1,7 @@
+# apps/comments/cache.py
+# anonymous response-cache tag of a post's comment thread (bumped in signals.py)
+from core.response_cache import tag
+
+
+def comments_tag(post_id):
+    return tag("post", post_id, "comments")
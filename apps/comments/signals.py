@@ -0,0 +1,13 @@
+# apps/comments/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from core.response_cache import bump_tags
+from .cache import comments_tag
+from .models import Comment
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def bump_comment_list(sender, instance, **kwargs):
+    bump_tags(comments_tag(instance.post_id))
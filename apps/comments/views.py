@@ -4,14 +4,27 @@ from .serializers import CommentSerializer
 from .permissions import IsAuthorOrReadOnly
 from apps.feed.models import Post
 from django.shortcuts import get_object_or_404
+from core.pagination import KeysetPagination
+from core.response_cache import PublicResponseCacheMixin
+from .cache import comments_tag
 
-class CommentListCreateView(generics.ListCreateAPIView):
+class CommentListCreateView(PublicResponseCacheMixin, generics.ListCreateAPIView):
     """
     GET: list comments for a post (query: /?post=<post_id> or use URL pattern)
     POST: create comment for a post (post field required)
     """
     serializer_class = CommentSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = KeysetPagination
+    # comment threads read oldest first
+    cursor_ordering = ("created_at", "id")
+
+    def public_cache_tags(self, request, *args, **kwargs):
+        # only a single public post's thread is shared; the unfiltered list never is
+        post_id = kwargs.get("post_id") or request.query_params.get("post")
+        if post_id and str(post_id).isdigit() and Post.objects.filter(pk=post_id, visibility=Post.PUBLIC).exists():
+            return [comments_tag(post_id)]
+        return None
 
     def get_queryset(self):
         post_id = self.kwargs.get("post_id") or self.request.query_params.get("post")
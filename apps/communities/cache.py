@@ -0,0 +1,56 @@
+# apps/communities/cache.py
+# cached community / membership lookups (invalidated in signals.py)
+from django.http import Http404
+
+from core.cache import read_through
+from core.response_cache import bump_tags, tag
+from .models import Community, CommunityPost, Membership
+
+
+def community_key(slug):
+    return f"community:slug:{slug}"
+
+
+def membership_key(community_id, user_id):
+    return f"community:{community_id}:member:{user_id}"
+
+
+def get_community(slug):
+    return read_through(community_key(slug), lambda: Community.objects.filter(slug=slug).first())
+
+
+def get_community_or_404(slug):
+    community = get_community(slug)
+    if community is None:
+        raise Http404("No Community matches the given query.")
+    return community
+
+
+def get_membership(user_id, community_id):
+    """(role, is_approved) for the user in the community, or None if not a member."""
+    return read_through(
+        membership_key(community_id, user_id),
+        lambda: Membership.objects.filter(community_id=community_id, user_id=user_id)
+        .values_list("role", "is_approved")
+        .first(),
+    )
+
+
+# tags of the anonymous response cache (core/response_cache.py), bumped in signals.py
+def communities_tag():
+    return tag("communities")
+
+
+def community_tag(community_id):
+    return tag("community", community_id)
+
+
+def community_posts_tag(community_id):
+    return tag("community", community_id, "posts")
+
+
+def touch_community_posts(*post_ids):
+    """Bump the post-list tags of the communities these posts belong to."""
+    community_ids = set(CommunityPost.objects.filter(pk__in=post_ids).values_list("community_id", flat=True))
+    if community_ids:
+        bump_tags(*[community_posts_tag(cid) for cid in community_ids])
@@ -0,0 +1,46 @@
+# apps/communities/counters.py
+# helpers for the denormalized CommunityPost.likes_count / comments_count columns
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from .models import CommunityPost, PostLike, PostComment
+
+
+def bump(post_id, field, delta):
+    """Atomically add `delta` to a counter column (never below zero)."""
+    qs = CommunityPost.objects.filter(pk=post_id)
+    if delta < 0:
+        qs = qs.filter(**{f"{field}__gte": -delta})
+    qs.update(**{field: F(field) + delta})
+
+
+def _count_subquery(model, extra=None):
+    qs = model.objects.filter(post=OuterRef("pk"), **(extra or {}))
+    qs = qs.order_by().values("post").annotate(c=Count("pk")).values("c")
+    return Coalesce(Subquery(qs, output_field=IntegerField()), 0)
+
+
+def with_real_counts(queryset=None):
+    """Annotate posts with the counts recomputed from PostLike / PostComment."""
+    queryset = CommunityPost.objects.all() if queryset is None else queryset
+    return queryset.annotate(
+        real_likes=_count_subquery(PostLike),
+        real_comments=_count_subquery(PostComment, {"is_removed": False}),
+    )
+
+
+def drifted(queryset=None):
+    return with_real_counts(queryset).filter(
+        ~Q(likes_count=F("real_likes")) | ~Q(comments_count=F("real_comments"))
+    )
+
+
+def reconcile(queryset=None):
+    """Rewrite drifted counters in one UPDATE; returns the number of rows fixed."""
+    ids = list(drifted(queryset).values_list("pk", flat=True))
+    if not ids:
+        return 0
+    return CommunityPost.objects.filter(pk__in=ids).update(
+        likes_count=_count_subquery(PostLike),
+        comments_count=_count_subquery(PostComment, {"is_removed": False}),
+    )
@@ -0,0 +1,38 @@
+# apps/communities/feed.py
+# merged "all my communities" feed: membership ids and rendered page ids are cached
+# per user; a post in any of those communities bumps that community's version stamp,
+# which changes the page key instead of fanning out deletes to every member
+import hashlib
+
+from core.cache import DEFAULT_TIMEOUT, bump_version, get_versions, read_through
+from .models import Membership
+
+PAGE_TIMEOUT = DEFAULT_TIMEOUT
+
+
+def member_of_key(user_id):
+    return f"community:member_of:{user_id}"
+
+
+def posts_version_key(community_id):
+    return f"community:{community_id}:posts_version"
+
+
+def member_community_ids(user_id):
+    """Ids of the communities the user is an approved member of (invalidated in signals.py)."""
+    return read_through(
+        member_of_key(user_id),
+        lambda: sorted(Membership.objects.filter(user_id=user_id, is_approved=True).values_list("community_id", flat=True)),
+    )
+
+
+def bump_posts_version(community_id):
+    bump_version(posts_version_key(community_id))
+
+
+def page_key(user_id, community_ids, cursor, page_size):
+    """Key of one feed page; changes whenever any of the communities gets a post."""
+    versions = get_versions([posts_version_key(cid) for cid in community_ids])
+    stamp = ",".join(f"{cid}:{versions[posts_version_key(cid)]}" for cid in community_ids)
+    digest = hashlib.blake2b(f"{stamp}|{cursor}|{page_size}".encode(), digest_size=12).hexdigest()
+    return f"community_feed:{user_id}:{digest}"
@@ -0,0 +1,30 @@
+# apps/communities/management/commands/reconcile_post_counters.py
+from django.core.management.base import BaseCommand
+
+from apps.communities.counters import drifted, reconcile
+from apps.communities.models import CommunityPost
+
+
+class Command(BaseCommand):
+    help = "Recompute CommunityPost.likes_count / comments_count where they drifted from the real rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--community", help="only posts in this community slug")
+        parser.add_argument("--dry-run", action="store_true", help="report drifted posts without fixing them")
+
+    def handle(self, *args, **options):
+        qs = CommunityPost.objects.all()
+        if options["community"]:
+            qs = qs.filter(community__slug=options["community"])
+
+        if options["dry_run"]:
+            rows = drifted(qs).values_list("pk", "likes_count", "real_likes", "comments_count", "real_comments")
+            n = 0
+            for pk, likes, real_likes, comments, real_comments in rows.iterator():
+                self.stdout.write(f"post {pk}: likes {likes} -> {real_likes}, comments {comments} -> {real_comments}")
+                n += 1
+            self.stdout.write(f"{n} post(s) drifted.")
+            return
+
+        fixed = reconcile(qs)
+        self.stdout.write(self.style.SUCCESS(f"Reconciled {fixed} post(s)."))
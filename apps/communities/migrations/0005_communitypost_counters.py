@@ -0,0 +1,41 @@
+# Generated by Django 5.2.8 on 2026-10-17 12:47
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    CommunityPost = apps.get_model("communities", "CommunityPost")
+    PostLike = apps.get_model("communities", "PostLike")
+    PostComment = apps.get_model("communities", "PostComment")
+
+    def count_of(model, **extra):
+        qs = model.objects.filter(post=OuterRef("pk"), **extra).order_by().values("post").annotate(c=Count("pk")).values("c")
+        return Coalesce(Subquery(qs, output_field=IntegerField()), 0)
+
+    CommunityPost.objects.update(
+        likes_count=count_of(PostLike),
+        comments_count=count_of(PostComment, is_removed=False),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communities', '0004_postcomment_postreport_postlike'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='communitypost',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='communitypost',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.8 on 2026-10-17 12:53
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_report_community(apps, schema_editor):
+    PostReport = apps.get_model("communities", "PostReport")
+    CommunityPost = apps.get_model("communities", "CommunityPost")
+    PostReport.objects.filter(community__isnull=True).update(
+        community=Subquery(CommunityPost.objects.filter(pk=OuterRef("post_id")).values("community_id")[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communities', '0005_communitypost_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='postreport',
+            name='community',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='reports', to='communities.community'),
+        ),
+        migrations.RunPython(backfill_report_community, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='communitypost',
+            index=models.Index(condition=models.Q(('is_removed', False)), fields=['community', '-created_at', '-id'], name='cpost_visible_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='joinrequest',
+            index=models.Index(fields=['community', '-created_at'], name='joinrequest_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='joinrequest',
+            index=models.Index(condition=models.Q(('processed', False)), fields=['community', '-created_at'], name='joinrequest_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='membership',
+            index=models.Index(fields=['community', 'user', 'is_approved'], name='membership_lookup_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='postcomment',
+            index=models.Index(condition=models.Q(('is_removed', False)), fields=['post', 'created_at', 'id'], name='pcomment_visible_thread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='postreport',
+            index=models.Index(fields=['community', '-created_at'], name='report_community_recent_idx'),
+        ),
+    ]
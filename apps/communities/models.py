@@ -4,6 +4,9 @@ from django.utils.text import slugify
 
 User = settings.AUTH_USER_MODEL
 
+# slugs that would shadow fixed routes under /api/communities/
+RESERVED_SLUGS = {"feed"}
+
 
 class Community(models.Model):
     PUBLIC = "public"
@@ -21,6 +24,8 @@ class Community(models.Model):
     category = models.CharField(max_length=100, blank=True, null=True)
     # community picture (one image)
     picture = models.ImageField(upload_to="communities/pictures/", null=True, blank=True)
+    # renditions + dimensions written by the image worker (core/images.py)
+    picture_meta = models.JSONField(default=dict, blank=True, editable=False)
     # short description and a longer about field
     description = models.CharField(max_length=400, blank=True)
     about = models.TextField(blank=True)
@@ -38,7 +43,7 @@ class Community(models.Model):
             base = slugify(self.name)[:150]
             slug = base
             i = 1
-            while Community.objects.filter(slug=slug).exists():
+            while slug in RESERVED_SLUGS or Community.objects.filter(slug=slug).exists():
                 slug = f"{base}-{i}"
                 i += 1
             self.slug = slug
@@ -62,6 +67,10 @@ class Membership(models.Model):
 
     class Meta:
         unique_together = ("community", "user")
+        indexes = [
+            # is_member / role lookups answered from the index alone
+            models.Index(fields=["community", "user", "is_approved"], name="membership_lookup_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user} in {self.community} as {self.role}"
@@ -77,6 +86,11 @@ class JoinRequest(models.Model):
 
     class Meta:
         unique_together = ("community", "user")
+        indexes = [
+            # admin request list, newest first; the pending queue (processed=False) gets its own partial index
+            models.Index(fields=["community", "-created_at"], name="joinrequest_recent_idx"),
+            models.Index(fields=["community", "-created_at"], condition=models.Q(processed=False), name="joinrequest_pending_idx"),
+        ]
 
 
 class CommunityPost(models.Model):
@@ -84,13 +98,26 @@ class CommunityPost(models.Model):
     author = models.ForeignKey(User, related_name="community_posts", on_delete=models.CASCADE)
     text = models.TextField(blank=True)
     image = models.ImageField(upload_to="community/posts/", null=True, blank=True)
+    image_meta = models.JSONField(default=dict, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_removed = models.BooleanField(default=False)
     removed_by = models.ForeignKey(User, null=True, blank=True, related_name="+", on_delete=models.SET_NULL)
+    # denormalized counters, kept in sync with F() updates in the like/comment views
+    # (run `manage.py reconcile_post_counters` to repair drift)
+    likes_count = models.PositiveIntegerField(default=0)
+    comments_count = models.PositiveIntegerField(default=0)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # community post list: visible posts, newest first (keyset on created_at, id)
+            models.Index(
+                fields=["community", "-created_at", "-id"],
+                condition=models.Q(is_removed=False),
+                name="cpost_visible_recent_idx",
+            ),
+        ]
 
 #for the post like coment in te community
 class PostLike(models.Model):
@@ -116,6 +143,14 @@ class PostComment(models.Model):
 
     class Meta:
         ordering = ("created_at",)
+        indexes = [
+            # comment thread: visible comments, oldest first (keyset on created_at, id)
+            models.Index(
+                fields=["post", "created_at", "id"],
+                condition=models.Q(is_removed=False),
+                name="pcomment_visible_thread_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Comment {self.pk} on {self.post_id} by {self.user_id}"
@@ -132,6 +167,8 @@ class PostReport(models.Model):
     )
 
     post = models.ForeignKey("CommunityPost", on_delete=models.CASCADE, related_name="reports")
+    # copied from post.community so the per-community report list is one index range
+    community = models.ForeignKey(Community, on_delete=models.CASCADE, related_name="reports", null=True, blank=True, editable=False)
     reporter = models.ForeignKey(User, on_delete=models.CASCADE, related_name="reports_made")
     reason = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -140,6 +177,14 @@ class PostReport(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=["community", "-created_at"], name="report_community_recent_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self.community_id is None and self.post_id is not None:
+            self.community_id = CommunityPost.objects.filter(pk=self.post_id).values_list("community_id", flat=True).first()
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"Report {self.pk} for post {self.post_id} ({self.status})"
\ No newline at end of file
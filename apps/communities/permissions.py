@@ -1,5 +1,64 @@
 from rest_framework import permissions
 from .models import Membership, Community
+from .cache import get_membership
+
+
+class MembershipResolver:
+    """
+    Answers "is this user a member / admin of that community" for one request.
+    Each community's membership row is looked up once (through the shared membership
+    cache, see cache.get_membership) and every later check is answered from memory.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self._memberships = {}
+
+    @property
+    def authenticated(self):
+        return bool(self.user and getattr(self.user, "is_authenticated", False))
+
+    def membership(self, community):
+        """(role, is_approved) for the user in `community`, or None."""
+        if not self.authenticated:
+            return None
+        if community.pk not in self._memberships:
+            self._memberships[community.pk] = get_membership(self.user.id, community.pk)
+        return self._memberships[community.pk]
+
+    def role(self, community):
+        """Role of an approved member, otherwise None."""
+        m = self.membership(community)
+        return m[0] if m and m[1] else None
+
+    def is_member(self, community):
+        return self.role(community) is not None
+
+    def is_admin(self, community):
+        """
+        A user is admin if:
+          - they are the community.creator (created_by), OR
+          - they are a superuser, OR
+          - they have an approved Membership with role == Membership.ADMIN.
+        """
+        if not self.authenticated:
+            return False
+        # fast checks: creator or site superuser
+        if getattr(community, "created_by_id", None) == self.user.id:
+            return True
+        if getattr(self.user, "is_superuser", False):
+            return True
+        return self.role(community) == Membership.ADMIN
+
+
+def resolver_for(request):
+    """The MembershipResolver memoized on this request (created on first use)."""
+    resolver = getattr(request, "_membership_resolver", None)
+    if resolver is None or resolver.user is not request.user:
+        resolver = MembershipResolver(request.user)
+        request._membership_resolver = resolver
+    return resolver
+
 
 class IsCommunityAdminOrReadOnly(permissions.BasePermission):
     """
@@ -12,38 +71,18 @@ class IsCommunityAdminOrReadOnly(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return True
         # allow creator
-        if getattr(obj, "created_by", None) == request.user:
+        if getattr(obj, "created_by_id", None) == request.user.id:
             return True
         # check membership role
-        try:
-            mem = Membership.objects.filter(community=obj, user=request.user, is_approved=True).first()
-            if mem and mem.role == Membership.ADMIN:
-                return True
-        except Exception:
-            pass
-        return False
+        return resolver_for(request).role(obj) == Membership.ADMIN
 
 def is_member(user, community):
-    return Membership.objects.filter(community=community, user=user, is_approved=True).exists()
+    return MembershipResolver(user).is_member(community)
 
 def is_admin(user, community):
     """
-    Return True if the given user is considered a community admin.
-    A user is admin if:
-      - they are the community.creator (created_by), OR
-      - they are a superuser, OR
-      - they have an approved Membership with role == Membership.ADMIN.
+    Return True if the given user is considered a community admin
+    (creator, superuser or approved ADMIN membership).
+    Views should prefer resolver_for(request).is_admin() to reuse the lookup.
     """
-    if not user or not getattr(user, "is_authenticated", False):
-        return False
-
-    # fast checks: creator or site superuser
-    if getattr(community, "created_by_id", None) == getattr(user, "id", None):
-        return True
-    if getattr(user, "is_superuser", False):
-        return True
-
-    # lastly, check membership role
-    m = Membership.objects.filter(community=community, user=user, is_approved=True).first()
-    return bool(m and m.role == Membership.ADMIN)
-
+    return MembershipResolver(user).is_admin(community)
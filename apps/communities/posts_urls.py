@@ -5,6 +5,8 @@ from . import views
 urlpatterns = [
     # under /api/posts/ the pattern becomes: /api/posts/<pk>/like/
     path("<int:pk>/like/", views.PostLikeToggleView.as_view(), name="post-like"),
+    # /api/posts/likes/bulk/  {"like": [...], "unlike": [...]}
+    path("likes/bulk/", views.BulkPostLikeView.as_view(), name="post-like-bulk"),
     # /api/posts/<pk>/comments/
     path("<int:pk>/comments/", views.PostCommentListCreateView.as_view(), name="post-comments"),
     # /api/posts/<pk>/report/
@@ -0,0 +1,45 @@
+# apps/communities/prefetch.py
+# page-level batch loading for CommunityPostSerializer (avoids per-post queries)
+from collections import defaultdict
+
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from .models import PostLike, PostComment
+
+RECENT_COMMENTS_LIMIT = 3
+
+
+def prefetch_post_viewer_state(posts, user, comments_limit=RECENT_COMMENTS_LIMIT):
+    """
+    Load everything the post serializer needs about a page of posts in two queries:
+      - liked_post_ids: ids of the posts on this page the viewer has liked
+      - recent_comments: {post_id: [newest non-removed comments]}, top-N per post via
+        ROW_NUMBER() OVER (PARTITION BY post_id ORDER BY created_at DESC)
+    The returned dict is meant to be merged into the serializer context.
+    """
+    post_ids = [p.pk for p in posts]
+    if not post_ids:
+        return {"liked_post_ids": set(), "recent_comments": {}}
+
+    recent = defaultdict(list)
+    for comment in recent_comments(post_ids, comments_limit).select_related("user", "user__profile"):
+        recent[comment.post_id].append(comment)
+
+    return {"liked_post_ids": liked_post_ids(post_ids, user), "recent_comments": dict(recent)}
+
+
+def liked_post_ids(post_ids, user):
+    if user is None or not user.is_authenticated:
+        return set()
+    return set(PostLike.objects.filter(user=user, post_id__in=post_ids).values_list("post_id", flat=True))
+
+
+def recent_comments(post_ids, limit=RECENT_COMMENTS_LIMIT):
+    """The newest `limit` non-removed comments of each post, grouped by post."""
+    return (
+        PostComment.objects.filter(post_id__in=post_ids, is_removed=False)
+        .annotate(rank=Window(RowNumber(), partition_by=F("post_id"), order_by=[F("created_at").desc(), F("id").desc()]))
+        .filter(rank__lte=limit)
+        .order_by("post_id", "rank")
+    )
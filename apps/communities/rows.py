@@ -0,0 +1,48 @@
+# apps/communities/rows.py
+# values() read plans for community post lists (core/rows.py); same JSON as
+# CommunityPostSerializer, recent comments included
+from collections import defaultdict
+
+from core.images import image_url
+from core.rows import Computed, Plan
+from .prefetch import liked_post_ids, recent_comments
+from .serializers import CommunityPostSerializer, PostCommentSerializer, user_card
+
+
+def _display_name(context, first, last, username):
+    full = f"{first or ''} {last or ''}".strip()
+    return full if full else username
+
+
+def _avatar(context, avatar, meta):
+    # SimpleUserForRequestsSerializer.get_avatar: the profile avatar, or nothing
+    if not avatar:
+        return None
+    try:
+        return image_url(avatar, meta, context.get("request"), 96)
+    except Exception:
+        return None
+
+
+COMMENT_ROWS = Plan(PostCommentSerializer, {
+    "user.display_name": Computed(_display_name, "first_name", "last_name", "username"),
+    "user.avatar": Computed(_avatar, "profile__avatar", "profile__avatar_meta"),
+})
+
+POST_ROWS = Plan(CommunityPostSerializer, {
+    "author_detail": Computed(lambda context, author_id: user_card(author_id, context.get("request")), "author"),
+    "liked_by_user": Computed(lambda context, pk: pk in context["liked_post_ids"], "id"),
+    "recent_comments": Computed(lambda context, pk: context["recent_comments"].get(pk, []), "id"),
+})
+
+
+def viewer_state(rows, user, context):
+    """prefetch_post_viewer_state for a page of records, comments already rendered."""
+    post_ids = [row.id for row in rows]
+    if not post_ids:
+        return {"liked_post_ids": set(), "recent_comments": {}}
+    comments = list(COMMENT_ROWS.queryset(recent_comments(post_ids)))
+    recent = defaultdict(list)
+    for comment, data in zip(comments, COMMENT_ROWS.data(comments, context)):
+        recent[comment.post].append(data)
+    return {"liked_post_ids": liked_post_ids(post_ids, user), "recent_comments": dict(recent)}
@@ -2,6 +2,9 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from .models import Community, Membership, JoinRequest, CommunityPost, PostComment, PostLike, PostReport
+from apps.accounts.cache import get_user_brief
+from core.bulk import BulkActionSerializer, id_list
+from core.images import RenditionSerializerMixin, image_url
 
 User = get_user_model()
 
@@ -33,9 +36,7 @@ class SimpleUserForRequestsSerializer(serializers.Serializer):
             avatar_field = getattr(profile, "avatar", None)
             if avatar_field:
                 try:
-                    if request:
-                        return request.build_absolute_uri(avatar_field.url)
-                    return avatar_field.url
+                    return image_url(avatar_field, profile.avatar_meta, request, 96)
                 except Exception:
                     return None
         # if you kept avatar directly on user model, try that too:
@@ -62,7 +63,7 @@ class MembershipSerializer(serializers.ModelSerializer):
         fields = ("id", "community", "user", "user_detail", "role", "joined_at", "is_approved")
 
 
-class CommunitySerializer(serializers.ModelSerializer):
+class CommunitySerializer(RenditionSerializerMixin, serializers.ModelSerializer):
     created_by = serializers.PrimaryKeyRelatedField(read_only=True)
     picture = serializers.ImageField(required=False, allow_null=True)
     category = serializers.CharField(required=False, allow_blank=True, allow_null=True)
@@ -87,6 +88,7 @@ class CommunitySerializer(serializers.ModelSerializer):
             "memberships",
         )
         read_only_fields = ("id", "slug", "created_at", "member_count", "created_by")
+    rendition_fields = {"picture": ("picture_meta", 640)}
 
     def create(self, validated_data):
         # preserve behavior: set created_by from request user
@@ -110,6 +112,18 @@ class JoinRequestSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
+def user_card(user_id, request):
+    # served from the cached user card (apps/accounts/cache.py); only the
+    # absolute avatar url depends on the request
+    card = get_user_brief(user_id)
+    if card is None:
+        return None
+    data = dict(card)
+    if data["avatar"] and request:
+        data["avatar"] = request.build_absolute_uri(data["avatar"])
+    return data
+
+
 class UserBriefSerializer(serializers.ModelSerializer):
     """
     Minimal public user info used in post lists.
@@ -123,6 +137,10 @@ class UserBriefSerializer(serializers.ModelSerializer):
         model = User
         fields = ("id", "username", "display_name", "avatar")
 
+    def to_representation(self, obj):
+        data = user_card(obj.pk, self.context.get("request", None))
+        return data if data is not None else super().to_representation(obj)
+
     def get_display_name(self, obj):
         first = getattr(obj, "first_name", "") or ""
         last = getattr(obj, "last_name", "") or ""
@@ -149,12 +167,10 @@ class UserBriefSerializer(serializers.ModelSerializer):
         return request.build_absolute_uri(url) if request else url
 
 
-class CommunityPostSerializer(serializers.ModelSerializer):
+class CommunityPostSerializer(RenditionSerializerMixin, serializers.ModelSerializer):
     author = serializers.PrimaryKeyRelatedField(read_only=True)
     author_detail = UserBriefSerializer(source="author", read_only=True)
 
-    likes_count = serializers.SerializerMethodField()
-    comments_count = serializers.SerializerMethodField()
     liked_by_user = serializers.SerializerMethodField()
     recent_comments = serializers.SerializerMethodField()  # small preview for frontend
 
@@ -176,14 +192,13 @@ class CommunityPostSerializer(serializers.ModelSerializer):
             "is_removed",
         )
         read_only_fields = ("id", "author", "author_detail", "likes_count", "comments_count", "liked_by_user", "recent_comments", "created_at", "updated_at", "is_removed")
-
-    def get_likes_count(self, obj):
-        return obj.likes.count()
-
-    def get_comments_count(self, obj):
-        return obj.comments.filter(is_removed=False).count()
+    rendition_fields = {"image": ("image_meta", 640)}
 
     def get_liked_by_user(self, obj):
+        # list views batch-load this into the context (see prefetch_post_viewer_state)
+        liked = self.context.get("liked_post_ids")
+        if liked is not None:
+            return obj.pk in liked
         user = self.context.get("request").user
         if not user or not user.is_authenticated:
             return False
@@ -191,7 +206,11 @@ class CommunityPostSerializer(serializers.ModelSerializer):
 
     def get_recent_comments(self, obj):
         # return up to 3 recent non-removed comments
-        qs = obj.comments.filter(is_removed=False).select_related("user").order_by("-created_at")[:3]
+        recent = self.context.get("recent_comments")
+        if recent is not None:
+            qs = recent.get(obj.pk, [])
+        else:
+            qs = obj.comments.filter(is_removed=False).select_related("user").order_by("-created_at")[:3]
         return PostCommentSerializer(qs, many=True, context=self.context).data
 
     def create(self, validated_data):
@@ -209,6 +228,17 @@ class CommunityPostSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
+class CommunityFeedPostSerializer(CommunityPostSerializer):
+    """Post in the merged community feed: says which community it came from."""
+    community_detail = serializers.SerializerMethodField()
+
+    class Meta(CommunityPostSerializer.Meta):
+        fields = CommunityPostSerializer.Meta.fields + ("community_detail",)
+
+    def get_community_detail(self, obj):
+        return {"id": obj.community_id, "name": obj.community.name, "slug": obj.community.slug}
+
+
 
 # serializers.py (add these below CommunityPostSerializer / UserBriefSerializer)
 
@@ -252,3 +282,14 @@ class PostReportSerializer(serializers.ModelSerializer):
         validated_data["reporter"] = self.context["request"].user
         return super().create(validated_data)
 
+
+class BulkPostLikeSerializer(BulkActionSerializer):
+    actions = ("like", "unlike")
+    like = id_list()
+    unlike = id_list()
+
+
+class BulkMembershipSerializer(BulkActionSerializer):
+    actions = ("join", "leave")
+    join = id_list()
+    leave = id_list()
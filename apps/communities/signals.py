@@ -1,16 +1,76 @@
-from django.db.models.signals import post_save, post_delete
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
-from .models import Membership, Community
+from django.db import transaction
 
+from .models import Membership, Community, CommunityPost, PostComment, PostLike
+
+from core.cache import invalidate
+from core.images import renditions_ready
+from core.response_cache import bump_tags
+from .cache import (
+    community_key, community_posts_tag, community_tag, communities_tag, membership_key, touch_community_posts,
+)
+from .feed import bump_posts_version, member_of_key
+from .tasks import queue_recount
+
+# member_count recounts run on the task worker (see tasks.py)
 @receiver(post_save, sender=Membership)
 def update_member_count_on_add(sender, instance, created, **kwargs):
-    if created and instance.is_approved:
-        community = instance.community
-        community.member_count = Membership.objects.filter(community=community, is_approved=True).count()
-        community.save(update_fields=["member_count"])
+    # also on updates: approving an existing membership changes the count
+    if instance.is_approved or not created:
+        queue_recount(instance.community_id)
 
 @receiver(post_delete, sender=Membership)
 def update_member_count_on_remove(sender, instance, **kwargs):
-    community = instance.community
-    community.member_count = Membership.objects.filter(community=community, is_approved=True).count()
-    community.save(update_fields=["member_count"])
+    queue_recount(instance.community_id)
+
+# cache invalidation (see cache.py)
+@receiver(post_save, sender=Membership)
+@receiver(post_delete, sender=Membership)
+def invalidate_membership(sender, instance, **kwargs):
+    invalidate(membership_key(instance.community_id, instance.user_id), member_of_key(instance.user_id))
+
+@receiver(pre_save, sender=Community)
+def remember_old_slug(sender, instance, **kwargs):
+    if instance.pk:
+        instance._old_slug = Community.objects.filter(pk=instance.pk).values_list("slug", flat=True).first()
+
+@receiver(post_save, sender=Community)
+@receiver(post_delete, sender=Community)
+def invalidate_community(sender, instance, **kwargs):
+    # a renamed slug leaves the old key behind, drop it too
+    keys = [community_key(instance.slug)]
+    old_slug = getattr(instance, "_old_slug", None)
+    if old_slug and old_slug != instance.slug:
+        keys.append(community_key(old_slug))
+    invalidate(*keys)
+    bump_tags(communities_tag(), community_tag(instance.pk), community_posts_tag(instance.pk))
+
+@receiver(renditions_ready, sender=Community)
+def invalidate_rendered_community(sender, pk, **kwargs):
+    # picture_meta is written with queryset.update(), which skips post_save
+    slug = Community.objects.filter(pk=pk).values_list("slug", flat=True).first()
+    if slug:
+        invalidate(community_key(slug))
+        bump_tags(communities_tag(), community_tag(pk))
+
+# merged community feed (see feed.py): new, edited, removed or deleted posts change the page keys
+@receiver(post_save, sender=CommunityPost)
+@receiver(post_delete, sender=CommunityPost)
+def bump_community_feed(sender, instance, **kwargs):
+    community_id = instance.community_id
+    bump_posts_version(community_id)
+    bump_tags(community_posts_tag(community_id))
+    transaction.on_commit(lambda: bump_posts_version(community_id))
+
+# anonymous post lists show likes_count / comments_count / recent comments
+@receiver(post_save, sender=PostLike)
+@receiver(post_delete, sender=PostLike)
+@receiver(post_save, sender=PostComment)
+@receiver(post_delete, sender=PostComment)
+def bump_post_list_on_engagement(sender, instance, **kwargs):
+    touch_community_posts(instance.post_id)
+
+@receiver(renditions_ready, sender=CommunityPost)
+def bump_post_list_on_render(sender, pk, **kwargs):
+    touch_community_posts(pk)
@@ -0,0 +1,18 @@
+# apps/communities/tasks.py
+from apps.tasks.queue import task
+from .models import Community, Membership
+
+
+@task
+def recount_members(community_id):
+    community = Community.objects.filter(pk=community_id).first()
+    if community is None:
+        return
+    community.member_count = Membership.objects.filter(community_id=community_id, is_approved=True).count()
+    # save() (not update()) so the community cache is invalidated by signals.py
+    community.save(update_fields=["member_count"])
+
+
+def queue_recount(community_id):
+    # a burst of joins / leaves collapses into one queued recount
+    recount_members.enqueue([community_id], key=f"recount_members:{community_id}")
@@ -14,12 +14,17 @@ from .views import (
     CommunityReportListView,
     RemoveMemberView,
     PostReportActionView,   # <- add this import
+    CommunityFeedView,
+    BulkMembershipView,
 )
 
 app_name = "communities"
 
 urlpatterns = [
     path("", CommunityListCreateView.as_view(), name="community-list"),
+    # merged feed of every joined community (before <slug:slug>/, "feed" is a reserved slug)
+    path("feed/", CommunityFeedView.as_view(), name="community-feed"),
+    path("memberships/bulk/", BulkMembershipView.as_view(), name="membership-bulk"),
     path("<slug:slug>/", CommunityDetailView.as_view(), name="community-detail"),
     path("<slug:slug>/join/", JoinCommunityView.as_view(), name="community-join"),
     path("<slug:slug>/leave/", LeaveCommunityView.as_view(), name="community-leave"),
@@ -3,7 +3,13 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 from django.db import transaction
+from django.db.models import Case, Exists, F, IntegerField, Max, OuterRef, When
+from django.core.cache import cache
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
+from core.conditional import ConditionalGetMixin
+from core.pagination import KeysetPagination
+from core.response_cache import PublicResponseCacheMixin
+from core.rows import RowReadMixin
 
 
 # ... other imports above ...
@@ -13,21 +19,43 @@ from .serializers import (
     MembershipSerializer,
     JoinRequestSerializer,
     CommunityPostSerializer,
+    CommunityFeedPostSerializer,
     PostLikeSerializer,
     PostCommentSerializer,
-    PostReportSerializer
+    PostReportSerializer,
+    BulkPostLikeSerializer,
+    BulkMembershipSerializer,
 )
-from .permissions import IsCommunityAdminOrReadOnly, is_member, is_admin
+from .permissions import IsCommunityAdminOrReadOnly, resolver_for
+from .counters import bump
+from .prefetch import prefetch_post_viewer_state
+from .cache import (
+    get_community, get_community_or_404, membership_key,
+    communities_tag, community_tag, community_posts_tag, touch_community_posts,
+)
+from . import feed, rows
+from .tasks import queue_recount
+from core.bulk import per_item
+from core.cache import invalidate
+from apps.accounts.cache import get_user_brief
+from apps.notifications.models import Notification
+from apps.notifications.services import notify
+from apps.search.models import SearchEntry
+from apps.search.services import matching_ids
 
 
 # -----------------------
 # COMMUNITY LIST + CREATE
 # -----------------------
-class CommunityListCreateView(generics.ListCreateAPIView):
+class CommunityListCreateView(PublicResponseCacheMixin, generics.ListCreateAPIView):
     queryset = Community.objects.all().select_related("created_by")
     serializer_class = CommunitySerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
+    def public_cache_tags(self, request, *args, **kwargs):
+        # the anonymous directory (hidden communities excluded) is the same for everyone
+        return [communities_tag()]
+
     def get_queryset(self):
         qs = super().get_queryset()
 
@@ -36,7 +64,10 @@ class CommunityListCreateView(generics.ListCreateAPIView):
         visibility = self.request.query_params.get("visibility")
 
         if q:
-            qs = qs.filter(name__icontains=q) | qs.filter(description__icontains=q)
+            # full-text index (apps/search) instead of a LIKE '%q%' scan, best match first
+            ids = matching_ids(SearchEntry.COMMUNITY, q)
+            rank = Case(*[When(pk=pk, then=pos) for pos, pk in enumerate(ids)], output_field=IntegerField())
+            qs = qs.filter(pk__in=ids).order_by(rank, "-created_at")
 
         if cat:
             qs = qs.filter(category__icontains=cat)
@@ -58,12 +89,33 @@ class CommunityListCreateView(generics.ListCreateAPIView):
 # -----------------------
 # COMMUNITY DETAIL
 # -----------------------
-class CommunityDetailView(generics.RetrieveUpdateDestroyAPIView):
+class CommunityDetailView(PublicResponseCacheMixin, ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Community.objects.all().select_related("created_by")
     serializer_class = CommunitySerializer
     lookup_field = "slug"
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsCommunityAdminOrReadOnly]
 
+    def public_cache_tags(self, request, *args, **kwargs):
+        community = get_community(kwargs["slug"])
+        if community is None or community.visibility != Community.PUBLIC:
+            return None
+        return [community_tag(community.pk)]
+
+    def get_validators(self, request, *args, **kwargs):
+        # Community has no updated_at; the cached row's own values are the validator
+        community = get_community(kwargs["slug"])
+        if community is None:
+            return None, None
+        return tuple(getattr(community, f.attname) for f in Community._meta.concrete_fields), None
+
+    def get_object(self):
+        # reads are served from the community cache; writes load a fresh row
+        if self.request.method not in permissions.SAFE_METHODS:
+            return super().get_object()
+        community = get_community_or_404(self.kwargs["slug"])
+        self.check_object_permissions(self.request, community)
+        return community
+
 
 # -----------------------
 # JOIN COMMUNITY
@@ -74,22 +126,17 @@ class JoinCommunityView(APIView):
     def post(self, request, slug):
         community = get_object_or_404(Community, slug=slug)
 
-        if is_member(request.user, community):
+        if resolver_for(request).is_member(community):
             return Response({"detail": "Already a member."}, status=status.HTTP_400_BAD_REQUEST)
 
         # PUBLIC → instant join
         if community.visibility == Community.PUBLIC:
-            with transaction.atomic():
-                m, created = Membership.objects.get_or_create(
-                    community=community,
-                    user=request.user,
-                    defaults={"is_approved": True},
-                )
-                community.member_count = Membership.objects.filter(
-                    community=community,
-                    is_approved=True
-                ).count()
-                community.save(update_fields=["member_count"])
+            # member_count is recounted by the queued task (signals.py)
+            m, created = Membership.objects.get_or_create(
+                community=community,
+                user=request.user,
+                defaults={"is_approved": True},
+            )
 
             return Response(
                 {"detail": "Joined community.", "membership_id": m.id},
@@ -112,6 +159,71 @@ class JoinCommunityView(APIView):
         return Response(JoinRequestSerializer(jr).data, status=status.HTTP_201_CREATED)
 
 
+class BulkMembershipView(APIView):
+    """
+    POST {"join": [community ids], "leave": [community ids]} -> per-community results:
+      join:  joined | requested (private/hidden) | already_member | already_requested | not_found
+      leave: left | not_member
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = BulkMembershipSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        join_ids, leave_ids = serializer.validated_data["join"], serializer.validated_data["leave"]
+        user = request.user
+
+        with transaction.atomic():
+            visibility = dict(Community.objects.filter(pk__in=join_ids).values_list("pk", "visibility"))
+            existing = dict(
+                Membership.objects.filter(user=user, community_id__in=join_ids + leave_ids).values_list("community_id", "is_approved")
+            )
+            requested = set(JoinRequest.objects.filter(user=user, community_id__in=join_ids).values_list("community_id", flat=True))
+
+            join_status = {}
+            joined, asked = [], []
+            for cid in join_ids:
+                if cid not in visibility:
+                    join_status[cid] = "not_found"
+                elif existing.get(cid):
+                    join_status[cid] = "already_member"
+                elif cid in existing or cid in requested:
+                    join_status[cid] = "already_requested"
+                elif visibility[cid] == Community.PUBLIC:
+                    join_status[cid] = "joined"
+                    joined.append(cid)
+                else:
+                    join_status[cid] = "requested"
+                    asked.append(cid)
+
+            Membership.objects.bulk_create(
+                [Membership(community_id=cid, user=user, is_approved=True) for cid in joined], ignore_conflicts=True
+            )
+            JoinRequest.objects.bulk_create([JoinRequest(community_id=cid, user=user) for cid in asked], ignore_conflicts=True)
+            # queryset delete still sends post_delete, so signals.py recounts and invalidates those
+            left = [cid for cid in leave_ids if cid in existing]
+            Membership.objects.filter(user=user, community_id__in=left).delete()
+
+            # bulk_create skips post_save: do what signals.py / notifications would have done
+            for cid in joined:
+                queue_recount(cid)
+            if joined:
+                invalidate(feed.member_of_key(user.id), *[membership_key(cid, user.id) for cid in joined])
+            if asked:
+                approvers = {cid: [] for cid in asked}
+                for cid, uid in Community.objects.filter(pk__in=asked).values_list("pk", "created_by_id"):
+                    approvers[cid].append(uid)
+                for cid, uid in Membership.objects.filter(
+                    community_id__in=asked, role=Membership.ADMIN, is_approved=True
+                ).values_list("community_id", "user_id"):
+                    approvers[cid].append(uid)
+                for cid, recipients in approvers.items():
+                    notify(recipients, Notification.JOIN_REQUEST, cid, user.id)
+
+        leave_status = {cid: "left" if cid in existing else "not_member" for cid in leave_ids}
+        return Response({"join": per_item(join_ids, join_status), "leave": per_item(leave_ids, leave_status)})
+
+
 # -----------------------
 # LEAVE COMMUNITY
 # -----------------------
@@ -128,13 +240,9 @@ class LeaveCommunityView(APIView):
         if not membership:
             return Response({"detail": "Not a member."}, status=status.HTTP_400_BAD_REQUEST)
 
+        # member_count is recounted by the queued task (signals.py)
         membership.delete()
 
-        community.member_count = Membership.objects.filter(
-            community=community, is_approved=True
-        ).count()
-        community.save(update_fields=["member_count"])
-
         return Response({"detail": "Left community."}, status=status.HTTP_200_OK)
 
 
@@ -147,7 +255,7 @@ class ListMembersView(generics.ListAPIView):
 
     def get_queryset(self):
         slug = self.kwargs.get("slug")
-        community = get_object_or_404(Community, slug=slug)
+        community = get_community_or_404(slug)
         return Membership.objects.filter(
             community=community, is_approved=True
         ).select_related("user")
@@ -162,7 +270,7 @@ class ApproveJoinRequestView(APIView):
     def post(self, request, slug, request_id):
         community = get_object_or_404(Community, slug=slug)
 
-        if not is_admin(request.user, community):
+        if not resolver_for(request).is_admin(community):
             return Response(
                 {"detail": "Not permitted."},
                 status=status.HTTP_403_FORBIDDEN,
@@ -184,12 +292,6 @@ class ApproveJoinRequestView(APIView):
                 defaults={"role": Membership.MEMBER, "is_approved": True},
             )
 
-            community.member_count = Membership.objects.filter(
-                community=community,
-                is_approved=True
-            ).count()
-            community.save(update_fields=["member_count"])
-
         return Response(
             {"detail": "Join request accepted.", "membership_id": m.id},
             status=status.HTTP_200_OK,
@@ -205,7 +307,7 @@ class RejectJoinRequestView(APIView):
     def post(self, request, slug, request_id):
         community = get_object_or_404(Community, slug=slug)
 
-        if not is_admin(request.user, community):
+        if not resolver_for(request).is_admin(community):
             return Response(
                 {"detail": "Not permitted."},
                 status=status.HTTP_403_FORBIDDEN,
@@ -226,7 +328,7 @@ class RejectJoinRequestView(APIView):
 # -----------------------
 # COMMUNITY POSTS
 # -----------------------
-class CommunityPostListCreateView(generics.ListCreateAPIView):
+class CommunityPostListCreateView(RowReadMixin, PublicResponseCacheMixin, generics.ListCreateAPIView):
     """
     List posts in a community and allow members (or public) to create posts.
     Preserves existing permission and membership checks, and sets author on create.
@@ -234,41 +336,126 @@ class CommunityPostListCreateView(generics.ListCreateAPIView):
     """
     serializer_class = CommunityPostSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = KeysetPagination
+
+    def public_cache_tags(self, request, *args, **kwargs):
+        community = get_community(kwargs["slug"])
+        if community is None or community.visibility != Community.PUBLIC:
+            return None
+        return [community_posts_tag(community.pk)]
 
     def get_queryset(self):
         slug = self.kwargs.get("slug")
-        community = get_object_or_404(Community, slug=slug)
+        community = get_community_or_404(slug)
 
-        user = self.request.user
         qs = CommunityPost.objects.filter(community=community, is_removed=False)
 
         # if private/hidden, only members can view
-        if community.visibility in (Community.HIDDEN, Community.PRIVATE) and not is_member(user, community):
+        if community.visibility in (Community.HIDDEN, Community.PRIVATE) and not resolver_for(self.request).is_member(community):
             return CommunityPost.objects.none()
 
-        # select_related to avoid N+1 when serializing author and (optionally) profile
-        # if your avatar is on profile, ensure author__profile is available
-        return qs.select_related("author", "author__profile").order_by("-created_at")
+        # author cards (name + avatar) come from the user cache, so only the author row is joined
+        return qs.select_related("author").order_by("-created_at")
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.use_rows():
+            page = self.paginate_queryset(rows.POST_ROWS.queryset(queryset))
+            context = self.get_serializer_context()
+            context.update(rows.viewer_state(page, request.user, context))
+            return self.get_paginated_response(rows.POST_ROWS.data(page, context))
+
+        page = self.paginate_queryset(queryset)
+        posts = page if page is not None else list(queryset)
+
+        # viewer likes + recent comments for the whole page in two queries
+        context = self.get_serializer_context()
+        context.update(prefetch_post_viewer_state(posts, request.user))
+        serializer = self.get_serializer_class()(posts, many=True, context=context)
+
+        if page is not None:
+            return self.get_paginated_response(serializer.data)
+        return Response(serializer.data)
 
     def perform_create(self, serializer):
         community = get_object_or_404(Community, slug=self.kwargs.get("slug"))
         user = self.request.user
 
         # only members can post in private/hidden communities
-        if community.visibility in (Community.PRIVATE, Community.HIDDEN) and not is_member(user, community):
+        if community.visibility in (Community.PRIVATE, Community.HIDDEN) and not resolver_for(self.request).is_member(community):
             raise permissions.PermissionDenied("Only members can post in this community.")
 
         # explicitly set community and author (keeps old behavior)
         serializer.save(community=community, author=user)
 
 
-class CommunityPostDetailView(generics.RetrieveUpdateDestroyAPIView):
+class CommunityFeedView(generics.ListAPIView):
+    """
+    Recent posts from every community the user is an approved member of, newest
+    first, in one request. Membership gives access to private/hidden communities,
+    so no per-community visibility check is needed. Each page's post ids (and its
+    links) are cached per user until one of those communities gets a post.
+    """
+    serializer_class = CommunityFeedPostSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        return CommunityPost.objects.filter(
+            community_id__in=feed.member_community_ids(self.request.user.id), is_removed=False
+        )
+
+    def list(self, request, *args, **kwargs):
+        community_ids = feed.member_community_ids(request.user.id)
+        key = feed.page_key(
+            request.user.id, community_ids,
+            request.query_params.get(self.paginator.cursor_query_param, ""),
+            self.paginator.get_page_size(request),
+        )
+        cached = cache.get(key)
+        if cached is None:
+            page = self.paginate_queryset(self.get_queryset()) if community_ids else []
+            links = (self.paginator.get_next_link(), self.paginator.get_previous_link()) if page else (None, None)
+            cached = ([post.pk for post in page], *links)
+            cache.set(key, cached, feed.PAGE_TIMEOUT)
+
+        post_ids, next_link, previous_link = cached
+        by_id = CommunityPost.objects.select_related("author", "community").in_bulk(post_ids)
+        # a post removed since the page was cached drops out here
+        posts = [by_id[pk] for pk in post_ids if pk in by_id and not by_id[pk].is_removed]
+
+        context = self.get_serializer_context()
+        context.update(prefetch_post_viewer_state(posts, request.user))
+        serializer = self.get_serializer_class()(posts, many=True, context=context)
+        return Response({"next": next_link, "previous": previous_link, "results": serializer.data})
+
+
+class CommunityPostDetailView(ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     Retrieve / update / delete a community post.
     """
     serializer_class = CommunityPostSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
+    def get_validators(self, request, *args, **kwargs):
+        # one row: the post's own columns and counters, its newest comment edit and the viewer's like
+        row = (
+            CommunityPost.objects.filter(pk=kwargs["pk"])
+            .annotate(
+                last_comment=Max("comments__updated_at"),
+                liked=Exists(PostLike.objects.filter(post=OuterRef("pk"), user_id=request.user.pk)),
+            )
+            .values_list("updated_at", "likes_count", "comments_count", "is_removed", "image_meta", "last_comment", "liked", "author_id")
+            .first()
+        )
+        if row is None:
+            return None, None
+        updated_at, likes, comments, removed, meta, last_comment, liked, author_id = row
+        # author_detail is the cached user card (no timestamp of its own)
+        parts = (updated_at, likes, comments, removed, (meta or {}).get("status"), last_comment, liked, get_user_brief(author_id))
+        # likes, the viewer's like and comment removals leave every timestamp alone: ETag only
+        return parts, None
+
     def get_queryset(self):
         # include author and community to avoid additional queries
         return CommunityPost.objects.select_related("author", "community").all()
@@ -288,11 +475,11 @@ class CommunityJoinRequestListView(generics.ListAPIView):
 
     def get_queryset(self):
         slug = self.kwargs.get("slug")
-        community = get_object_or_404(Community, slug=slug)
+        community = get_community_or_404(slug)
 
         # authorization: only creator or admin may list requests
         user = self.request.user
-        if community.created_by != user and not is_admin(user, community):
+        if community.created_by_id != user.id and not resolver_for(self.request).is_admin(community):
             # return empty queryset - but better to raise permission denied
             from rest_framework.exceptions import PermissionDenied
             raise PermissionDenied("Not permitted to view join requests for this community.")
@@ -314,7 +501,10 @@ class PostLikeToggleView(APIView):
     def post(self, request, pk):
         post = get_object_or_404(CommunityPost, pk=pk)
         user = request.user
-        like, created = PostLike.objects.get_or_create(post=post, user=user)
+        with transaction.atomic():
+            like, created = PostLike.objects.get_or_create(post=post, user=user)
+            if created:
+                bump(post.pk, "likes_count", 1)
         if created:
             return Response({"detail": "Liked"}, status=status.HTTP_201_CREATED)
         return Response({"detail": "Already liked"}, status=status.HTTP_200_OK)
@@ -322,16 +512,60 @@ class PostLikeToggleView(APIView):
     def delete(self, request, pk):
         post = get_object_or_404(CommunityPost, pk=pk)
         user = request.user
-        deleted, _ = PostLike.objects.filter(post=post, user=user).delete()
+        with transaction.atomic():
+            deleted, _ = PostLike.objects.filter(post=post, user=user).delete()
+            if deleted:
+                bump(post.pk, "likes_count", -1)
         if deleted:
             return Response({"detail": "Unliked"}, status=status.HTTP_200_OK)
         return Response({"detail": "Not liked"}, status=status.HTTP_400_BAD_REQUEST)
 
 
+class BulkPostLikeView(APIView):
+    """
+    POST {"like": [post ids], "unlike": [post ids]} -> per-post results, in one transaction:
+      like:   liked | already_liked | not_found
+      unlike: unliked | not_liked
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = BulkPostLikeSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        like_ids, unlike_ids = serializer.validated_data["like"], serializer.validated_data["unlike"]
+        user = request.user
+
+        with transaction.atomic():
+            authors = dict(CommunityPost.objects.filter(pk__in=like_ids).values_list("pk", "author_id"))
+            liked = set(PostLike.objects.filter(user=user, post_id__in=like_ids + unlike_ids).values_list("post_id", flat=True))
+            new = [pk for pk in like_ids if pk in authors and pk not in liked]
+            PostLike.objects.bulk_create([PostLike(post_id=pk, user=user) for pk in new], ignore_conflicts=True)
+            gone = [pk for pk in unlike_ids if pk in liked]
+            PostLike.objects.filter(user=user, post_id__in=gone).delete()
+
+            # one like per (post, user), so every touched counter moves by exactly one
+            if new:
+                CommunityPost.objects.filter(pk__in=new).update(likes_count=F("likes_count") + 1)
+            if gone:
+                CommunityPost.objects.filter(pk__in=gone, likes_count__gte=1).update(likes_count=F("likes_count") - 1)
+            for pk in new:
+                notify([authors[pk]], Notification.COMMUNITY_POST_LIKE, pk, user.id)
+            if new:
+                # counters moved without post_save; the list pages show them
+                touch_community_posts(*new)
+
+        like_status = {pk: "not_found" if pk not in authors else "already_liked" if pk in liked else "liked" for pk in like_ids}
+        unlike_status = {pk: "unliked" if pk in liked else "not_liked" for pk in unlike_ids}
+        return Response({"like": per_item(like_ids, like_status), "unlike": per_item(unlike_ids, unlike_status)})
+
+
 # Comments: list/create and detail
 class PostCommentListCreateView(generics.ListCreateAPIView):
     serializer_class = PostCommentSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = KeysetPagination
+    # comment threads read oldest first
+    cursor_ordering = ("created_at", "id")
 
     def get_queryset(self):
         post = get_object_or_404(CommunityPost, pk=self.kwargs.get("pk"))
@@ -339,7 +573,9 @@ class PostCommentListCreateView(generics.ListCreateAPIView):
 
     def perform_create(self, serializer):
         post = get_object_or_404(CommunityPost, pk=self.kwargs.get("pk"))
-        serializer.save(post=post, user=self.request.user)
+        with transaction.atomic():
+            serializer.save(post=post, user=self.request.user)
+            bump(post.pk, "comments_count", 1)
 
 
 class PostCommentDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -359,8 +595,12 @@ class PostCommentDetailView(generics.RetrieveUpdateDestroyAPIView):
         # soft-delete comment (keeps history)
         if instance.user != self.request.user:
             raise permissions.PermissionDenied("Can't delete someone else's comment.")
-        instance.is_removed = True
-        instance.save(update_fields=["is_removed"])
+        if instance.is_removed:
+            return
+        with transaction.atomic():
+            instance.is_removed = True
+            instance.save(update_fields=["is_removed"])
+            bump(instance.post_id, "comments_count", -1)
 
 
 # Reports: create a report
@@ -370,7 +610,7 @@ class PostReportCreateView(generics.CreateAPIView):
 
     def perform_create(self, serializer):
         post = get_object_or_404(CommunityPost, pk=self.kwargs.get("pk"))
-        serializer.save(post=post, reporter=self.request.user)
+        serializer.save(post=post, community_id=post.community_id, reporter=self.request.user)
 
 
 # Admin: list reports for community and act on them
@@ -380,13 +620,13 @@ class CommunityReportListView(generics.ListAPIView):
 
     def get_queryset(self):
         slug = self.kwargs.get("slug")
-        community = get_object_or_404(Community, slug=slug)
+        community = get_community_or_404(slug)
         user = self.request.user
         # only community admins / creator allowed
-        if not is_admin(user, community) and community.created_by != user:
+        if not resolver_for(self.request).is_admin(community) and community.created_by_id != user.id:
             from rest_framework.exceptions import PermissionDenied
             raise PermissionDenied("Not permitted.")
-        return PostReport.objects.filter(post__community=community).select_related("post", "reporter", "handled_by").order_by("-created_at")
+        return PostReport.objects.filter(community=community).select_related("post", "reporter", "handled_by").order_by("-created_at")
 
 
 class PostReportActionView(APIView):
@@ -399,7 +639,7 @@ class PostReportActionView(APIView):
     def post(self, request, report_id):
         report = get_object_or_404(PostReport, pk=report_id)
         community = report.post.community
-        if not is_admin(request.user, community) and community.created_by != request.user:
+        if not resolver_for(request).is_admin(community) and community.created_by_id != request.user.id:
             return Response({"detail": "Not permitted."}, status=status.HTTP_403_FORBIDDEN)
 
         action = request.data.get("action")  # "accept" or "reject"
@@ -450,7 +690,7 @@ class RemoveMemberView(APIView):
         elif community.created_by_id == getattr(caller, "id", None):
             allowed = True
         # allow if caller is a community admin
-        elif is_admin(caller, community):
+        elif resolver_for(request).is_admin(community):
             allowed = True
         # allow if caller is the member themself
         elif membership.user_id == getattr(caller, "id", None):
@@ -461,11 +701,8 @@ class RemoveMemberView(APIView):
         if not allowed:
             return Response({"detail": "Not permitted to remove this member."}, status=status.HTTP_403_FORBIDDEN)
 
-        # perform delete and update counter atomically
-        with transaction.atomic():
-            membership.delete()
-            community.member_count = Membership.objects.filter(community=community, is_approved=True).count()
-            community.save(update_fields=["member_count"])
+        # member_count is recounted by the queued task (signals.py)
+        membership.delete()
 
         return Response({"detail": "Member removed."}, status=status.HTTP_200_OK)
     
@@ -500,7 +737,7 @@ class AdminAllReportsListView(generics.ListAPIView):
         # optional community filter by slug
         community_slug = self.request.query_params.get("community")
         if community_slug:
-            qs = qs.filter(post__community__slug=community_slug)
+            qs = qs.filter(community__slug=community_slug)
 
         return qs
     
@@ -522,7 +759,7 @@ class PostReportActionView(APIView):
             return Response({"detail": "Report does not belong to this community."}, status=status.HTTP_400_BAD_REQUEST)
 
         # permission check: only community admin or community creator can act
-        if not is_admin(request.user, community) and community.created_by != request.user:
+        if not resolver_for(request).is_admin(community) and community.created_by_id != request.user.id:
             return Response({"detail": "Not permitted."}, status=status.HTTP_403_FORBIDDEN)
 
         action = request.data.get("action")  # expected "accept" or "reject"
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 class FeedConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.feed"
+
+    def ready(self):
+        # import signals so timeline fan-out is registered
+        from . import signals  # noqa: F401
@@ -0,0 +1,33 @@
+# apps/feed/management/commands/backfill_timelines.py
+from django.core.management.base import BaseCommand
+from django.contrib.auth import get_user_model
+
+from apps.feed.models import Timeline
+from apps.feed.timeline import build_public_entries, build_timeline
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Build materialized home timelines (TimelineEntry rows) for existing users."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, action="append", dest="user_ids", help="only this user id (repeatable)")
+        parser.add_argument("--rebuild", action="store_true", help="drop and rebuild timelines that are already built")
+
+    def handle(self, *args, **options):
+        build_public_entries()
+        self.stdout.write("Public timeline entries built.")
+
+        users = User.objects.order_by("pk")
+        if options["user_ids"]:
+            users = users.filter(pk__in=options["user_ids"])
+        if not options["rebuild"]:
+            users = users.exclude(pk__in=Timeline.objects.values("user_id"))
+
+        done = 0
+        for user_id in users.values_list("pk", flat=True).iterator():
+            build_timeline(user_id, rebuild=options["rebuild"])
+            done += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Built {done} timeline(s)."))
@@ -0,0 +1,20 @@
+# apps/feed/management/commands/score_posts.py
+from django.core.management.base import BaseCommand
+
+from apps.feed import ranking
+from apps.feed.tasks import refresh_scores
+
+
+class Command(BaseCommand):
+    help = "Recompute engagement scores (PostScore) and author affinity for the ?sort=top feed. Run from cron every few minutes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--enqueue", action="store_true", help="queue the work for run_worker instead of running it here")
+
+    def handle(self, *args, **options):
+        if options["enqueue"]:
+            refresh_scores.enqueue(key="feed:refresh_scores")
+            self.stdout.write("Queued.")
+            return
+        posts, pairs = ranking.refresh_scores()
+        self.stdout.write(self.style.SUCCESS(f"Scored {posts} post(s) and {pairs} affinity pair(s)."))
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.8 on 2026-10-17 12:46
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def seed_public_entries(apps, schema_editor):
+    # public posts share one owner-less row, so new users see them right after migrate
+    Post = apps.get_model("feed", "Post")
+    TimelineEntry = apps.get_model("feed", "TimelineEntry")
+    TimelineEntry.objects.bulk_create(
+        [
+            TimelineEntry(owner_id=None, post_id=pk, created_at=created)
+            for pk, created in Post.objects.filter(visibility="public").values_list("pk", "created_at").iterator()
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('feed', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Timeline',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('built_at', models.DateTimeField(auto_now=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='timeline', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='TimelineEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField()),
+                ('owner', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entries', to=settings.AUTH_USER_MODEL)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entries', to='feed.post')),
+            ],
+            options={
+                'ordering': ['-created_at', '-post_id'],
+                'indexes': [models.Index(fields=['owner', '-created_at', '-post'], name='timeline_owner_recent_idx')],
+                'constraints': [models.UniqueConstraint(fields=('owner', 'post'), name='timeline_unique_owner_post'), models.UniqueConstraint(condition=models.Q(('owner__isnull', True)), fields=('post',), name='timeline_unique_public_post')],
+            },
+        ),
+        migrations.RunPython(seed_public_entries, migrations.RunPython.noop),
+    ]
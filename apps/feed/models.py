@@ -1,6 +1,7 @@
 # the feed model for the user
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 
 class Post(models.Model):
     PUBLIC = "public"
@@ -15,14 +16,98 @@ class Post(models.Model):
     author = models.ForeignKey(settings.AUTH_USER_MODEL, related_name="posts", on_delete=models.CASCADE)
     text = models.TextField(blank=True)
     image = models.ImageField(upload_to="posts/", null=True, blank=True)
+    # renditions + dimensions written by the image worker (core/images.py)
+    image_meta = models.JSONField(default=dict, blank=True, editable=False)
     visibility = models.CharField(max_length=10, choices=VISIBILITY_CHOICES, default=FRIENDS)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # feed: public posts / one author's posts, newest first (keyset on created_at, id)
+            models.Index(fields=["visibility", "-created_at", "-id"], name="post_visibility_recent_idx"),
+            models.Index(fields=["author", "-created_at", "-id"], name="post_author_recent_idx"),
+        ]
 
     def __str__(self):
         return f"Post {self.pk} by {self.author}"
 
 
+# materialized home timeline (fan-out on write)
+class TimelineEntry(models.Model):
+    """
+    One row per (reader, post) in a user's home timeline.
+    Public posts get a single shared row with owner=NULL instead of one row per user,
+    so the feed reads the `owner = me` and `owner IS NULL` ranges of (created_at, post_id)
+    and merges them.
+    created_at is copied from the post so the range read never touches feed_post.
+    """
+    owner = models.ForeignKey(settings.AUTH_USER_MODEL, related_name="timeline_entries", null=True, blank=True, on_delete=models.CASCADE)
+    post = models.ForeignKey(Post, related_name="timeline_entries", on_delete=models.CASCADE)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ["-created_at", "-post_id"]
+        constraints = [
+            models.UniqueConstraint(fields=["owner", "post"], name="timeline_unique_owner_post"),
+            models.UniqueConstraint(fields=["post"], condition=models.Q(owner__isnull=True), name="timeline_unique_public_post"),
+        ]
+        indexes = [
+            models.Index(fields=["owner", "-created_at", "-post"], name="timeline_owner_recent_idx"),
+        ]
+
+    def __str__(self):
+        return f"Post {self.post_id} in timeline of {self.owner_id or 'everyone'}"
+
+
+class Timeline(models.Model):
+    """
+    Marks a user whose TimelineEntry rows are complete.
+    Users without one are served by the old OR query until backfilled.
+    """
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, related_name="timeline", on_delete=models.CASCADE)
+    built_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Timeline of {self.user_id}"
+
+
+# ranked ("top") feed, precomputed by ranking.refresh_scores
+class PostScore(models.Model):
+    """
+    Engagement score of a recent post: likes and comments decayed by age.
+    visibility/author/created_at are copied from the post so the ranked
+    candidate read is a single index range on this table.
+    """
+    post = models.OneToOneField(Post, primary_key=True, related_name="score", on_delete=models.CASCADE)
+    author = models.ForeignKey(settings.AUTH_USER_MODEL, related_name="+", on_delete=models.CASCADE, db_index=False)
+    visibility = models.CharField(max_length=10, choices=Post.VISIBILITY_CHOICES)
+    score = models.FloatField(default=0.0)
+    created_at = models.DateTimeField()
+    computed_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["visibility", "-score"], name="postscore_visibility_top_idx"),
+            models.Index(fields=["author", "-score"], name="postscore_author_top_idx"),
+        ]
+
+    def __str__(self):
+        return f"Post {self.post_id} score {self.score:.4f}"
+
+
+class Affinity(models.Model):
+    """How much `user` has recently interacted (likes, comments) with `author`'s posts."""
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, related_name="affinities", on_delete=models.CASCADE)
+    author = models.ForeignKey(settings.AUTH_USER_MODEL, related_name="+", on_delete=models.CASCADE)
+    weight = models.FloatField()
+    computed_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "author"], name="affinity_unique_user_author"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} -> {self.author_id}: {self.weight:.3f}"
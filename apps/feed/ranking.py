@@ -0,0 +1,189 @@
+# apps/feed/ranking.py
+# "top" feed: a periodic job scores recent posts into PostScore (and viewer->author
+# Affinity) with NumPy; a request reads the best candidates by index and re-ranks
+# that small set for the viewer, again vectorized
+import heapq
+from datetime import timedelta
+from itertools import islice
+from operator import itemgetter
+
+import numpy as np
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from apps.comments.models import Comment
+from apps.friendships.cache import friend_array
+from apps.likes.models import Like
+from core.cache import read_through
+from .models import Affinity, Post, PostScore
+
+# global engagement score: (1 + likes + 3 * comments) / (age_hours + 2) ** 1.5
+LIKE_WEIGHT = 1.0
+COMMENT_WEIGHT = 3.0
+GRAVITY = 1.5
+SCORE_WINDOW = timedelta(days=7)
+
+# affinity: each like / comment on the author's posts, halving every week
+AFFINITY_WINDOW = timedelta(days=30)
+AFFINITY_HALF_LIFE_DAYS = 7.0
+
+# per-viewer re-rank of the candidates
+FRIEND_BOOST = 0.5
+AFFINITY_BOOST = 0.3
+CANDIDATES = 300
+RANKED_TIMEOUT = 120
+
+BATCH_SIZE = 1000
+
+
+def _epoch(datetimes):
+    return np.fromiter((d.timestamp() for d in datetimes), dtype=np.float64, count=len(datetimes))
+
+
+def engagement(likes, comments, age_hours):
+    """Vectorized: arrays in, array of scores out."""
+    return (1.0 + LIKE_WEIGHT * likes + COMMENT_WEIGHT * comments) / np.power(age_hours + 2.0, GRAVITY)
+
+
+def initial_score():
+    # a post the job has not seen yet: no engagement, age 0
+    return float(engagement(np.zeros(1), np.zeros(1), np.zeros(1))[0])
+
+
+def _counts(model, post_ids, cutoff):
+    counts = np.zeros(len(post_ids), dtype=np.float64)
+    rows = model.objects.filter(post__created_at__gte=cutoff).values("post_id").annotate(n=Count("id")).values_list("post_id", "n")
+    if rows:
+        ids, n = map(np.asarray, zip(*rows))
+        pos = np.searchsorted(post_ids, ids)
+        found = (pos < len(post_ids)) & (post_ids[np.minimum(pos, len(post_ids) - 1)] == ids)
+        counts[pos[found]] = n[found]
+    return counts
+
+
+def score_posts(now=None):
+    """Recompute PostScore for every post in SCORE_WINDOW and drop older rows."""
+    now = now or timezone.now()
+    cutoff = now - SCORE_WINDOW
+    rows = list(Post.objects.filter(created_at__gte=cutoff).order_by("pk").values_list("pk", "author_id", "visibility", "created_at"))
+    if rows:
+        pks, authors, visibilities, created = zip(*rows)
+        post_ids = np.asarray(pks, dtype=np.int64)
+        age_hours = np.maximum((now.timestamp() - _epoch(created)) / 3600.0, 0.0)
+        scores = engagement(_counts(Like, post_ids, cutoff), _counts(Comment, post_ids, cutoff), age_hours)
+        PostScore.objects.bulk_create(
+            [
+                PostScore(post_id=pk, author_id=a, visibility=v, created_at=c, score=float(s), computed_at=now)
+                for pk, a, v, c, s in zip(pks, authors, visibilities, created, scores)
+            ],
+            batch_size=BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["post"],
+            update_fields=["visibility", "score", "computed_at"],
+        )
+    PostScore.objects.filter(created_at__lt=cutoff).delete()
+    return len(rows)
+
+
+def _interactions(model, user_field, since):
+    rows = list(
+        model.objects.filter(created_at__gte=since)
+        .exclude(**{user_field: F("post__author_id")})
+        .values_list(user_field, "post__author_id", "created_at")
+        .iterator()
+    )
+    if not rows:
+        return np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0)
+    users, authors, created = zip(*rows)
+    return np.asarray(users, np.int64), np.asarray(authors, np.int64), _epoch(created)
+
+
+def score_affinity(now=None):
+    """Recompute Affinity from likes and comments in AFFINITY_WINDOW."""
+    now = now or timezone.now()
+    since = now - AFFINITY_WINDOW
+    parts = [(*_interactions(Like, "user_id", since), LIKE_WEIGHT), (*_interactions(Comment, "author_id", since), COMMENT_WEIGHT)]
+    users = np.concatenate([p[0] for p in parts])
+    authors = np.concatenate([p[1] for p in parts])
+    age_days = (now.timestamp() - np.concatenate([p[2] for p in parts])) / 86400.0
+    weights = np.concatenate([np.full(len(p[0]), p[3]) for p in parts]) * np.exp2(-age_days / AFFINITY_HALF_LIFE_DAYS)
+
+    # sum the weights per (user, author) pair
+    keys = (users << 32) | authors
+    pairs, inverse = np.unique(keys, return_inverse=True)
+    totals = np.bincount(inverse, weights=weights, minlength=len(pairs))
+    with transaction.atomic():
+        Affinity.objects.bulk_create(
+            [Affinity(user_id=int(k >> 32), author_id=int(k & 0xFFFFFFFF), weight=float(w), computed_at=now) for k, w in zip(pairs, totals)],
+            batch_size=BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["user", "author"],
+            update_fields=["weight", "computed_at"],
+        )
+        # pairs with no interaction left in the window
+        Affinity.objects.filter(computed_at__lt=now).delete()
+    return len(pairs)
+
+
+def refresh_scores():
+    return score_posts(), score_affinity()
+
+
+def add_post(post):
+    # only the new row is scored (what score_posts gives a post newer than its last
+    # run: no engagement, age 0); the periodic `score_posts` pass decays it with the rest
+    PostScore.objects.bulk_create(
+        [PostScore(post_id=post.pk, author_id=post.author_id, visibility=post.visibility, created_at=post.created_at, score=initial_score())],
+        update_conflicts=True,
+        unique_fields=["post"],
+        update_fields=["visibility", "score", "computed_at"],
+    )
+
+
+def update_visibility(post):
+    PostScore.objects.filter(post=post).update(visibility=post.visibility)
+
+
+# -----------------------
+# request side
+# -----------------------
+def ranked_key(user_id):
+    return f"feed_top:{user_id}"
+
+
+def _candidates(user_id, friends):
+    """
+    The CANDIDATES best-scored posts the viewer may see. Each source is its own
+    -score index range (public, friends-only posts of friends, own non-public posts),
+    merged here; one OR query over the three sorts the whole union.
+    """
+    scores = PostScore.objects.order_by("-score").values_list("post_id", "author_id", "score")
+    ranges = [
+        scores.filter(visibility=Post.PUBLIC),
+        scores.filter(visibility=Post.FRIENDS, author_id__in=friends.tolist()),
+        scores.filter(author_id=user_id).exclude(visibility=Post.PUBLIC),
+    ]
+    merged = heapq.merge(*(list(qs[:CANDIDATES]) for qs in ranges), key=itemgetter(2), reverse=True)
+    return list(islice(merged, CANDIDATES))
+
+
+def _rank(user_id):
+    friends = friend_array(user_id)
+    rows = _candidates(user_id, friends)
+    if not rows:
+        return []
+    post_ids, authors, scores = (np.asarray(col) for col in zip(*rows))
+    affinity = dict(Affinity.objects.filter(user_id=user_id, author_id__in=set(authors.tolist())).values_list("author_id", "weight"))
+    weights = np.fromiter((affinity.get(a, 0.0) for a in authors.tolist()), dtype=np.float64, count=len(authors))
+
+    boost = 1.0 + FRIEND_BOOST * np.isin(authors, np.frombuffer(friends, dtype=np.int64)) + AFFINITY_BOOST * np.log1p(weights)
+    final = scores.astype(np.float64) * boost
+    # best first, newest post id breaking ties
+    order = np.lexsort((-post_ids, -final))
+    return post_ids[order].tolist()
+
+
+def ranked_post_ids(user_id):
+    """The viewer's ranked candidate ids; cached briefly so paging walks one stable order."""
+    return read_through(ranked_key(user_id), lambda: _rank(user_id), RANKED_TIMEOUT)
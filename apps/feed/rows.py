@@ -0,0 +1,9 @@
+# apps/feed/rows.py
+# values() read plans for the home feed (core/rows.py); same JSON as PostSerializer
+from core.rows import Plan
+from .serializers import PostSerializer
+
+POST_ROWS = Plan(PostSerializer)
+
+# TimelineEntry carries the post's created_at / id for the cursor
+TIMELINE_ROWS = Plan(PostSerializer, prefix="post__", extra=("created_at", "post_id"))
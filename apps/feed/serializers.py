@@ -1,6 +1,7 @@
 # The functionalities of the feed
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from core.images import RenditionSerializerMixin
 from .models import Post
 
 User = get_user_model()
@@ -10,7 +11,7 @@ class UserMiniSerializer(serializers.ModelSerializer):
         model = User
         fields = ("id", "username")
 
-class PostSerializer(serializers.ModelSerializer):
+class PostSerializer(RenditionSerializerMixin, serializers.ModelSerializer):
     author = UserMiniSerializer(read_only=True)
     image = serializers.ImageField(required=False, allow_null=True)
 
@@ -18,6 +19,8 @@ class PostSerializer(serializers.ModelSerializer):
         model = Post
         fields = ("id", "author", "text", "image", "visibility", "created_at", "updated_at")
         read_only_fields = ("id", "author", "created_at", "updated_at")
+    # `image` is served as the best-fitting rendition once processed
+    rendition_fields = {"image": ("image_meta", 640)}
 
     def create(self, validated_data):
         request = self.context.get("request")
@@ -0,0 +1,58 @@
+# apps/feed/signals.py
+# keeps TimelineEntry (and PostScore) rows in sync with posts and friendships
+from django.conf import settings
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from apps.friendships.models import Friendship
+from .models import Post, Timeline
+from core.images import renditions_ready
+from . import ranking, timeline, watermarks
+
+
+@receiver(pre_save, sender=Post)
+def remember_old_visibility(sender, instance, **kwargs):
+    if instance.pk:
+        instance._old_visibility = Post.objects.filter(pk=instance.pk).values_list("visibility", flat=True).first()
+
+
+@receiver(post_save, sender=Post)
+def fan_out_on_save(sender, instance, created, **kwargs):
+    if created:
+        timeline.fan_out_post(instance)
+        ranking.add_post(instance)
+    elif getattr(instance, "_old_visibility", instance.visibility) != instance.visibility:
+        timeline.refan_post(instance)
+        ranking.update_visibility(instance)
+    watermarks.touch_post(instance, was_public=getattr(instance, "_old_visibility", None) == Post.PUBLIC)
+    # deleting a post cascades to its TimelineEntry rows
+
+
+@receiver(post_delete, sender=Post)
+def touch_deleted_post(sender, instance, **kwargs):
+    watermarks.touch_post(instance)
+
+
+@receiver(renditions_ready, sender=Post)
+def touch_rendered_post(sender, pk, **kwargs):
+    post = Post.objects.filter(pk=pk).only("author_id", "visibility").first()
+    if post is not None:
+        watermarks.touch_post(post)
+
+
+@receiver(post_save, sender=Friendship)
+def add_friend_to_timeline(sender, instance, created, **kwargs):
+    if created:
+        timeline.add_friend_posts(instance.user_id, instance.friend_id)
+
+
+@receiver(post_delete, sender=Friendship)
+def remove_friend_from_timeline(sender, instance, **kwargs):
+    timeline.remove_friend_posts(instance.user_id, instance.friend_id)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def create_empty_timeline(sender, instance, created, **kwargs):
+    # a brand-new user has no friends or posts, so an empty timeline is already complete
+    if created:
+        Timeline.objects.get_or_create(user=instance)
@@ -0,0 +1,9 @@
+# apps/feed/tasks.py
+from apps.tasks.queue import task
+from . import ranking
+
+
+@task(max_attempts=1)
+def refresh_scores():
+    """Recompute PostScore / Affinity for the ranked feed (run it every few minutes)."""
+    ranking.refresh_scores()
@@ -0,0 +1,121 @@
+# apps/feed/timeline.py
+# fan-out-on-write helpers for the home timeline (see TimelineEntry)
+from django.db import transaction
+from django.db.models import Q
+
+from apps.friendships.cache import get_friend_ids
+from .models import Post, TimelineEntry, Timeline
+
+BATCH_SIZE = 500
+
+
+def _friend_ids(user_id):
+    return get_friend_ids(user_id)
+
+
+def _entries_for_post(post):
+    """
+    Build (unsaved) timeline rows for a post based on its visibility:
+      - public  -> one shared row (owner=None)
+      - friends -> the author + every friend of the author
+      - private -> the author only
+    """
+    if post.visibility == Post.PUBLIC:
+        owners = [None]
+    elif post.visibility == Post.FRIENDS:
+        owners = [post.author_id] + _friend_ids(post.author_id)
+    else:
+        owners = [post.author_id]
+    return [TimelineEntry(owner_id=o, post_id=post.pk, created_at=post.created_at) for o in owners]
+
+
+def fan_out_post(post):
+    TimelineEntry.objects.bulk_create(_entries_for_post(post), batch_size=BATCH_SIZE, ignore_conflicts=True)
+
+
+def refan_post(post):
+    # visibility changed: drop every copy and write the new audience
+    TimelineEntry.objects.filter(post_id=post.pk).delete()
+    fan_out_post(post)
+
+
+def add_friend_posts(user_id, friend_id):
+    """Copy the friend's friends-only posts into user's timeline (called on new friendship)."""
+    posts = Post.objects.filter(author_id=friend_id, visibility=Post.FRIENDS).values_list("pk", "created_at")
+    TimelineEntry.objects.bulk_create(
+        [TimelineEntry(owner_id=user_id, post_id=pk, created_at=created) for pk, created in posts.iterator()],
+        batch_size=BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+
+def remove_friend_posts(user_id, friend_id):
+    TimelineEntry.objects.filter(owner_id=user_id, post__author_id=friend_id).delete()
+
+
+def build_public_entries():
+    posts = Post.objects.filter(visibility=Post.PUBLIC).values_list("pk", "created_at")
+    TimelineEntry.objects.bulk_create(
+        [TimelineEntry(owner_id=None, post_id=pk, created_at=created) for pk, created in posts.iterator()],
+        batch_size=BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+
+def build_timeline(user_id, rebuild=False):
+    """
+    (Re)build the personal part of a user's timeline: own non-public posts
+    and friends-only posts of friends. Public posts live in the shared rows
+    written by build_public_entries().
+    """
+    posts = Post.objects.filter(
+        (Q(author_id=user_id) & ~Q(visibility=Post.PUBLIC)) |
+        Q(author_id__in=_friend_ids(user_id), visibility=Post.FRIENDS)
+    ).values_list("pk", "created_at")
+
+    with transaction.atomic():
+        if rebuild:
+            TimelineEntry.objects.filter(owner_id=user_id).delete()
+        TimelineEntry.objects.bulk_create(
+            [TimelineEntry(owner_id=user_id, post_id=pk, created_at=created) for pk, created in posts.iterator()],
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        Timeline.objects.update_or_create(user_id=user_id)
+
+
+def has_timeline(user):
+    return Timeline.objects.filter(user=user).exists()
+
+
+def timeline_for(user):
+    """
+    Timeline rows visible to `user` as two index ranges, newest first: the user's own
+    rows and the shared public ones. KeysetPagination reads each range with the cursor
+    and merges the pages (one `owner = me OR owner IS NULL` query sorts the union).
+    """
+    rows = TimelineEntry.objects.select_related("post", "post__author").order_by("-created_at", "-post_id")
+    return [rows.filter(owner=user), rows.filter(owner__isnull=True)]
+
+
+def visible_q(user):
+    """The visible_posts() rules as one filter, for posts looked up by id."""
+    return (
+        Q(visibility=Post.PUBLIC) |
+        Q(visibility=Post.FRIENDS, author__in=_friend_ids(user.id)) |
+        Q(author=user)
+    )
+
+
+def visible_posts(user):
+    """
+    Fallback for users without a built timeline: the posts `user` may see as three
+    index ranges, newest first (public posts, friends-only posts of friends, own
+    non-public posts), merged by KeysetPagination like timeline_for().
+    """
+    posts = Post.objects.select_related("author").order_by("-created_at", "-id")
+    return [
+        posts.filter(visibility=Post.PUBLIC),
+        posts.filter(visibility=Post.FRIENDS, author__in=_friend_ids(user.id)),
+        posts.filter(author=user).exclude(visibility=Post.PUBLIC),
+    ]
@@ -1,23 +1,25 @@
 # the views for the feed functionalities
 
-from rest_framework import generics, permissions, pagination
-from django.db.models import Q
+from rest_framework import generics, permissions
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from .models import Post
 from .serializers import PostSerializer
 from django.contrib.auth import get_user_model
 
-from apps.friendships.models import Friendship  # uses your friendships app
+from core.conditional import ConditionalGetMixin
+from core.pagination import KeysetPagination
+from core.rows import RowReadMixin
+from .ranking import ranked_post_ids
+from .watermarks import feed_watermark
+from .rows import POST_ROWS, TIMELINE_ROWS
+from .timeline import has_timeline, timeline_for, visible_posts, visible_q
 
 #import made for the update del teh post created
 from ..feed.permissions import IsAuthorOrReadOnly
 
 User = get_user_model()
 
-class StandardResultsPagination(pagination.PageNumberPagination):
-    page_size = 10
-    page_size_query_param = "page_size"
-    max_page_size = 50
-
 class CreatePostView(generics.CreateAPIView):
     queryset = Post.objects.all()
     serializer_class = PostSerializer
@@ -25,31 +27,89 @@ class CreatePostView(generics.CreateAPIView):
 
     # supports multipart/form-data for image uploads
 
-class FeedListView(generics.ListAPIView):
+class FeedListView(RowReadMixin, ConditionalGetMixin, generics.ListAPIView):
     serializer_class = PostSerializer
     permission_classes = [permissions.IsAuthenticated]
-    pagination_class = StandardResultsPagination
+    pagination_class = KeysetPagination
 
-    def get_queryset(self):
-        user = self.request.user
+    def get_validators(self, request, *args, **kwargs):
+        # friend list + post stamps of every author the feed can show (watermarks.py)
+        watermark = feed_watermark(request.user.id)
+        if watermark is None:
+            return None, None
+        if request.query_params.get("sort") == "top":
+            watermark += (tuple(ranked_post_ids(request.user.id)),)
+        return watermark, None
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get("sort") == "top":
+            return self.list_top(request)
+
+        # users with a built timeline read their materialized TimelineEntry range
+        if not has_timeline(request.user):
+            if self.use_rows():
+                page = self.paginate_queryset([POST_ROWS.queryset(qs) for qs in self.get_queryset()])
+                return self.get_paginated_response(POST_ROWS.data(page, self.get_serializer_context()))
+            return super().list(request, *args, **kwargs)
+
+        # timeline rows carry the post's created_at/id, so cursors work on both paths
+        self.cursor_ordering = ("-created_at", "-post_id")
+        if self.use_rows():
+            page = self.paginate_queryset([TIMELINE_ROWS.queryset(qs) for qs in timeline_for(request.user)])
+            return self.get_paginated_response(TIMELINE_ROWS.data(page, self.get_serializer_context()))
+        page = self.paginate_queryset(timeline_for(request.user))
+        serializer = self.get_serializer([entry.post for entry in page], many=True)
+        return self.get_paginated_response(serializer.data)
 
-        # friend IDs for the requesting user
-        friend_ids = Friendship.objects.filter(user=user).values_list("friend_id", flat=True)
+    def list_top(self, request):
+        """
+        ?sort=top: the viewer's ranked candidates (ranking.py), paged by ?offset= over
+        an order that is cached for a couple of minutes so pages don't overlap.
+        """
+        ids = ranked_post_ids(request.user.id)
+        size = self.paginator.get_page_size(request)
+        try:
+            offset = max(int(request.query_params.get("offset", 0)), 0)
+        except ValueError:
+            offset = 0
+        page_ids = ids[offset:offset + size]
+        # the cached order can outlive an unfriend or a visibility change: re-check each post
+        posts = Post.objects.filter(visible_q(request.user), pk__in=page_ids)
+        if self.use_rows():
+            rows = {row.id: row for row in POST_ROWS.queryset(posts)}
+            data = POST_ROWS.data([rows[pk] for pk in page_ids if pk in rows], self.get_serializer_context())
+        else:
+            posts = posts.select_related("author").in_bulk()
+            data = self.get_serializer([posts[pk] for pk in page_ids if pk in posts], many=True).data
 
-        # posts that are public OR (friends and posted by a friend) OR the user's own posts
-        qs = Post.objects.filter(
-            Q(visibility=Post.PUBLIC) |
-            Q(author__in=friend_ids, visibility=Post.FRIENDS) |
-            Q(author=user)
-        ).select_related("author").order_by("-created_at")
-        return qs
+        url = request.build_absolute_uri()
+        next_link = replace_query_param(url, "offset", offset + size) if offset + size < len(ids) else None
+        previous_link = None
+        if offset > 0:
+            previous_link = replace_query_param(url, "offset", offset - size) if offset > size else remove_query_param(url, "offset")
+        return Response({"next": next_link, "previous": previous_link, "results": data})
 
-class PostDetailView(generics.RetrieveUpdateDestroyAPIView):
+    def get_queryset(self):
+        # fallback for users whose timeline has not been backfilled yet: public posts,
+        # friends-only posts of friends and own posts, as index ranges KeysetPagination merges
+        return visible_posts(self.request.user)
+
+
+class PostDetailView(ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     """
-    GET: retrieve single post
+    GET: retrieve single post (304 while If-None-Match still matches)
     PUT/PATCH: update post (author only)
     DELETE: delete post (author only)
     """
     queryset = Post.objects.all().select_related("author")
     serializer_class = PostSerializer
-    permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsAuthorOrReadOnly]
\ No newline at end of file
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsAuthorOrReadOnly]
+
+    def get_validators(self, request, *args, **kwargs):
+        row = Post.objects.filter(pk=kwargs["pk"]).values_list("updated_at", "image_meta", "author__username").first()
+        if row is None:
+            return None, None
+        updated_at, meta, username = row
+        # renditions land via queryset.update() and renames touch another row, so
+        # updated_at can't stand in as Last-Modified: only the ETag is sent
+        return (updated_at, (meta or {}).get("status"), (meta or {}).get("source"), username), None
\ No newline at end of file
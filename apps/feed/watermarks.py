@@ -0,0 +1,36 @@
+# apps/feed/watermarks.py
+# version stamps that change whenever something a home feed can show changes, so
+# FeedListView can answer a conditional GET from the cache without reading posts
+from django.db import transaction
+
+from apps.friendships.cache import friend_array
+from core.cache import bump_version, get_versions
+
+PUBLIC_KEY = "feed:posts:public"
+
+# beyond this many friends the stamp read costs more than it saves; skip the check
+MAX_FRIENDS = 1000
+
+
+def author_key(user_id):
+    return f"feed:posts:author:{user_id}"
+
+
+def touch_post(post, was_public=False):
+    """A post was created, edited, re-rendered or deleted."""
+    keys = [author_key(post.author_id)]
+    if was_public or post.visibility == post.PUBLIC:
+        keys.append(PUBLIC_KEY)
+    bump_version(*keys)
+    # again after commit: a reader between the two may have paired the new stamp with old rows
+    transaction.on_commit(lambda: bump_version(*keys))
+
+
+def feed_watermark(user_id):
+    """Everything the viewer's feed depends on: their friend list and its authors' stamps."""
+    friends = friend_array(user_id)
+    if len(friends) > MAX_FRIENDS:
+        return None
+    keys = [PUBLIC_KEY, author_key(user_id), *(author_key(fid) for fid in friends)]
+    versions = get_versions(keys)
+    return friends.tobytes(), tuple(versions[k] for k in keys)
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+class FriendshipsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.friendships"
+
+    def ready(self):
+        # import signals so cache invalidation is registered
+        from . import signals  # noqa: F401
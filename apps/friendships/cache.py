@@ -0,0 +1,57 @@
+# apps/friendships/cache.py
+# cached adjacency lists: each user's friend ids as a packed, sorted int64 array
+# (8 bytes per friend in the cache instead of a pickled list of ints)
+from array import array
+
+from django.core.cache import cache
+
+from core.cache import DEFAULT_TIMEOUT
+from .models import Friendship
+
+
+def friend_ids_key(user_id):
+    return f"friends:{user_id}"
+
+
+def _pack(ids):
+    return array("q", sorted(ids)).tobytes()
+
+
+def _unpack(raw):
+    ids = array("q")
+    ids.frombytes(raw)
+    return ids
+
+
+def _load(user_ids):
+    adjacency = {uid: [] for uid in user_ids}
+    for uid, fid in Friendship.objects.filter(user_id__in=user_ids).values_list("user_id", "friend_id"):
+        adjacency[uid].append(fid)
+    return {uid: _pack(ids) for uid, ids in adjacency.items()}
+
+
+def friend_arrays(user_ids):
+    """Adjacency arrays for many users: one cache round trip, one query for the misses."""
+    user_ids = list(dict.fromkeys(user_ids))
+    keys = {friend_ids_key(uid): uid for uid in user_ids}
+    found = cache.get_many(keys)
+    packed = {keys[k]: raw for k, raw in found.items()}
+    missing = [uid for uid in user_ids if uid not in packed]
+    if missing:
+        loaded = _load(missing)
+        cache.set_many({friend_ids_key(uid): raw for uid, raw in loaded.items()}, DEFAULT_TIMEOUT)
+        packed.update(loaded)
+    return {uid: _unpack(packed[uid]) for uid in user_ids}
+
+
+def friend_array(user_id):
+    return friend_arrays([user_id])[user_id]
+
+
+def get_friend_ids(user_id):
+    return friend_array(user_id).tolist()
+
+
+def refresh_friend_ids(*user_ids):
+    """Rewrite the cached arrays of just these users from the database (write-through)."""
+    cache.set_many({friend_ids_key(uid): raw for uid, raw in _load(user_ids).items()}, DEFAULT_TIMEOUT)
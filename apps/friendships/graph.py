@@ -0,0 +1,118 @@
+# apps/friendships/graph.py
+# friend-graph queries answered from the cached adjacency arrays (cache.py) with
+# bisect / set intersections instead of SQL self-joins on friendships_friendship
+from bisect import bisect_left
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Q
+
+from .cache import friend_array, friend_arrays
+from .models import FriendRequest, Friendship
+
+# friends-of-friends only walks this many of the user's friends, so a hub account
+# costs one bounded get_many rather than thousands of adjacency reads
+SUGGESTION_FANOUT = 500
+
+
+def _contains(ids, value):
+    i = bisect_left(ids, value)
+    return i < len(ids) and ids[i] == value
+
+
+def are_friends(user_id, other_id):
+    return _contains(friend_array(user_id), other_id)
+
+
+def friends_among(user_id, user_ids):
+    """The ids in `user_ids` that are friends of `user_id` (one adjacency read)."""
+    friends = friend_array(user_id)
+    return {uid for uid in user_ids if _contains(friends, uid)}
+
+
+def mutual_friend_ids(user_id, other_id):
+    adjacency = friend_arrays([user_id, other_id])
+    return sorted(set(adjacency[user_id]).intersection(adjacency[other_id]))
+
+
+def relationship(user_id, other_id):
+    adjacency = friend_arrays([user_id, other_id])
+    mine, theirs = adjacency[user_id], adjacency[other_id]
+    return {
+        "is_friend": _contains(mine, other_id),
+        "mutual_count": len(set(mine).intersection(theirs)),
+    }
+
+
+SELF = "self"
+FRIENDS = "friends"
+OUTGOING = "outgoing_request"
+INCOMING = "incoming_request"
+NOT_FRIENDS = "not_friends"
+
+
+def statuses(viewer_id, user_ids):
+    """
+    Viewer -> user relationship for many users at once: friendship comes from the
+    cached adjacency array, pending requests from a single query over the rest.
+    """
+    friends = friend_array(viewer_id)
+    result = {}
+    pending = []
+    for uid in user_ids:
+        if uid == viewer_id:
+            result[uid] = SELF
+        elif _contains(friends, uid):
+            result[uid] = FRIENDS
+        else:
+            result[uid] = NOT_FRIENDS
+            pending.append(uid)
+    if pending:
+        requests = FriendRequest.objects.filter(
+            Q(from_user_id=viewer_id, to_user_id__in=pending) | Q(to_user_id=viewer_id, from_user_id__in=pending)
+        ).values_list("from_user_id", "to_user_id")
+        for from_id, to_id in requests:
+            # an outgoing request wins if both people asked
+            if from_id == viewer_id:
+                result[to_id] = OUTGOING
+            elif result[from_id] != OUTGOING:
+                result[from_id] = INCOMING
+    return result
+
+
+def suggestions(user_id, limit=20):
+    """Friends-of-friends ranked by how many friends they share with `user_id`."""
+    friends = friend_array(user_id)
+    if not friends:
+        return []
+    overlap = Counter()
+    for ids in friend_arrays(friends[:SUGGESTION_FANOUT]).values():
+        overlap.update(ids)
+
+    exclude = set(friends)
+    exclude.add(user_id)
+    # people with a pending request either way are already being handled
+    exclude.update(
+        fid if fid != user_id else tid
+        for fid, tid in FriendRequest.objects.filter(Q(from_user_id=user_id) | Q(to_user_id=user_id))
+        .values_list("from_user_id", "to_user_id")
+    )
+    ranked = sorted(
+        ((uid, n) for uid, n in overlap.items() if uid not in exclude),
+        key=lambda item: (-item[1], item[0]),
+    )
+    return ranked[:limit]
+
+
+def link(user_id, other_id):
+    """Create both directions of a friendship (the signals refresh both arrays on commit)."""
+    with transaction.atomic():
+        Friendship.objects.get_or_create(user_id=user_id, friend_id=other_id)
+        Friendship.objects.get_or_create(user_id=other_id, friend_id=user_id)
+
+
+def unlink(user_id, other_id):
+    with transaction.atomic():
+        Friendship.objects.filter(
+            Q(user_id=user_id, friend_id=other_id) | Q(user_id=other_id, friend_id=user_id)
+        ).delete()
@@ -1,6 +1,7 @@
 # apps/friendships/serializers.py
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from core.bulk import BulkActionSerializer, id_list
 from .models import FriendRequest, Friendship
 
 User = get_user_model()
@@ -20,3 +21,10 @@ class FriendshipSerializer(serializers.ModelSerializer):
     class Meta:
         model = Friendship
         fields = ("id", "friend", "created_at")
+
+
+class BulkFriendRequestSerializer(BulkActionSerializer):
+    actions = ("send", "cancel")
+    send = id_list()
+    cancel = id_list()
+    message = serializers.CharField(max_length=255, required=False, allow_blank=True, default="")
@@ -0,0 +1,16 @@
+# apps/friendships/signals.py
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .cache import refresh_friend_ids
+from .models import Friendship
+
+
+@receiver(post_save, sender=Friendship)
+@receiver(post_delete, sender=Friendship)
+def refresh_adjacency(sender, instance, **kwargs):
+    # rewrite only this user's cached array once the edge is committed; everyone
+    # else's adjacency (and every friends-of-friends answer built from it) stays warm
+    user_id = instance.user_id
+    transaction.on_commit(lambda: refresh_friend_ids(user_id))
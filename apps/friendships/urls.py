@@ -5,6 +5,8 @@ from .views import (
     IncomingFriendRequestsList, OutgoingFriendRequestsList,
     AcceptFriendRequestView, DeclineFriendRequestView,
     FriendsListView, UnfriendView,
+    RelationshipView, MutualFriendsView, FriendSuggestionsView,
+    BulkFriendRequestView,
 )
 
 app_name = "friendships"
@@ -12,10 +14,14 @@ app_name = "friendships"
 urlpatterns = [
     path("send/", SendFriendRequestView.as_view(), name="send-request"),
     path("cancel/<int:request_id>/", CancelFriendRequestView.as_view(), name="cancel-request"),
+    path("requests/bulk/", BulkFriendRequestView.as_view(), name="bulk-requests"),
     path("incoming/", IncomingFriendRequestsList.as_view(), name="incoming-requests"),
     path("outgoing/", OutgoingFriendRequestsList.as_view(), name="outgoing-requests"),
     path("accept/<int:request_id>/", AcceptFriendRequestView.as_view(), name="accept-request"),
     path("decline/<int:request_id>/", DeclineFriendRequestView.as_view(), name="decline-request"),
     path("friends/", FriendsListView.as_view(), name="friends-list"),
     path("unfriend/<int:friend_id>/", UnfriendView.as_view(), name="unfriend"),
+    path("relationship/<int:user_id>/", RelationshipView.as_view(), name="relationship"),
+    path("mutual/<int:user_id>/", MutualFriendsView.as_view(), name="mutual-friends"),
+    path("suggestions/", FriendSuggestionsView.as_view(), name="suggestions"),
 ]
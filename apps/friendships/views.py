@@ -6,8 +6,13 @@ from django.shortcuts import get_object_or_404
 from django.db import IntegrityError, transaction
 from django.contrib.auth import get_user_model
 
+from apps.accounts.cache import get_user_briefs
+from . import graph
 from .models import FriendRequest, Friendship
-from .serializers import FriendRequestSerializer, FriendshipSerializer
+from .serializers import FriendRequestSerializer, FriendshipSerializer, BulkFriendRequestSerializer
+from apps.notifications.models import Notification
+from apps.notifications.services import notify
+from core.bulk import per_item
 
 
 
@@ -39,6 +44,53 @@ class SendFriendRequestView(APIView):
         return Response(FriendRequestSerializer(fr).data, status=status.HTTP_201_CREATED)
 
 
+class BulkFriendRequestView(APIView):
+    """
+    POST {"send": [user ids], "cancel": [user ids], "message": ""} -> per-user results:
+      send:   sent | already_sent | already_friends | self | not_found
+      cancel: canceled | not_sent
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = BulkFriendRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        send_ids, cancel_ids = data["send"], data["cancel"]
+        me = request.user.id
+
+        with transaction.atomic():
+            found = set(User.objects.filter(pk__in=send_ids, is_active=True).values_list("pk", flat=True))
+            pending = set(
+                FriendRequest.objects.filter(from_user_id=me, to_user_id__in=send_ids + cancel_ids).values_list("to_user_id", flat=True)
+            )
+            friends = graph.friends_among(me, send_ids)
+            send_status = {}
+            for uid in send_ids:
+                if uid == me:
+                    send_status[uid] = "self"
+                elif uid not in found:
+                    send_status[uid] = "not_found"
+                elif uid in friends:
+                    send_status[uid] = "already_friends"
+                elif uid in pending:
+                    send_status[uid] = "already_sent"
+                else:
+                    send_status[uid] = "sent"
+            new = [uid for uid in send_ids if send_status[uid] == "sent"]
+            FriendRequest.objects.bulk_create(
+                [FriendRequest(from_user_id=me, to_user_id=uid, message=data["message"]) for uid in new], ignore_conflicts=True
+            )
+            FriendRequest.objects.filter(from_user_id=me, to_user_id__in=[uid for uid in cancel_ids if uid in pending]).delete()
+
+            # bulk_create skips post_save, so notify the way notifications/signals.py would
+            for uid in new:
+                notify([uid], Notification.FRIEND_REQUEST, uid, me)
+
+        cancel_status = {uid: "canceled" if uid in pending else "not_sent" for uid in cancel_ids}
+        return Response({"send": per_item(send_ids, send_status), "cancel": per_item(cancel_ids, cancel_status)})
+
+
 class CancelFriendRequestView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
@@ -70,9 +122,8 @@ class AcceptFriendRequestView(APIView):
     def post(self, request, request_id):
         fr = get_object_or_404(FriendRequest, pk=request_id, to_user=request.user)
         with transaction.atomic():
-            # create both sides of friendship
-            Friendship.objects.get_or_create(user=fr.from_user, friend=fr.to_user)
-            Friendship.objects.get_or_create(user=fr.to_user, friend=fr.from_user)
+            # create both sides of friendship; both cached adjacency arrays are rewritten on commit
+            graph.link(fr.from_user_id, fr.to_user_id)
             fr.delete()
         return Response({"detail": "Friend request accepted."}, status=status.HTTP_200_OK)
 
@@ -99,7 +150,41 @@ class UnfriendView(APIView):
 
     def post(self, request, friend_id):
         friend = get_object_or_404(User, pk=friend_id)
-        Friendship.objects.filter(user=request.user, friend=friend).delete()
-        Friendship.objects.filter(user=friend, friend=request.user).delete()
+        graph.unlink(request.user.id, friend.id)
         return Response({"detail": "Unfriended."}, status=status.HTTP_200_OK)
 
+
+def _limit(request, default=20, maximum=100):
+    try:
+        return max(1, min(int(request.query_params.get("limit", default)), maximum))
+    except ValueError:
+        return default
+
+
+class RelationshipView(APIView):
+    """Are we friends, and how many friends do we share."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, user_id):
+        return Response({"user": user_id, **graph.relationship(request.user.id, user_id)})
+
+
+class MutualFriendsView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, user_id):
+        ids = graph.mutual_friend_ids(request.user.id, user_id)
+        page = ids[:_limit(request)]
+        briefs = get_user_briefs(page)
+        return Response({"count": len(ids), "results": [briefs[uid] for uid in page if briefs[uid]]})
+
+
+class FriendSuggestionsView(APIView):
+    """Friends of friends, most shared friends first."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        ranked = graph.suggestions(request.user.id, _limit(request))
+        briefs = get_user_briefs([uid for uid, _ in ranked])
+        return Response([{"user": briefs[uid], "mutual_count": mutual} for uid, mutual in ranked if briefs[uid]])
+
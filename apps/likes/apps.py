@@ -5,5 +5,5 @@ class LikesConfig(AppConfig):
     name = "apps.likes"
 
     def ready(self):
-        # import signals here if needed
-        pass
+        # response-cache invalidation for anonymous reads
+        from . import signals  # noqa: F401
@@ -0,0 +1,7 @@
+# apps/likes/cache.py
+# anonymous response-cache tag of a post's like list (bumped in signals.py)
+from core.response_cache import tag
+
+
+def likes_tag(post_id):
+    return tag("post", post_id, "likes")
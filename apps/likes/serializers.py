@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from core.bulk import BulkActionSerializer, id_list
 from .models import Like
 from django.contrib.auth import get_user_model
 
@@ -11,3 +12,9 @@ class LikeSerializer(serializers.ModelSerializer):
         model = Like
         fields = ("id", "post", "user", "created_at")
         read_only_fields = ("id", "user", "created_at")
+
+
+class BulkLikeSerializer(BulkActionSerializer):
+    actions = ("like", "unlike")
+    like = id_list()
+    unlike = id_list()
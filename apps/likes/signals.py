@@ -0,0 +1,13 @@
+# apps/likes/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from core.response_cache import bump_tags
+from .cache import likes_tag
+from .models import Like
+
+
+@receiver(post_save, sender=Like)
+@receiver(post_delete, sender=Like)
+def bump_likes_list(sender, instance, **kwargs):
+    bump_tags(likes_tag(instance.post_id))
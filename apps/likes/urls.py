@@ -1,5 +1,5 @@
 from django.urls import path
-from .views import LikePostView, UnlikePostView, PostLikesListView
+from .views import LikePostView, UnlikePostView, PostLikesListView, BulkLikeView
 
 app_name = "likes"
 
@@ -7,4 +7,5 @@ urlpatterns = [
     path("posts/<int:post_id>/like/", LikePostView.as_view(), name="like-post"),
     path("posts/<int:post_id>/unlike/", UnlikePostView.as_view(), name="unlike-post"),
     path("posts/<int:post_id>/likes/", PostLikesListView.as_view(), name="post-likes"),
+    path("posts/bulk/", BulkLikeView.as_view(), name="bulk-like"),
 ]
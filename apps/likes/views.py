@@ -2,10 +2,16 @@ from rest_framework import status, permissions, generics
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from .models import Like
-from .serializers import LikeSerializer
+from .serializers import LikeSerializer, BulkLikeSerializer
 from apps.feed.models import Post
+from apps.notifications.models import Notification
+from apps.notifications.services import notify
 from django.shortcuts import get_object_or_404
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
+from core.bulk import per_item
+from core.response_cache import PublicResponseCacheMixin, bump_tags
+from .cache import likes_tag
+from core.pagination import KeysetPagination
 
 class LikePostView(APIView):
     permission_classes = [permissions.IsAuthenticated]
@@ -28,12 +34,53 @@ class UnlikePostView(APIView):
             return Response({"detail": "Unliked."}, status=status.HTTP_200_OK)
         return Response({"detail": "Not liked."}, status=status.HTTP_400_BAD_REQUEST)
 
-class PostLikesListView(generics.ListAPIView):
+class BulkLikeView(APIView):
+    """
+    POST {"like": [post ids], "unlike": [post ids]} -> per-post results, in one transaction:
+      like:   liked | already_liked | not_found
+      unlike: unliked | not_liked
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = BulkLikeSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        like_ids, unlike_ids = serializer.validated_data["like"], serializer.validated_data["unlike"]
+        user = request.user
+
+        with transaction.atomic():
+            authors = dict(Post.objects.filter(pk__in=like_ids).values_list("pk", "author_id"))
+            liked = set(Like.objects.filter(user=user, post_id__in=like_ids + unlike_ids).values_list("post_id", flat=True))
+            new = [pk for pk in like_ids if pk in authors and pk not in liked]
+            # ignore_conflicts: a concurrent single like of the same post is not an error
+            Like.objects.bulk_create([Like(post_id=pk, user=user) for pk in new], ignore_conflicts=True)
+            gone = [pk for pk in unlike_ids if pk in liked]
+            Like.objects.filter(user=user, post_id__in=gone).delete()
+
+            # bulk_create skips post_save: notify and bump cache tags the way the signals would
+            for pk in new:
+                notify([authors[pk]], Notification.POST_LIKE, pk, user.id)
+            if new:
+                bump_tags(*[likes_tag(pk) for pk in new])
+
+        like_status = {pk: "not_found" if pk not in authors else "already_liked" if pk in liked else "liked" for pk in like_ids}
+        unlike_status = {pk: "unliked" if pk in liked else "not_liked" for pk in unlike_ids}
+        return Response({"like": per_item(like_ids, like_status), "unlike": per_item(unlike_ids, unlike_status)})
+
+
+class PostLikesListView(PublicResponseCacheMixin, generics.ListAPIView):
     """
     List likes on a post (optionally show users who liked)
     """
     serializer_class = LikeSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = KeysetPagination
+
+    def public_cache_tags(self, request, *args, **kwargs):
+        post_id = kwargs["post_id"]
+        if Post.objects.filter(pk=post_id, visibility=Post.PUBLIC).exists():
+            return [likes_tag(post_id)]
+        return None
 
     def get_queryset(self):
         post_id = self.kwargs.get("post_id")
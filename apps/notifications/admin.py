@@ -0,0 +1,9 @@
+from django.contrib import admin
+from .models import Notification
+
+@admin.register(Notification)
+class NotificationAdmin(admin.ModelAdmin):
+    list_display = ("id", "recipient", "verb", "target_id", "actor_count", "is_read", "updated_at")
+    list_filter = ("verb", "is_read")
+    search_fields = ("recipient__username",)
+    readonly_fields = ("created_at", "updated_at")
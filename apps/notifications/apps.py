@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+class NotificationsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.notifications"
+
+    def ready(self):
+        # import signals so likes / comments / requests record notifications
+        from . import signals  # noqa: F401
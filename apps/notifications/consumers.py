@@ -0,0 +1,8 @@
+# apps/notifications/consumers.py
+from core.consumers import UserStreamConsumer
+from .services import STREAM
+
+
+class NotificationConsumer(UserStreamConsumer):
+    """Read-only socket: {"type": "notification", ...} and {"type": "unread", ...} frames."""
+    stream = STREAM
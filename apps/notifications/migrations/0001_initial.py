@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-17 13:01
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Notification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('verb', models.CharField(choices=[('post_like', 'Post like'), ('post_comment', 'Post comment'), ('community_post_like', 'Community post like'), ('community_post_comment', 'Community post comment'), ('friend_request', 'Friend request'), ('join_request', 'Join request')], max_length=32)),
+                ('target_id', models.PositiveBigIntegerField()),
+                ('actor_ids', models.JSONField(default=list)),
+                ('actor_count', models.PositiveIntegerField(default=1)),
+                ('is_read', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('actor', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('recipient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-updated_at', '-id'],
+                'indexes': [models.Index(fields=['recipient', '-updated_at', '-id'], name='notification_recent_idx'), models.Index(condition=models.Q(('is_read', False)), fields=['recipient'], name='notification_unread_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('is_read', False)), fields=('recipient', 'verb', 'target_id'), name='notification_open_per_target')],
+            },
+        ),
+    ]
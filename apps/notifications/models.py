@@ -0,0 +1,61 @@
+# apps/notifications/models.py
+from django.db import models
+from django.conf import settings
+
+User = settings.AUTH_USER_MODEL
+
+
+class Notification(models.Model):
+    """
+    One row per (recipient, verb, target) while unread.
+
+    Repeated events on the same target are coalesced into the open row
+    ("alice and 4 others liked your post") instead of adding new rows; once the
+    row is read the next event opens a fresh one.
+    """
+    POST_LIKE = "post_like"
+    POST_COMMENT = "post_comment"
+    COMMUNITY_POST_LIKE = "community_post_like"
+    COMMUNITY_POST_COMMENT = "community_post_comment"
+    FRIEND_REQUEST = "friend_request"
+    JOIN_REQUEST = "join_request"
+    VERB_CHOICES = [
+        (POST_LIKE, "Post like"),
+        (POST_COMMENT, "Post comment"),
+        (COMMUNITY_POST_LIKE, "Community post like"),
+        (COMMUNITY_POST_COMMENT, "Community post comment"),
+        (FRIEND_REQUEST, "Friend request"),
+        (JOIN_REQUEST, "Join request"),
+    ]
+
+    recipient = models.ForeignKey(User, related_name="notifications", on_delete=models.CASCADE)
+    verb = models.CharField(max_length=32, choices=VERB_CHOICES)
+    # post / community post id; community id for join requests; recipient id for friend requests
+    target_id = models.PositiveBigIntegerField()
+    # latest actor, plus the most recent distinct actors (newest first) for display and dedupe
+    actor = models.ForeignKey(User, related_name="+", null=True, on_delete=models.SET_NULL)
+    actor_ids = models.JSONField(default=list)
+    actor_count = models.PositiveIntegerField(default=1)
+    is_read = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # bumped on every coalesced event so the list sorts by latest activity
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-updated_at", "-id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["recipient", "verb", "target_id"],
+                condition=models.Q(is_read=False),
+                name="notification_open_per_target",
+            ),
+        ]
+        indexes = [
+            # notification list, latest activity first (keyset on updated_at, id)
+            models.Index(fields=["recipient", "-updated_at", "-id"], name="notification_recent_idx"),
+            # unread count
+            models.Index(fields=["recipient"], condition=models.Q(is_read=False), name="notification_unread_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.verb} on {self.target_id} for {self.recipient_id} (x{self.actor_count})"
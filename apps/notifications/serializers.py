@@ -0,0 +1,40 @@
+# apps/notifications/serializers.py
+from rest_framework import serializers
+
+from apps.accounts.cache import get_user_brief
+from .models import Notification
+
+VERB_TEXT = {
+    Notification.POST_LIKE: "liked your post",
+    Notification.POST_COMMENT: "commented on your post",
+    Notification.COMMUNITY_POST_LIKE: "liked your community post",
+    Notification.COMMUNITY_POST_COMMENT: "commented on your community post",
+    Notification.FRIEND_REQUEST: "sent you a friend request",
+    Notification.JOIN_REQUEST: "asked to join your community",
+}
+# actors shown per notification ("alice, bob and 3 others")
+ACTOR_PREVIEW = 3
+
+
+class NotificationSerializer(serializers.ModelSerializer):
+    actors = serializers.SerializerMethodField()
+    text = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Notification
+        fields = ("id", "verb", "target_id", "actors", "actor_count", "text", "is_read", "created_at", "updated_at")
+        read_only_fields = fields
+
+    def get_actors(self, obj):
+        # cached user cards, newest actor first
+        return [card for card in (get_user_brief(uid) for uid in obj.actor_ids[:ACTOR_PREVIEW]) if card]
+
+    def get_text(self, obj):
+        cards = self.get_actors(obj)
+        name = cards[0]["display_name"] if cards else "Someone"
+        others = obj.actor_count - 1
+        if others == 1:
+            name = f"{name} and 1 other"
+        elif others > 1:
+            name = f"{name} and {others} others"
+        return f"{name} {VERB_TEXT.get(obj.verb, obj.verb)}"
@@ -0,0 +1,92 @@
+# apps/notifications/services.py
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from core.broker import publish
+from core.cache import invalidate, read_through
+from .models import Notification
+
+STREAM = "notifications"
+# distinct recent actors kept on a row: repeats by any of them don't bump actor_count
+ACTOR_HISTORY = 50
+
+
+def unread_key(user_id):
+    return f"notif:unread:{user_id}"
+
+
+def unread_count(user_id):
+    return read_through(
+        unread_key(user_id),
+        lambda: Notification.objects.filter(recipient_id=user_id, is_read=False).count(),
+    )
+
+
+def _coalesce(recipient_id, verb, target_id, actor_id):
+    note = (
+        Notification.objects.select_for_update()
+        .filter(recipient_id=recipient_id, verb=verb, target_id=target_id, is_read=False)
+        .first()
+    )
+    if note is None:
+        try:
+            # savepoint: a concurrent insert for the same target trips the partial unique constraint
+            with transaction.atomic():
+                return Notification.objects.create(
+                    recipient_id=recipient_id, verb=verb, target_id=target_id,
+                    actor_id=actor_id, actor_ids=[actor_id],
+                )
+        except IntegrityError:
+            note = Notification.objects.select_for_update().get(
+                recipient_id=recipient_id, verb=verb, target_id=target_id, is_read=False
+            )
+    if actor_id not in note.actor_ids:
+        # repeats by a recent actor (like / unlike / like) only refresh the row
+        note.actor_count = F("actor_count") + 1
+    note.actor_id = actor_id
+    note.actor_ids = ([actor_id] + [a for a in note.actor_ids if a != actor_id])[:ACTOR_HISTORY]
+    note.save(update_fields=["actor", "actor_ids", "actor_count", "updated_at"])
+    note.refresh_from_db(fields=["actor_count"])
+    return note
+
+
+def notify(recipient_ids, verb, target_id, actor_id):
+    """
+    Record `actor_id` doing `verb` on `target_id` for each recipient (the actor
+    never notifies themselves) and push the coalesced rows after commit.
+    """
+    from .serializers import NotificationSerializer
+
+    recipient_ids = [r for r in dict.fromkeys(recipient_ids) if r and r != actor_id]
+    if not recipient_ids:
+        return
+    with transaction.atomic():
+        notes = [_coalesce(r, verb, target_id, actor_id) for r in recipient_ids]
+        invalidate(*[unread_key(r) for r in recipient_ids])
+
+        def push():
+            for note in notes:
+                payload = {
+                    "type": "notification",
+                    "notification": dict(NotificationSerializer(note).data),
+                    "unread": unread_count(note.recipient_id),
+                }
+                publish(STREAM, [note.recipient_id], payload)
+
+        transaction.on_commit(push)
+
+
+def mark_read(user_id, ids=None):
+    """Mark the user's notifications read (all of them when `ids` is None)."""
+    qs = Notification.objects.filter(recipient_id=user_id, is_read=False)
+    if ids is not None:
+        qs = qs.filter(pk__in=ids)
+    with transaction.atomic():
+        updated = qs.update(is_read=True)
+        if updated:
+            invalidate(unread_key(user_id))
+            # keep the user's other tabs / devices in sync
+            transaction.on_commit(lambda: publish(
+                STREAM, [user_id], {"type": "unread", "unread": unread_count(user_id)}
+            ))
+    return updated
@@ -0,0 +1,69 @@
+# apps/notifications/signals.py
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.comments.models import Comment
+from apps.communities.models import CommunityPost, JoinRequest, Membership, PostComment, PostLike
+from apps.feed.models import Post
+from apps.friendships.models import FriendRequest
+from apps.likes.models import Like
+from .models import Notification
+from .services import notify
+
+
+def _post_author(post_id):
+    return Post.objects.filter(pk=post_id).values_list("author_id", flat=True).first()
+
+
+def _community_post_author(post_id):
+    return CommunityPost.objects.filter(pk=post_id).values_list("author_id", flat=True).first()
+
+
+@receiver(post_save, sender=Like)
+def notify_post_like(sender, instance, created, **kwargs):
+    if created:
+        notify([_post_author(instance.post_id)], Notification.POST_LIKE, instance.post_id, instance.user_id)
+
+
+@receiver(post_save, sender=Comment)
+def notify_post_comment(sender, instance, created, **kwargs):
+    if created:
+        notify([_post_author(instance.post_id)], Notification.POST_COMMENT, instance.post_id, instance.author_id)
+
+
+@receiver(post_save, sender=PostLike)
+def notify_community_post_like(sender, instance, created, **kwargs):
+    if created:
+        notify(
+            [_community_post_author(instance.post_id)],
+            Notification.COMMUNITY_POST_LIKE, instance.post_id, instance.user_id,
+        )
+
+
+@receiver(post_save, sender=PostComment)
+def notify_community_post_comment(sender, instance, created, **kwargs):
+    if created:
+        notify(
+            [_community_post_author(instance.post_id)],
+            Notification.COMMUNITY_POST_COMMENT, instance.post_id, instance.user_id,
+        )
+
+
+@receiver(post_save, sender=FriendRequest)
+def notify_friend_request(sender, instance, created, **kwargs):
+    if created:
+        # all pending requests to a user coalesce into one row, so the target is the recipient
+        notify([instance.to_user_id], Notification.FRIEND_REQUEST, instance.to_user_id, instance.from_user_id)
+
+
+@receiver(post_save, sender=JoinRequest)
+def notify_join_request(sender, instance, created, **kwargs):
+    if not created:
+        return
+    # whoever can approve: the creator and approved admins
+    admins = list(
+        Membership.objects.filter(community_id=instance.community_id, role=Membership.ADMIN, is_approved=True)
+        .values_list("user_id", flat=True)
+    )
+    creator = instance.community.created_by_id
+    notify([creator] + admins, Notification.JOIN_REQUEST, instance.community_id, instance.user_id)
@@ -0,0 +1,12 @@
+# apps/notifications/urls.py
+from django.urls import path
+from .views import NotificationListView, UnreadCountView, MarkReadView, notification_stream
+
+app_name = "notifications"
+
+urlpatterns = [
+    path("", NotificationListView.as_view(), name="notification-list"),
+    path("unread/", UnreadCountView.as_view(), name="unread"),
+    path("read/", MarkReadView.as_view(), name="mark-read"),
+    path("stream/", notification_stream, name="stream"),
+]
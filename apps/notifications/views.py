@@ -0,0 +1,116 @@
+# apps/notifications/views.py
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from channels.db import database_sync_to_async
+from channels.layers import get_channel_layer
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework import generics, permissions, status
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.accounts.authentication import StatelessJWTAuthentication
+from core.broker import user_group
+from core.pagination import KeysetPagination
+from . import services
+from .models import Notification
+from .serializers import NotificationSerializer
+
+# comment line sent on idle SSE connections so proxies keep them open
+HEARTBEAT_SECONDS = 25
+
+
+class NotificationListView(generics.ListAPIView):
+    """Latest activity first; coalesced rows move to the top when they get new events."""
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = NotificationSerializer
+    pagination_class = KeysetPagination
+    cursor_ordering = ("-updated_at", "-id")
+
+    def get_queryset(self):
+        qs = Notification.objects.filter(recipient=self.request.user)
+        if self.request.query_params.get("unread") in ("1", "true"):
+            qs = qs.filter(is_read=False)
+        return qs
+
+
+class UnreadCountView(APIView):
+    """Badge count, served from the cache (invalidated on every write)."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        return Response({"unread": services.unread_count(request.user.pk)})
+
+
+class MarkReadView(APIView):
+    """POST {"ids": [..]} marks those notifications read; no ids marks everything read."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        ids = request.data.get("ids")
+        if ids is not None:
+            if not isinstance(ids, list) or not all(isinstance(i, int) for i in ids):
+                return Response({"detail": "ids must be a list of integers."}, status=status.HTTP_400_BAD_REQUEST)
+        updated = services.mark_read(request.user.pk, ids)
+        return Response({"updated": updated, "unread": services.unread_count(request.user.pk)})
+
+
+def _sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def notification_stream(request):
+    """
+    Server-Sent Events feed of the user's notifications (needs the ASGI server).
+
+    A plain async view, so it authenticates like DRF's defaults by hand: the session,
+    then `Authorization: Bearer <access token>` (fetch-based clients; a browser
+    EventSource can't send headers and relies on the session cookie).
+
+    The connection parks on the channel layer instead of polling: it wakes only when
+    services.notify / mark_read publish to this user, or for the idle heartbeat.
+    The first event is the current unread count.
+    """
+    user = await request.auser()
+    if not user.is_authenticated:
+        try:
+            # stateless: signature + revocation check in the cache, no DB read
+            found = await sync_to_async(StatelessJWTAuthentication().authenticate)(request)
+        except AuthenticationFailed as exc:
+            detail = exc.detail if isinstance(exc.detail, dict) else {"detail": exc.detail}
+            response = JsonResponse(detail, status=401)
+            response["WWW-Authenticate"] = StatelessJWTAuthentication().authenticate_header(request)
+            return response
+        if found is None:
+            return JsonResponse({"detail": "Authentication credentials were not provided."}, status=403)
+        user = found[0]
+
+    layer = get_channel_layer()
+    group = user_group(services.STREAM, user.pk)
+
+    async def events():
+        channel = await layer.new_channel()
+        await layer.group_add(group, channel)
+        try:
+            unread = await database_sync_to_async(services.unread_count)(user.pk)
+            yield _sse("unread", {"type": "unread", "unread": unread})
+            while True:
+                try:
+                    message = await asyncio.wait_for(layer.receive(channel), HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    # re-joining refreshes the layer's group expiry for long-lived streams
+                    await layer.group_add(group, channel)
+                    yield ": keep-alive\n\n"
+                    continue
+                payload = message["payload"]
+                yield _sse(payload["type"], payload)
+        finally:
+            await layer.group_discard(group, channel)
+
+    response = StreamingHttpResponse(events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # stop nginx from buffering the stream
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-17 13:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='avatar_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -18,6 +18,8 @@ class Profile(models.Model):
     dob = models.DateField(null=True, blank=True)
     gender = models.CharField(max_length=1, choices=GENDER_CHOICES, blank=True)
     avatar = models.ImageField(upload_to="avatars/", null=True, blank=True)
+    # renditions + dimensions written by the image worker (core/images.py)
+    avatar_meta = models.JSONField(default=dict, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -0,0 +1,28 @@
+# apps/profiles/serializers.py
+from rest_framework import serializers
+
+from apps.accounts.cache import get_user_brief
+from core.images import RenditionSerializerMixin
+from .models import Profile
+
+
+class PublicProfileSerializer(RenditionSerializerMixin, serializers.ModelSerializer):
+    """Someone else's profile: age instead of the date of birth, plus how the viewer relates to them."""
+    user = serializers.SerializerMethodField()
+    age = serializers.ReadOnlyField()
+    relationship = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Profile
+        fields = ("user", "bio", "gender", "avatar", "age", "relationship")
+    rendition_fields = {"avatar": ("avatar_meta", 320)}
+
+    def get_user(self, obj):
+        return get_user_brief(obj.user_id)
+
+    def get_relationship(self, obj):
+        return self.context.get("relationship")
+
+
+class RelationshipQuerySerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), min_length=1, max_length=100)
@@ -0,0 +1,10 @@
+# apps/profiles/urls.py
+from django.urls import path
+from .views import ProfileDetailView, RelationshipStatusView
+
+app_name = "profiles"
+
+urlpatterns = [
+    path("relationships/", RelationshipStatusView.as_view(), name="relationships"),
+    path("<int:user_id>/", ProfileDetailView.as_view(), name="profile-detail"),
+]
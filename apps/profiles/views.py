@@ -0,0 +1,50 @@
+# apps/profiles/views.py
+from django.contrib.auth import get_user_model
+from django.shortcuts import get_object_or_404
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.friendships import graph
+from .models import Profile
+from .serializers import PublicProfileSerializer, RelationshipQuerySerializer
+
+User = get_user_model()
+
+
+class ProfileDetailView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, user_id):
+        profile = Profile.objects.filter(user_id=user_id, user__is_active=True).first()
+        if profile is None:
+            # accounts from before profiles were created on signup: show an empty one
+            profile = Profile(user=get_object_or_404(User, pk=user_id, is_active=True))
+        relationship = graph.statuses(request.user.id, [user_id])[user_id]
+        serializer = PublicProfileSerializer(profile, context={"request": request, "relationship": relationship})
+        return Response(serializer.data)
+
+
+class RelationshipStatusView(APIView):
+    """
+    Relationship of the viewer to up to 100 users, for friend buttons on search
+    results, member lists and comment threads:
+
+        GET  ?ids=3,7,12
+        POST {"ids": [3, 7, 12]}
+        -> {"3": "friends", "7": "incoming_request", "12": "not_friends"}
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        raw = request.query_params.get("ids", "")
+        return self._respond(request, {"ids": [i for i in raw.split(",") if i.strip()]})
+
+    def post(self, request):
+        return self._respond(request, request.data)
+
+    def _respond(self, request, data):
+        serializer = RelationshipQuerySerializer(data=data)
+        serializer.is_valid(raise_exception=True)
+        ids = list(dict.fromkeys(serializer.validated_data["ids"]))
+        return Response({str(uid): status for uid, status in graph.statuses(request.user.id, ids).items()})
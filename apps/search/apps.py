@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+class SearchConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.search"
+
+    def ready(self):
+        # import signals so the index follows post / community / user changes
+        from . import signals  # noqa: F401
@@ -0,0 +1,95 @@
+# apps/search/backends.py
+# vendor-specific full-text queries: FTS5 + bm25() on SQLite, tsvector + ts_rank_cd on PostgreSQL.
+# Both return (entry id, score) with *lower score = better*, so the cursor logic is shared.
+import re
+
+from django.db import connection
+
+from .models import SearchEntry
+
+TABLE = SearchEntry._meta.db_table
+FTS_TABLE = "search_fts"
+MAX_TERMS = 8
+SNIPPET_TOKENS = 16
+# control characters as highlight marks; serializers escape the text, then turn them into <b></b>
+MARK_START, MARK_END = "\x02", "\x03"
+
+
+def terms(text):
+    """Words of the query (punctuation and operators dropped), at most MAX_TERMS."""
+    return re.findall(r"\w+", (text or "").lower())[:MAX_TERMS]
+
+
+class SQLiteBackend:
+    @staticmethod
+    def match_expr(words):
+        # every word must match; the last one as a prefix for type-ahead
+        return " ".join(f'"{w}"' for w in words[:-1]) + f' "{words[-1]}"*'
+
+    def search(self, words, where, params, after, limit):
+        sql = (
+            f"WITH hits AS ("
+            f"  SELECT rowid AS id, bm25({FTS_TABLE}, 10.0, 1.0) AS score"
+            f"  FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s"
+            f") SELECT h.id, h.score FROM hits h JOIN {TABLE} e ON e.id = h.id"
+            f" WHERE ({where})"
+        )
+        args = [self.match_expr(words)] + params
+        if after is not None:
+            sql += " AND (h.score > %s OR (h.score = %s AND h.id > %s))"
+            args += [after[0], after[0], after[1]]
+        sql += " ORDER BY h.score, h.id LIMIT %s"
+        with connection.cursor() as cursor:
+            cursor.execute(sql, args + [limit])
+            return cursor.fetchall()
+
+    def snippets(self, words, ids):
+        if not ids:
+            return {}
+        marks = ", ".join(["%s"] * len(ids))
+        sql = (
+            f"SELECT rowid, snippet({FTS_TABLE}, 1, %s, %s, '…', {SNIPPET_TOKENS})"
+            f" FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s AND rowid IN ({marks})"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [MARK_START, MARK_END, self.match_expr(words)] + list(ids))
+            return dict(cursor.fetchall())
+
+
+class PostgresBackend:
+    @staticmethod
+    def tsquery(words):
+        return " & ".join(words[:-1] + [f"{words[-1]}:*"])
+
+    def search(self, words, where, params, after, limit):
+        sql = (
+            f"SELECT id, score FROM ("
+            f"  SELECT e.id, -ts_rank_cd(e.document, to_tsquery('simple', %s))::float8 AS score"
+            f"  FROM {TABLE} e WHERE e.document @@ to_tsquery('simple', %s) AND ({where})"
+            f") hits"
+        )
+        query = self.tsquery(words)
+        args = [query, query] + params
+        if after is not None:
+            sql += " WHERE score > %s OR (score = %s AND id > %s)"
+            args += [after[0], after[0], after[1]]
+        sql += " ORDER BY score, id LIMIT %s"
+        with connection.cursor() as cursor:
+            cursor.execute(sql, args + [limit])
+            return cursor.fetchall()
+
+    def snippets(self, words, ids):
+        if not ids:
+            return {}
+        sql = (
+            f"SELECT id, ts_headline('simple', body, to_tsquery('simple', %s),"
+            f" %s) FROM {TABLE} WHERE id = ANY(%s)"
+        )
+        options = f"StartSel={MARK_START}, StopSel={MARK_END}, MaxWords={SNIPPET_TOKENS * 2}, MinWords={SNIPPET_TOKENS // 2}"
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [self.tsquery(words), options, list(ids)])
+            return dict(cursor.fetchall())
+
+
+def get_backend():
+    return PostgresBackend() if connection.vendor == "postgresql" else SQLiteBackend()
@@ -0,0 +1,74 @@
+# apps/search/index.py
+# builds SearchEntry rows from the source models and writes them with one upsert
+from .models import SearchEntry
+
+BATCH_SIZE = 500
+UPDATE_FIELDS = ["title", "body", "visibility", "author_id", "community_id", "slug", "created_at"]
+
+
+def post_entry(post):
+    return SearchEntry(
+        kind=SearchEntry.POST, object_id=post.pk, body=post.text,
+        visibility=post.visibility, author_id=post.author_id, created_at=post.created_at,
+    )
+
+
+def community_post_entry(post, community):
+    return SearchEntry(
+        kind=SearchEntry.COMMUNITY_POST, object_id=post.pk, body=post.text,
+        visibility=community.visibility, author_id=post.author_id,
+        community_id=community.pk, slug=community.slug, created_at=post.created_at,
+    )
+
+
+def community_entry(community):
+    body = " ".join(filter(None, [community.category, community.description, community.about]))
+    return SearchEntry(
+        kind=SearchEntry.COMMUNITY, object_id=community.pk, title=community.name[:255], body=body,
+        visibility=community.visibility, author_id=community.created_by_id,
+        community_id=community.pk, slug=community.slug, created_at=community.created_at,
+    )
+
+
+def user_entry(user):
+    full = f"{user.first_name or ''} {user.last_name or ''}".strip()
+    return SearchEntry(
+        kind=SearchEntry.USER, object_id=user.pk, title=user.username, body=full,
+        author_id=user.pk, created_at=user.date_joined,
+    )
+
+
+def save_entries(entries):
+    """Insert or update by (kind, object_id) in a single statement."""
+    SearchEntry.objects.bulk_create(
+        entries, batch_size=BATCH_SIZE, update_conflicts=True,
+        unique_fields=["kind", "object_id"], update_fields=UPDATE_FIELDS,
+    )
+
+
+def remove(kind, object_id):
+    SearchEntry.objects.filter(kind=kind, object_id=object_id).delete()
+
+
+def rebuild():
+    """Re-index everything from scratch."""
+    from apps.accounts.models import User
+    from apps.communities.models import Community, CommunityPost
+    from apps.feed.models import Post
+
+    SearchEntry.objects.all().delete()
+    communities = {c.pk: c for c in Community.objects.all()}
+    batches = [
+        [community_entry(c) for c in communities.values()],
+        [post_entry(p) for p in Post.objects.exclude(text="").iterator()],
+        [
+            community_post_entry(p, communities[p.community_id])
+            for p in CommunityPost.objects.filter(is_removed=False).exclude(text="").iterator()
+        ],
+        [user_entry(u) for u in User.objects.filter(is_active=True).iterator()],
+    ]
+    total = 0
+    for entries in batches:
+        SearchEntry.objects.bulk_create(entries, batch_size=BATCH_SIZE)
+        total += len(entries)
+    return total
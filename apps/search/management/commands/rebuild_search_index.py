@@ -0,0 +1,18 @@
+# apps/search/management/commands/rebuild_search_index.py
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from apps.search.index import rebuild
+
+
+class Command(BaseCommand):
+    help = "Re-index every post, community post, community and user for /api/search/."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            total = rebuild()
+        if connection.vendor == "sqlite":
+            # merge the FTS5 segments written by the bulk insert
+            with connection.cursor() as cursor:
+                cursor.execute("INSERT INTO search_fts(search_fts) VALUES ('optimize')")
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} document(s)."))
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8 on 2026-10-17 13:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('post', 'Post'), ('community_post', 'Community post'), ('community', 'Community'), ('user', 'User')], max_length=20)),
+                ('object_id', models.BigIntegerField()),
+                ('title', models.CharField(blank=True, max_length=255)),
+                ('body', models.TextField(blank=True)),
+                ('visibility', models.CharField(blank=True, max_length=10)),
+                ('author_id', models.BigIntegerField(blank=True, null=True)),
+                ('community_id', models.BigIntegerField(blank=True, null=True)),
+                ('slug', models.CharField(blank=True, max_length=170)),
+                ('created_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['community_id', 'kind'], name='searchentry_community_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='searchentry_object_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,111 @@
+from django.db import migrations
+
+SQLITE_FORWARD = [
+    # external-content FTS5 table over search_searchentry(title, body)
+    """CREATE VIRTUAL TABLE search_fts USING fts5(
+        title, body,
+        content='search_searchentry', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    """CREATE TRIGGER search_entry_ai AFTER INSERT ON search_searchentry BEGIN
+        INSERT INTO search_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END""",
+    """CREATE TRIGGER search_entry_ad AFTER DELETE ON search_searchentry BEGIN
+        INSERT INTO search_fts(search_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+    END""",
+    """CREATE TRIGGER search_entry_au AFTER UPDATE OF title, body ON search_searchentry BEGIN
+        INSERT INTO search_fts(search_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO search_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END""",
+]
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS search_entry_au",
+    "DROP TRIGGER IF EXISTS search_entry_ad",
+    "DROP TRIGGER IF EXISTS search_entry_ai",
+    "DROP TABLE IF EXISTS search_fts",
+]
+
+POSTGRES_FORWARD = [
+    # 'simple' config: no stemming or stop words, so usernames and mixed languages match as typed
+    """ALTER TABLE search_searchentry ADD COLUMN document tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(body, '')), 'B')
+    ) STORED""",
+    "CREATE INDEX searchentry_document_gin ON search_searchentry USING GIN (document)",
+]
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS searchentry_document_gin",
+    "ALTER TABLE search_searchentry DROP COLUMN IF EXISTS document",
+]
+
+
+def _run(schema_editor, statements):
+    for sql in statements.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+def create_index(apps, schema_editor):
+    _run(schema_editor, {"sqlite": SQLITE_FORWARD, "postgresql": POSTGRES_FORWARD})
+
+
+def drop_index(apps, schema_editor):
+    _run(schema_editor, {"sqlite": SQLITE_BACKWARD, "postgresql": POSTGRES_BACKWARD})
+
+
+def seed_entries(apps, schema_editor):
+    # index what already exists; signals keep it current from here on
+    SearchEntry = apps.get_model("search", "SearchEntry")
+    Post = apps.get_model("feed", "Post")
+    CommunityPost = apps.get_model("communities", "CommunityPost")
+    Community = apps.get_model("communities", "Community")
+    User = apps.get_model("apps_accounts", "User")
+
+    communities = {c.pk: c for c in Community.objects.all()}
+    rows = [
+        SearchEntry(
+            kind="community", object_id=c.pk, title=c.name[:255],
+            body=" ".join(filter(None, [c.category, c.description, c.about])),
+            visibility=c.visibility, author_id=c.created_by_id, community_id=c.pk,
+            slug=c.slug, created_at=c.created_at,
+        )
+        for c in communities.values()
+    ]
+    rows += [
+        SearchEntry(
+            kind="post", object_id=p.pk, body=p.text, visibility=p.visibility,
+            author_id=p.author_id, created_at=p.created_at,
+        )
+        for p in Post.objects.exclude(text="").iterator()
+    ]
+    rows += [
+        SearchEntry(
+            kind="community_post", object_id=p.pk, body=p.text,
+            visibility=communities[p.community_id].visibility, author_id=p.author_id,
+            community_id=p.community_id, slug=communities[p.community_id].slug, created_at=p.created_at,
+        )
+        for p in CommunityPost.objects.filter(is_removed=False).exclude(text="").iterator()
+    ]
+    rows += [
+        SearchEntry(
+            kind="user", object_id=u.pk, title=u.username,
+            body=f"{u.first_name or ''} {u.last_name or ''}".strip(),
+            author_id=u.pk, created_at=u.date_joined,
+        )
+        for u in User.objects.filter(is_active=True).iterator()
+    ]
+    SearchEntry.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("search", "0001_initial"),
+        ("feed", "0004_post_image_meta"),
+        ("communities", "0007_community_picture_meta_communitypost_image_meta"),
+        ("apps_accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+        migrations.RunPython(seed_entries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+# apps/search/models.py
+from django.db import models
+
+
+class SearchEntry(models.Model):
+    """
+    One searchable document per post / community post / community / user.
+
+    The full-text index itself lives beside this table and is kept in sync by the
+    database: an FTS5 external-content table fed by triggers on SQLite, a generated
+    tsvector column with a GIN index on PostgreSQL (see migrations/0002).
+    visibility / author_id / community_id are copied here so results can be
+    filtered for the viewer without joining the source tables.
+    """
+    POST = "post"
+    COMMUNITY_POST = "community_post"
+    COMMUNITY = "community"
+    USER = "user"
+    KIND_CHOICES = [
+        (POST, "Post"),
+        (COMMUNITY_POST, "Community post"),
+        (COMMUNITY, "Community"),
+        (USER, "User"),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.BigIntegerField()
+    # title ranks above body (weighted 10:1)
+    title = models.CharField(max_length=255, blank=True)
+    body = models.TextField(blank=True)
+    # post visibility for posts, the community's visibility for communities and their posts
+    visibility = models.CharField(max_length=10, blank=True)
+    author_id = models.BigIntegerField(null=True, blank=True)
+    community_id = models.BigIntegerField(null=True, blank=True)
+    slug = models.CharField(max_length=170, blank=True)
+    created_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "object_id"], name="searchentry_object_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["community_id", "kind"], name="searchentry_community_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id}"
@@ -0,0 +1,33 @@
+# apps/search/serializers.py
+from django.utils.html import escape
+from rest_framework import serializers
+
+from apps.accounts.cache import get_user_brief
+from .backends import MARK_END, MARK_START
+
+
+def highlight(snippet):
+    """Escape user text, then turn the backend's marks into <b></b>."""
+    return escape(snippet).replace(MARK_START, "<b>").replace(MARK_END, "</b>")
+
+
+class SearchHitSerializer(serializers.BaseSerializer):
+    """Serializes (SearchEntry, score, snippet) tuples from services.search()."""
+
+    def to_representation(self, hit):
+        entry, score, snippet = hit
+        author = get_user_brief(entry.author_id) if entry.author_id else None
+        request = self.context.get("request")
+        if author and author["avatar"] and request:
+            author = dict(author, avatar=request.build_absolute_uri(author["avatar"]))
+        return {
+            "type": entry.kind,
+            "id": entry.object_id,
+            "title": entry.title or None,
+            # the match may be in the title only (users, community names): show the title then
+            "snippet": highlight(snippet) if MARK_START in snippet else escape(entry.title or snippet),
+            "author": author,
+            "community": {"id": entry.community_id, "slug": entry.slug} if entry.community_id else None,
+            "created_at": entry.created_at,
+            "score": score,
+        }
@@ -0,0 +1,87 @@
+# apps/search/services.py
+from apps.communities.models import Community, Membership
+from apps.friendships.cache import get_friend_ids
+from .backends import get_backend, terms
+from .models import SearchEntry
+
+ALL_KINDS = [SearchEntry.POST, SearchEntry.COMMUNITY_POST, SearchEntry.COMMUNITY, SearchEntry.USER]
+
+
+def _in(column, values, params):
+    if not values:
+        return "0 = 1"
+    params.extend(values)
+    return f"{column} IN ({', '.join(['%s'] * len(values))})"
+
+
+def visibility_clause(user, kinds):
+    """
+    SQL (on alias `e`) + params limiting entries of `kinds` to what `user` may see:
+      posts            -> public, own, or friends-only from a friend
+      community posts  -> public communities, or communities the user belongs to
+      communities      -> everything but hidden ones, unless the user belongs to them
+      users            -> everyone (inactive accounts are not indexed)
+    """
+    params = []
+    authenticated = bool(user and user.is_authenticated)
+    community_ids = []
+    if authenticated and {SearchEntry.COMMUNITY_POST, SearchEntry.COMMUNITY} & set(kinds):
+        community_ids = list(
+            Membership.objects.filter(user=user, is_approved=True).values_list("community_id", flat=True)
+        )
+
+    clauses = []
+    for kind in kinds:
+        params.append(kind)
+        if kind == SearchEntry.POST:
+            rule = "e.visibility = 'public'"
+            if authenticated:
+                rule += f" OR e.author_id = {int(user.pk)}"
+                rule += f" OR (e.visibility = 'friends' AND {_in('e.author_id', get_friend_ids(user.pk), params)})"
+        elif kind == SearchEntry.COMMUNITY_POST:
+            rule = f"e.visibility = '{Community.PUBLIC}' OR {_in('e.community_id', community_ids, params)}"
+        elif kind == SearchEntry.COMMUNITY:
+            rule = f"e.visibility <> '{Community.HIDDEN}' OR {_in('e.community_id', community_ids, params)}"
+        else:
+            rule = "1 = 1"
+        clauses.append(f"(e.kind = %s AND ({rule}))")
+    return " OR ".join(clauses), params
+
+
+def search(user, text, kinds=None, after=None, limit=10):
+    """
+    Ranked hits for `text` visible to `user`: a list of (SearchEntry, score, snippet),
+    best first. `after` is the (score, id) of the last hit of the previous page.
+    """
+    words = terms(text)
+    if not words:
+        return []
+    kinds = kinds or ALL_KINDS
+    backend = get_backend()
+    where, params = visibility_clause(user, kinds)
+    rows = backend.search(words, where, params, after, limit)
+    if not rows:
+        return []
+    ids = [row[0] for row in rows]
+    entries = SearchEntry.objects.in_bulk(ids)
+    snippets = backend.snippets(words, ids)
+    return [(entries[pk], score, snippets.get(pk) or "") for pk, score in rows if pk in entries]
+
+
+def matching_ids(kind, text, batch=500):
+    """
+    object ids of every `kind` entry matching `text`, best first (no visibility check).
+    Pages through the ranked search by (score, id) rather than stopping at a cap.
+    """
+    words = terms(text)
+    if not words:
+        return []
+    backend = get_backend()
+    ids, after = [], None
+    while True:
+        rows = backend.search(words, "e.kind = %s", [kind], after, batch)
+        objects = dict(SearchEntry.objects.filter(pk__in=[pk for pk, _ in rows]).values_list("pk", "object_id"))
+        ids.extend(objects[pk] for pk, _ in rows if pk in objects)
+        if len(rows) < batch:
+            return ids
+        after = (rows[-1][1], rows[-1][0])
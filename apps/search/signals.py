@@ -0,0 +1,65 @@
+# apps/search/signals.py
+from django.conf import settings
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.communities.models import Community, CommunityPost
+from apps.feed.models import Post
+from . import index
+from .models import SearchEntry
+
+
+@receiver(post_save, sender=Post)
+def index_post(sender, instance, **kwargs):
+    if instance.text:
+        index.save_entries([index.post_entry(instance)])
+    else:
+        index.remove(SearchEntry.POST, instance.pk)
+
+
+@receiver(post_save, sender=CommunityPost)
+def index_community_post(sender, instance, **kwargs):
+    if instance.text and not instance.is_removed:
+        index.save_entries([index.community_post_entry(instance, instance.community)])
+    else:
+        index.remove(SearchEntry.COMMUNITY_POST, instance.pk)
+
+
+@receiver(post_save, sender=Community)
+def index_community(sender, instance, **kwargs):
+    index.save_entries([index.community_entry(instance)])
+    # posts are filtered by their community's visibility and link by its slug, keep the copies in step
+    SearchEntry.objects.filter(kind=SearchEntry.COMMUNITY_POST, community_id=instance.pk).exclude(
+        visibility=instance.visibility, slug=instance.slug
+    ).update(visibility=instance.visibility, slug=instance.slug)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def index_user(sender, instance, update_fields=None, **kwargs):
+    # logins save last_login only; nothing searchable changed
+    if update_fields is not None and not {"username", "first_name", "last_name", "is_active"} & set(update_fields):
+        return
+    if instance.is_active:
+        index.save_entries([index.user_entry(instance)])
+    else:
+        index.remove(SearchEntry.USER, instance.pk)
+
+
+@receiver(post_delete, sender=Post)
+def unindex_post(sender, instance, **kwargs):
+    index.remove(SearchEntry.POST, instance.pk)
+
+
+@receiver(post_delete, sender=CommunityPost)
+def unindex_community_post(sender, instance, **kwargs):
+    index.remove(SearchEntry.COMMUNITY_POST, instance.pk)
+
+
+@receiver(post_delete, sender=Community)
+def unindex_community(sender, instance, **kwargs):
+    SearchEntry.objects.filter(community_id=instance.pk).delete()
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def unindex_user(sender, instance, **kwargs):
+    index.remove(SearchEntry.USER, instance.pk)
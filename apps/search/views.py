@@ -0,0 +1,75 @@
+# apps/search/views.py
+import base64
+
+from rest_framework import permissions, status
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
+
+from . import services
+from .serializers import SearchHitSerializer
+
+
+class SearchView(APIView):
+    """
+    GET /api/search/?q=<text>[&type=post,community_post,community,user][&page_size=n]
+
+    Best matches first (BM25 on SQLite FTS5, ts_rank_cd on PostgreSQL), limited to
+    what the viewer may see. `next` carries a (score, id) cursor so paging never
+    re-runs an OFFSET scan.
+    """
+    permission_classes = [permissions.AllowAny]
+    page_size = 10
+    max_page_size = 50
+
+    def get(self, request):
+        text = request.query_params.get("q", "").strip()
+        if not text:
+            return Response({"detail": "q is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        kinds = None
+        if request.query_params.get("type"):
+            kinds = [k for k in request.query_params["type"].split(",") if k in services.ALL_KINDS]
+            if not kinds:
+                return Response(
+                    {"detail": f"type must be one of {', '.join(services.ALL_KINDS)}."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        size = self.get_page_size(request)
+        hits = services.search(request.user, text, kinds, after=self.decode_cursor(request), limit=size + 1)
+        next_link = None
+        if len(hits) > size:
+            hits = hits[:size]
+            entry, score, _ = hits[-1]
+            next_link = self.encode_cursor(request, score, entry.pk)
+
+        return Response({
+            "next": next_link,
+            "results": SearchHitSerializer(hits, many=True, context={"request": request}).data,
+        })
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get("page_size", self.page_size))
+        except ValueError:
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    @staticmethod
+    def encode_cursor(request, score, pk):
+        # repr() round-trips the float exactly, so the next page starts right after this row
+        token = base64.urlsafe_b64encode(f"{score!r}|{pk}".encode("ascii")).decode("ascii")
+        return replace_query_param(request.build_absolute_uri(), "cursor", token)
+
+    @staticmethod
+    def decode_cursor(request):
+        token = request.query_params.get("cursor")
+        if not token:
+            return None
+        try:
+            score, pk = base64.urlsafe_b64decode(token.encode("ascii")).decode("ascii").split("|")
+            return float(score), int(pk)
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound("Invalid cursor")
@@ -0,0 +1,17 @@
+from django.contrib import admin
+from django.utils import timezone
+from .models import Task
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ("id", "name", "status", "attempts", "max_attempts", "run_at", "finished_at")
+    list_filter = ("status", "name")
+    search_fields = ("name", "idempotency_key")
+    readonly_fields = ("created_at", "finished_at", "locked_by", "locked_at", "last_error")
+    actions = ["retry_now"]
+
+    @admin.action(description="Queue selected tasks to run now")
+    def retry_now(self, request, queryset):
+        queryset.exclude(status=Task.RUNNING).update(
+            status=Task.QUEUED, run_at=timezone.now(), attempts=0, locked_by="", locked_at=None,
+        )
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+class TasksConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.tasks"
+
+    def ready(self):
+        # register @task functions from every installed app's tasks.py
+        from django.utils.module_loading import autodiscover_modules
+        autodiscover_modules("tasks")
@@ -0,0 +1,15 @@
+# apps/tasks/child.py
+# entry points for worker pool processes; kept free of model imports at module level
+# because spawned children import this module before Django is set up
+import os
+
+
+def init(settings_module):
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    import django
+    django.setup()
+
+
+def run(task_id):
+    from .worker import execute
+    return execute(task_id)
@@ -0,0 +1,87 @@
+# apps/tasks/management/commands/run_worker.py
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connections
+
+from apps.tasks import child
+from apps.tasks.worker import claim, purge_finished, requeue_stale
+
+# housekeeping (stale locks, old rows) runs at most this often
+SWEEP_SECONDS = 60
+
+
+class Command(BaseCommand):
+    help = "Run queued background tasks in a process pool (Ctrl+C / SIGTERM finishes running tasks, then exits)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--processes", type=int, default=settings.TASKS_WORKER_PROCESSES)
+        parser.add_argument("--poll", type=float, default=1.0, help="seconds to sleep when the queue is empty")
+        parser.add_argument("--stale-after", type=int, default=600, help="requeue tasks locked longer than this (seconds)")
+        parser.add_argument("--keep-days", type=int, default=7, help="delete succeeded tasks older than this")
+        parser.add_argument("--once", action="store_true", help="exit when no task is due instead of waiting")
+
+    def handle(self, *args, **options):
+        processes = max(1, options["processes"])
+        worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        # spawned children start clean instead of inheriting this process's DB connections
+        connections.close_all()
+        pool = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=child.init,
+            initargs=(os.environ.get("DJANGO_SETTINGS_MODULE", "server.settings"),),
+        )
+        self.stdout.write(f"worker {worker_id}: {processes} process(es)")
+
+        running = {}
+        last_sweep = 0.0
+        done = 0
+        try:
+            while not self.stopping:
+                if time.monotonic() - last_sweep > SWEEP_SECONDS:
+                    requeued = requeue_stale(options["stale_after"])
+                    if requeued:
+                        self.stdout.write(f"requeued {requeued} stale task(s)")
+                    purge_finished(options["keep_days"])
+                    last_sweep = time.monotonic()
+
+                free = processes - len(running)
+                ids = claim(worker_id, free) if free else []
+                close_old_connections()
+                for task_id in ids:
+                    running[pool.submit(child.run, task_id)] = task_id
+
+                if not running:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll"])
+                    continue
+
+                finished, _ = wait(running, timeout=options["poll"], return_when=FIRST_COMPLETED)
+                for future in finished:
+                    task_id = running.pop(future)
+                    try:
+                        status = future.result()
+                    except Exception as exc:
+                        # the child process itself died; the lock sweep will requeue the task
+                        status = f"crashed ({exc!r})"
+                    self.stdout.write(f"task {task_id}: {status}")
+                    done += 1
+        finally:
+            wait(running)
+            pool.shutdown()
+        self.stdout.write(self.style.SUCCESS(f"worker stopped after {done} task(s)"))
+
+    def _stop(self, signum, frame):
+        self.stopping = True
@@ -0,0 +1,57 @@
+# apps/tasks/models.py
+from django.db import models
+from django.utils import timezone
+
+
+class Task(models.Model):
+    """
+    One deferred call of a registered @task function (see queue.py).
+
+    Rows are written in the caller's transaction, so a task exists exactly when the
+    request that queued it committed. `manage.py run_worker` claims due rows,
+    runs them in a process pool and retries failures with exponential backoff.
+    """
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (QUEUED, "Queued"),
+        (RUNNING, "Running"),
+        (SUCCEEDED, "Succeeded"),
+        (FAILED, "Failed"),
+    ]
+
+    name = models.CharField(max_length=150)
+    args = models.JSONField(default=list, blank=True)
+    kwargs = models.JSONField(default=dict, blank=True)
+    # at most one *queued* task per key: enqueuing again while one waits is a no-op
+    idempotency_key = models.CharField(max_length=200, null=True, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["run_at", "id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["idempotency_key"],
+                condition=models.Q(status="queued"),
+                name="task_queued_key",
+            ),
+        ]
+        indexes = [
+            # worker claim: due queued tasks, oldest first
+            models.Index(fields=["run_at", "id"], condition=models.Q(status="queued"), name="task_due_idx"),
+            # stale-lock sweep
+            models.Index(fields=["locked_at"], condition=models.Q(status="running"), name="task_running_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
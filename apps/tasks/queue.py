@@ -0,0 +1,103 @@
+# apps/tasks/queue.py
+# @task registry and enqueue helpers
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import Task
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 5
+# first retry after ~10s, doubling each attempt
+DEFAULT_BACKOFF = 10
+
+registry = {}
+_eager = threading.local()
+
+
+class TaskFunction:
+    def __init__(self, fn, name, max_attempts, backoff):
+        self.fn = fn
+        self.name = name
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.__doc__ = fn.__doc__
+
+    def __call__(self, *args, **kwargs):
+        # calling the task directly runs it inline
+        return self.fn(*args, **kwargs)
+
+    def delay(self, *args, **kwargs):
+        return self.enqueue(args, kwargs)
+
+    def enqueue(self, args=(), kwargs=None, key=None, countdown=0):
+        """
+        Queue a call. `key` coalesces: while a queued task with the same key waits,
+        further enqueues return that task instead of adding another.
+        """
+        return enqueue(self.name, args, kwargs, key=key, countdown=countdown, max_attempts=self.max_attempts)
+
+    def __repr__(self):
+        return f"<task {self.name}>"
+
+
+def task(fn=None, *, name=None, max_attempts=DEFAULT_MAX_ATTEMPTS, backoff=DEFAULT_BACKOFF):
+    """
+    Register a function as a background task. Arguments must be JSON-serializable
+    and the function should be safe to run more than once (it is retried on error).
+
+        @task(max_attempts=3)
+        def recount_members(community_id): ...
+
+        recount_members.enqueue([community.pk], key=f"recount_members:{community.pk}")
+    """
+    def decorator(f):
+        task_name = name or f"{f.__module__}.{f.__qualname__}"
+        wrapped = TaskFunction(f, task_name, max_attempts, backoff)
+        registry[task_name] = wrapped
+        return wrapped
+
+    return decorator(fn) if fn is not None else decorator
+
+
+def enqueue(name, args=(), kwargs=None, key=None, countdown=0, max_attempts=DEFAULT_MAX_ATTEMPTS):
+    args, kwargs = list(args), dict(kwargs or {})
+    if settings.TASKS_EAGER:
+        _enqueue_eager(name, args, kwargs, key)
+        return None
+
+    run_at = timezone.now() + timedelta(seconds=countdown)
+    try:
+        # savepoint so a duplicate key doesn't break the caller's transaction
+        with transaction.atomic():
+            return Task.objects.create(
+                name=name, args=args, kwargs=kwargs, idempotency_key=key,
+                max_attempts=max_attempts, run_at=run_at,
+            )
+    except IntegrityError:
+        return Task.objects.filter(idempotency_key=key, status=Task.QUEUED).first()
+
+
+def _enqueue_eager(name, args, kwargs, key):
+    """TASKS_EAGER: run in-process once the caller's transaction commits (no worker needed)."""
+    pending = getattr(_eager, "keys", None)
+    if pending is None:
+        pending = _eager.keys = set()
+    if key is not None:
+        if key in pending:
+            return
+        pending.add(key)
+
+    def run():
+        pending.discard(key)
+        try:
+            registry[name].fn(*args, **kwargs)
+        except Exception:
+            logger.exception("eager task %s failed", name)
+
+    transaction.on_commit(run)
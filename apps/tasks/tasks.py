@@ -0,0 +1,10 @@
+# apps/tasks/tasks.py
+from django.core.mail import send_mail
+
+from .queue import task
+
+
+@task(max_attempts=8, backoff=30)
+def send_email(subject, message, recipient_list, from_email=None, html_message=None):
+    """SMTP delivery off the request path; retried while the mail server is unavailable."""
+    send_mail(subject, message, from_email, recipient_list, html_message=html_message)
@@ -0,0 +1,102 @@
+# apps/tasks/worker.py
+# claim / execute / retry, used by `manage.py run_worker`
+import logging
+import random
+import traceback
+from datetime import timedelta
+
+from django.db import IntegrityError, close_old_connections, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Task
+from .queue import registry
+
+logger = logging.getLogger(__name__)
+
+# retry delays are capped at one hour
+MAX_BACKOFF = 3600
+
+
+def backoff_delay(attempts, base):
+    """Exponential backoff with jitter: ~base, 2*base, 4*base ... seconds."""
+    delay = min(MAX_BACKOFF, base * 2 ** max(attempts - 1, 0))
+    return delay * random.uniform(0.5, 1.0)
+
+
+def claim(worker_id, limit):
+    """Mark up to `limit` due tasks as running for this worker and return their ids."""
+    now = timezone.now()
+    with transaction.atomic():
+        qs = Task.objects.filter(status=Task.QUEUED, run_at__lte=now).order_by("run_at", "id")
+        if connection.features.has_select_for_update_skip_locked:
+            # several workers on PostgreSQL: each takes different rows without waiting
+            qs = qs.select_for_update(skip_locked=True)
+        ids = list(qs.values_list("pk", flat=True)[:limit])
+        if ids:
+            Task.objects.filter(pk__in=ids, status=Task.QUEUED).update(
+                status=Task.RUNNING, locked_by=worker_id, locked_at=now, attempts=F("attempts") + 1,
+            )
+    return ids
+
+
+def _finish(task, status, error=""):
+    Task.objects.filter(pk=task.pk).update(
+        status=status, last_error=error, finished_at=timezone.now(), locked_by="", locked_at=None,
+    )
+
+
+def _retry_or_fail(task, error):
+    if task.attempts >= task.max_attempts:
+        _finish(task, Task.FAILED, error)
+        return Task.FAILED
+    fn = registry.get(task.name)
+    delay = backoff_delay(task.attempts, fn.backoff if fn else 10)
+    try:
+        with transaction.atomic():
+            Task.objects.filter(pk=task.pk).update(
+                status=Task.QUEUED, run_at=timezone.now() + timedelta(seconds=delay),
+                last_error=error, locked_by="", locked_at=None,
+            )
+    except IntegrityError:
+        # a fresh task with the same key is already queued and will do the work
+        _finish(task, Task.FAILED, error + "\nsuperseded by a queued task with the same key")
+        return Task.FAILED
+    return Task.QUEUED
+
+
+def execute(task_id):
+    """Run one claimed task; returns the resulting status."""
+    try:
+        task = Task.objects.filter(pk=task_id, status=Task.RUNNING).first()
+        if task is None:
+            return None
+        fn = registry.get(task.name)
+        try:
+            if fn is None:
+                raise LookupError(f"no task registered as {task.name!r}")
+            fn.fn(*task.args, **task.kwargs)
+        except Exception:
+            logger.exception("task %s #%s failed (attempt %s)", task.name, task.pk, task.attempts)
+            return _retry_or_fail(task, traceback.format_exc(limit=20))
+        _finish(task, Task.SUCCEEDED)
+        return Task.SUCCEEDED
+    finally:
+        close_old_connections()
+
+
+def requeue_stale(older_than):
+    """Hand tasks locked by a dead worker back to the queue (or fail them when out of attempts)."""
+    cutoff = timezone.now() - timedelta(seconds=older_than)
+    stale = Task.objects.filter(status=Task.RUNNING, locked_at__lt=cutoff)
+    n = 0
+    for task in stale:
+        _retry_or_fail(task, f"lock held by {task.locked_by} expired")
+        n += 1
+    return n
+
+
+def purge_finished(older_than_days):
+    cutoff = timezone.now() - timedelta(days=older_than_days)
+    deleted, _ = Task.objects.filter(status=Task.SUCCEEDED, finished_at__lt=cutoff).delete()
+    return deleted
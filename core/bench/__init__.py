@@ -0,0 +1 @@
+# core/bench: synthetic data + endpoint benchmark used by `manage.py bench_api`
@@ -0,0 +1,192 @@
+# core/bench/runner.py
+# drives every API route through the Django test client and records latency / SQL / memory
+import re
+import time
+import tracemalloc
+from datetime import timedelta
+from urllib.parse import urlencode
+
+from django.db import connection, reset_queries
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver
+
+from apps.accounts.tokens import refresh_token_for
+
+SKIP_PREFIXES = ("admin/", "media/")
+
+# which sample id a `<int:pk>` means depends on where the route lives (first match wins)
+PK_BY_PREFIX = [
+    ("api/posts/comments/", "community_comment_id"),
+    ("api/posts/", "community_post_id"),
+    ("api/communities/", "community_post_id"),
+    ("api/comments/", "comment_id"),
+    ("api/feed/", "post_id"),
+    ("api/chat/", "conversation_id"),
+]
+
+# state-changing routes get a scenario whose steps leave the data as they found it:
+# route -> [(method, route of the step or None for the same route, data or callable(ids))]
+WRITE_SCENARIOS = {
+    "api/posts/<int:pk>/like/": [("post", None, None), ("delete", None, None)],
+    "api/likes/posts/<int:post_id>/like/": [("post", None, None), ("post", "api/likes/posts/<int:post_id>/unlike/", None)],
+    "api/likes/posts/bulk/": [
+        ("post", None, lambda ids: {"like": [ids["post_id"]]}),
+        ("post", None, lambda ids: {"unlike": [ids["post_id"]]}),
+    ],
+    "api/posts/likes/bulk/": [
+        ("post", None, lambda ids: {"unlike": [ids["community_post_id"]]}),
+        ("post", None, lambda ids: {"like": [ids["community_post_id"]]}),
+    ],
+    "api/feed/posts/": [("post", None, {"text": "bench", "visibility": "friends"})],
+    "api/posts/<int:pk>/comments/": [("post", None, lambda ids: {"text": "bench", "post": ids["community_post_id"]})],
+    "api/chat/conversations/": [("post", None, lambda ids: {"title": "bench", "members": [ids["user_id"]]})],
+    "api/chat/conversations/direct/": [("post", None, lambda ids: {"user": ids["user_id"]})],
+    "api/chat/conversations/<int:pk>/messages/": [("post", None, {"text": "bench"})],
+    "api/chat/conversations/<int:pk>/read/": [("post", None, {})],
+    "api/notifications/read/": [("post", None, {})],
+    # list endpoints with a values() read path run both ways (core/rows.py)
+    "api/feed/feed/": [
+        ("get", None, None), ("get", None, {"read": "model"}),
+        ("get", None, {"sort": "top"}), ("get", None, {"sort": "top", "read": "model"}),
+    ],
+    "api/communities/<slug:slug>/posts/": [("get", None, None), ("get", None, {"read": "model"})],
+    "api/search/": [("get", None, {"q": "bench"})],
+    "api/profiles/relationships/": [("get", None, lambda ids: {"ids": f"{ids['user_id']},{ids['viewer_id']}"})],
+}
+COVERED_BY_SCENARIO = {
+    "api/likes/posts/<int:post_id>/unlike/": "api/likes/posts/<int:post_id>/like/",
+}
+
+PARAM_RE = re.compile(r"<(?:(?P<conv>[^>:]+):)?(?P<name>[^>]+)>")
+
+
+def iter_routes(patterns=None, prefix=""):
+    """Yield (route template, view class) for every plain path() route."""
+    for p in patterns if patterns is not None else get_resolver().url_patterns:
+        if isinstance(p, URLResolver):
+            yield from iter_routes(p.url_patterns, prefix + str(p.pattern))
+        elif isinstance(p, URLPattern):
+            route = prefix + str(p.pattern)
+            if route.startswith(SKIP_PREFIXES) or route.startswith("^"):
+                continue
+            view = getattr(p.callback, "view_class", None) or getattr(p.callback, "cls", None)
+            yield route, view
+
+
+def _param_value(route, name, ids):
+    if name == "pk":
+        for prefix, key in PK_BY_PREFIX:
+            if route.startswith(prefix):
+                return ids.get(key)
+        return None
+    if name == "request_id":
+        return ids.get("friend_request_id" if route.startswith("api/friendships/") else "join_request_id")
+    if name == "friend_id":
+        return ids.get("user_id")
+    return ids.get(name)
+
+
+def build_path(route, ids):
+    missing = []
+
+    def sub(match):
+        value = _param_value(route, match.group("name"), ids)
+        if value is None:
+            missing.append(match.group("name"))
+            return ""
+        return str(value)
+
+    path = "/" + PARAM_RE.sub(sub, route)
+    return (None if missing else path), missing
+
+
+def _percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def measure(client, steps, iterations):
+    """
+    Run `steps` (method, path, data) in order `iterations` times and report each step:
+    one warm-up round, one instrumented round for SQL count and peak memory, then
+    clean rounds for latency.
+    """
+    def call(method, path, data):
+        return getattr(client, method)(path, **({"data": data} if data is not None else {}))
+
+    for step in steps:
+        call(*step)
+
+    rows = []
+    for step in steps:
+        reset_queries()
+        tracemalloc.start()
+        with CaptureQueriesContext(connection) as queries:
+            response = call(*step)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        rows.append({"status": response.status_code, "queries": len(queries), "peak_memory_kib": round(peak / 1024, 1)})
+
+    timings = [[] for _ in steps]
+    for _ in range(iterations):
+        for i, step in enumerate(steps):
+            start = time.perf_counter()
+            call(*step)
+            timings[i].append((time.perf_counter() - start) * 1000)
+
+    for row, samples in zip(rows, timings):
+        row.update({
+            "iterations": iterations,
+            "p50_ms": round(_percentile(samples, 0.50), 3),
+            "p95_ms": round(_percentile(samples, 0.95), 3),
+            "mean_ms": round(sum(samples) / len(samples), 3),
+        })
+    return rows
+
+
+def _client(viewer, auth):
+    if auth == "token":
+        # outlives the whole run
+        access = refresh_token_for(viewer).access_token
+        access.set_exp(lifetime=timedelta(hours=1))
+        return Client(HTTP_AUTHORIZATION=f"Bearer {access}")
+    client = Client()
+    client.force_login(viewer)
+    return client
+
+
+def run(viewer, ids, iterations=20, auth="session"):
+    client = _client(viewer, auth)
+
+    results, skipped = [], []
+    for route, view in iter_routes():
+        if route in COVERED_BY_SCENARIO:
+            skipped.append({"route": route, "reason": f"measured in {COVERED_BY_SCENARIO[route]} scenario"})
+            continue
+
+        if route in WRITE_SCENARIOS:
+            plan = WRITE_SCENARIOS[route]
+        elif view is not None and hasattr(view, "get"):
+            plan = [("get", None, None)]
+        else:
+            skipped.append({"route": route, "reason": "state-changing"})
+            continue
+
+        steps, labels, missing = [], [], []
+        for method, step_route, data in plan:
+            step_route = step_route or route
+            path, absent = build_path(step_route, ids)
+            missing += absent
+            data = data(ids) if callable(data) else data
+            steps.append((method, path, data))
+            # GET variants of one route are told apart by their query string
+            labels.append((step_route, f"{path}?{urlencode(data)}" if method == "get" and data else path, method.upper()))
+        if missing:
+            skipped.append({"route": route, "reason": f"no sample for {', '.join(sorted(set(missing)))}"})
+            continue
+
+        for (step_route, path, method), row in zip(labels, measure(client, steps, iterations)):
+            results.append({"route": step_route, "path": path, "method": method, **row})
+
+    return results, skipped
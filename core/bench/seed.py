@@ -0,0 +1,202 @@
+# core/bench/seed.py
+# builds a synthetic social graph through the ORM for benchmarking
+import random
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+
+from apps.profiles.models import Profile
+from apps.friendships.models import Friendship, FriendRequest
+from apps.feed.models import Post
+from apps.feed.ranking import refresh_scores
+from apps.feed.timeline import build_public_entries, build_timeline
+from apps.comments.models import Comment
+from apps.likes.models import Like
+from apps.communities.models import (
+    Community, Membership, JoinRequest, CommunityPost, PostLike, PostComment, PostReport,
+)
+from apps.communities.counters import reconcile
+from apps.chat.models import Conversation, ConversationMember, Message
+from apps.search.index import rebuild as rebuild_search_index
+
+User = get_user_model()
+
+BATCH_SIZE = 1000
+
+
+def _power_law_degrees(rng, n, mean_degree, alpha=2.0):
+    # pareto-distributed degrees: a few hubs, a long tail of small accounts
+    scale = mean_degree * (alpha - 1) / alpha
+    return [min(n - 1, max(1, int(rng.paretovariate(alpha) * scale))) for _ in range(n)]
+
+
+def _weighted_sample(rng, population, weights, k):
+    picked = set()
+    for _ in range(k * 3):
+        if len(picked) >= k:
+            break
+        picked.add(rng.choices(population, weights=weights)[0])
+    return picked
+
+
+def seed(users=200, mean_friends=12, posts_per_user=5, likes_per_post=4, comments_per_post=2,
+         communities=10, posts_per_community=30, messages_per_chat=40, seed=42, stdout=None):
+    """
+    Create users, power-law friendships, posts, likes, comments, communities and chats.
+    Returns a dict of sample ids used to fill URL parameters.
+    """
+    rng = random.Random(seed)
+    log = stdout.write if stdout else (lambda msg: None)
+
+    # --- users + profiles
+    password = make_password("bench-password")
+    User.objects.bulk_create(
+        [User(username=f"bench{i}", email=f"bench{i}@example.com", password=password) for i in range(users)],
+        batch_size=BATCH_SIZE,
+    )
+    user_ids = list(User.objects.filter(username__startswith="bench").order_by("pk").values_list("pk", flat=True))
+    Profile.objects.bulk_create([Profile(user_id=u) for u in user_ids], batch_size=BATCH_SIZE, ignore_conflicts=True)
+    log(f"users: {len(user_ids)}")
+
+    # --- friendships (stored in both directions, like AcceptFriendRequestView)
+    degrees = _power_law_degrees(rng, len(user_ids), mean_friends)
+    # the most connected user is the benchmark viewer
+    viewer_id = user_ids[max(range(len(user_ids)), key=lambda i: degrees[i])]
+    pairs = set()
+    for idx, uid in enumerate(user_ids):
+        for other in _weighted_sample(rng, user_ids, degrees, degrees[idx] // 2 or 1):
+            if other != uid:
+                pairs.add((min(uid, other), max(uid, other)))
+    rows = []
+    for a, b in pairs:
+        rows.append(Friendship(user_id=a, friend_id=b))
+        rows.append(Friendship(user_id=b, friend_id=a))
+    Friendship.objects.bulk_create(rows, batch_size=BATCH_SIZE, ignore_conflicts=True)
+    log(f"friendships: {len(rows)}")
+
+    requests = set()
+    for _ in range(len(user_ids)):
+        a, b = rng.sample(user_ids, 2)
+        if rng.random() < 0.05:
+            b = viewer_id  # make sure the viewer has incoming requests
+        if a != b and (min(a, b), max(a, b)) not in pairs:
+            requests.add((a, b))
+    FriendRequest.objects.bulk_create(
+        [FriendRequest(from_user_id=a, to_user_id=b) for a, b in requests], batch_size=BATCH_SIZE, ignore_conflicts=True,
+    )
+
+    # --- feed posts, likes, comments (hubs post more)
+    visibilities = [Post.PUBLIC, Post.FRIENDS, Post.FRIENDS, Post.PRIVATE]
+    posts = []
+    for idx, uid in enumerate(user_ids):
+        for _ in range(max(1, int(posts_per_user * degrees[idx] / mean_friends))):
+            posts.append(Post(author_id=uid, text="bench post " * rng.randint(1, 20), visibility=rng.choice(visibilities)))
+    Post.objects.bulk_create(posts, batch_size=BATCH_SIZE)
+    post_ids = list(Post.objects.order_by("pk").values_list("pk", flat=True))
+    log(f"posts: {len(post_ids)}")
+
+    likes, comments = [], []
+    for pid in post_ids:
+        for uid in rng.sample(user_ids, min(len(user_ids), rng.randint(0, likes_per_post * 2))):
+            likes.append(Like(post_id=pid, user_id=uid))
+        for _ in range(rng.randint(0, comments_per_post * 2)):
+            comments.append(Comment(post_id=pid, author_id=rng.choice(user_ids), text="bench comment"))
+    Like.objects.bulk_create(likes, batch_size=BATCH_SIZE, ignore_conflicts=True)
+    Comment.objects.bulk_create(comments, batch_size=BATCH_SIZE)
+    log(f"likes: {len(likes)}, comments: {len(comments)}")
+
+    # --- communities with members, join requests, posts, likes, comments, reports
+    community_visibilities = [Community.PUBLIC, Community.PUBLIC, Community.PRIVATE, Community.HIDDEN]
+    for c in range(communities):
+        # community 0 is a public one run by the viewer, so admin-only routes can be measured
+        owner = viewer_id if c == 0 else rng.choice(user_ids)
+        visibility = Community.PUBLIC if c == 0 else rng.choice(community_visibilities)
+        community = Community.objects.create(
+            name=f"Bench community {c}", created_by_id=owner, visibility=visibility,
+            description="benchmark community", category=rng.choice(["python", "music", "gaming"]),
+        )
+        members = {owner} | _weighted_sample(rng, user_ids, degrees, rng.randint(5, max(6, len(user_ids) // 3)))
+        Membership.objects.bulk_create(
+            [Membership(community=community, user_id=u, role=Membership.ADMIN if u == owner else Membership.MEMBER)
+             for u in members],
+            batch_size=BATCH_SIZE, ignore_conflicts=True,
+        )
+        outsiders = [u for u in rng.sample(user_ids, min(10, len(user_ids))) if u not in members]
+        JoinRequest.objects.bulk_create(
+            [JoinRequest(community=community, user_id=u) for u in outsiders], ignore_conflicts=True,
+        )
+
+        member_list = sorted(members)
+        cposts = [
+            CommunityPost(community=community, author_id=rng.choice(member_list), text="bench community post")
+            for _ in range(posts_per_community)
+        ]
+        CommunityPost.objects.bulk_create(cposts, batch_size=BATCH_SIZE)
+        cpost_ids = list(CommunityPost.objects.filter(community=community).values_list("pk", flat=True))
+        plikes, pcomments, reports = [], [], []
+        for pid in cpost_ids:
+            for uid in rng.sample(member_list, min(len(member_list), rng.randint(0, likes_per_post * 2))):
+                plikes.append(PostLike(post_id=pid, user_id=uid))
+            for _ in range(rng.randint(0, comments_per_post * 3)):
+                pcomments.append(PostComment(post_id=pid, user_id=rng.choice(member_list), text="bench comment"))
+            if rng.random() < 0.1:
+                reports.append(PostReport(post_id=pid, community=community, reporter_id=rng.choice(member_list), reason="bench"))
+        PostLike.objects.bulk_create(plikes, batch_size=BATCH_SIZE, ignore_conflicts=True)
+        PostComment.objects.bulk_create(pcomments, batch_size=BATCH_SIZE)
+        PostReport.objects.bulk_create(reports, batch_size=BATCH_SIZE)
+        community.member_count = len(members)
+        community.save(update_fields=["member_count"])
+    log(f"communities: {communities}")
+
+    # --- direct chats: the viewer with a handful of friends
+    friend_ids = list(Friendship.objects.filter(user_id=viewer_id).values_list("friend_id", flat=True)[:10])
+    messages = []
+    for fid in friend_ids:
+        conversation = Conversation.objects.create(
+            kind=Conversation.DIRECT, created_by_id=viewer_id,
+            direct_key=Conversation.direct_key_for(viewer_id, fid),
+        )
+        ConversationMember.objects.bulk_create([
+            ConversationMember(conversation=conversation, user_id=viewer_id),
+            ConversationMember(conversation=conversation, user_id=fid, unread_count=messages_per_chat // 2),
+        ])
+        for i in range(messages_per_chat):
+            messages.append(Message(conversation=conversation, sender_id=(viewer_id, fid)[i % 2], text="bench message"))
+    Message.objects.bulk_create(messages, batch_size=BATCH_SIZE)
+    log(f"conversations: {len(friend_ids)}")
+
+    # --- derived state that signals would normally maintain
+    build_public_entries()
+    for uid in user_ids:
+        build_timeline(uid)
+    reconcile()
+    rebuild_search_index()
+    refresh_scores()
+
+    return sample_ids(viewer_id)
+
+
+def sample_ids(viewer_id):
+    """Pick existing objects (visible to the viewer where it matters) for URL parameters."""
+    community = (
+        Community.objects.filter(created_by_id=viewer_id, visibility=Community.PUBLIC).first()
+        or Community.objects.filter(memberships__user_id=viewer_id, visibility=Community.PUBLIC).first()
+        or Community.objects.filter(visibility=Community.PUBLIC).first()
+        or Community.objects.first()
+    )
+    cpost = CommunityPost.objects.filter(community=community).order_by("-likes_count").first()
+    post = Post.objects.filter(visibility=Post.PUBLIC).order_by("-pk").first()
+    return {
+        "viewer_id": viewer_id,
+        "user_id": Friendship.objects.filter(user_id=viewer_id).values_list("friend_id", flat=True).first(),
+        "post_id": post.pk if post else None,
+        "comment_id": Comment.objects.filter(post=post).values_list("pk", flat=True).first(),
+        "slug": community.slug if community else None,
+        "community_post_id": cpost.pk if cpost else None,
+        "community_comment_id": PostComment.objects.filter(post=cpost).values_list("pk", flat=True).first(),
+        "join_request_id": JoinRequest.objects.filter(community=community).values_list("pk", flat=True).first(),
+        "report_id": PostReport.objects.filter(community=community).values_list("pk", flat=True).first(),
+        "membership_id": Membership.objects.filter(community=community).values_list("pk", flat=True).first(),
+        "conversation_id": ConversationMember.objects.filter(user_id=viewer_id).values_list("conversation_id", flat=True).first(),
+        "friend_request_id": FriendRequest.objects.filter(to_user_id=viewer_id).values_list("pk", flat=True).first(),
+    }
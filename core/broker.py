@@ -0,0 +1,26 @@
+# core/broker.py
+# per-user pub/sub on top of the channels layer: in-process by default, Redis when
+# configured (see CHANNEL_LAYERS in settings). Every live connection (websocket or
+# SSE) joins its user's group for one stream, so a publish is one group_send per
+# recipient and idle connections cost no work at all.
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+EVENT_TYPE = "push.event"
+
+
+def user_group(stream, user_id):
+    return f"{stream}.user.{user_id}"
+
+
+async def apublish(stream, user_ids, payload):
+    layer = get_channel_layer()
+    if layer is None:
+        return
+    for user_id in user_ids:
+        await layer.group_send(user_group(stream, user_id), {"type": EVENT_TYPE, "payload": payload})
+
+
+def publish(stream, user_ids, payload):
+    """Sync wrapper for views / signals."""
+    async_to_sync(apublish)(stream, list(user_ids), payload)
@@ -0,0 +1,37 @@
+# core/bulk.py
+# shared pieces of the batch endpoints (mobile clients replay queued offline actions in one request)
+from rest_framework import serializers
+
+MAX_BULK_ITEMS = 200
+
+
+def id_list():
+    return serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, max_length=MAX_BULK_ITEMS)
+
+
+class BulkActionSerializer(serializers.Serializer):
+    """
+    Base for {"<action>": [ids], "<undo action>": [ids]} payloads. Subclasses declare
+    one id_list() per name in `actions`; ids are de-duplicated (order kept) and may
+    appear in only one list, since a replayed queue has lost the order between them.
+    """
+    actions = ()
+
+    def validate(self, data):
+        lists = {name: list(dict.fromkeys(data.get(name, []))) for name in self.actions}
+        if not any(lists.values()):
+            raise serializers.ValidationError(f"Send at least one of: {', '.join(self.actions)}.")
+        if sum(len(ids) for ids in lists.values()) > MAX_BULK_ITEMS:
+            raise serializers.ValidationError(f"At most {MAX_BULK_ITEMS} items per request.")
+        seen = set()
+        for ids in lists.values():
+            if seen.intersection(ids):
+                raise serializers.ValidationError("An id may appear in only one list.")
+            seen.update(ids)
+        data.update(lists)
+        return data
+
+
+def per_item(ids, statuses):
+    """Per-item results in request order: [{"id": 3, "status": "liked"}, ...]."""
+    return [{"id": i, "status": statuses[i]} for i in ids]
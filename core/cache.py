@@ -0,0 +1,55 @@
+# core/cache.py
+# small read-through helpers over Django's cache (LocMem LRU locally, Redis in production)
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+DEFAULT_TIMEOUT = 300
+_MISSING = object()
+
+
+def read_through(key, loader, timeout=DEFAULT_TIMEOUT):
+    """
+    Return the cached value for `key`, calling `loader()` and caching its result on a miss.
+    None is cached too, so "does not exist" answers are as cheap as hits.
+    """
+    value = cache.get(key, _MISSING)
+    if value is _MISSING:
+        value = loader()
+        cache.set(key, value, timeout)
+    return value
+
+
+def invalidate(*keys):
+    keys = list(keys)
+    cache.delete_many(keys)
+    # a concurrent reader may have re-cached the old value before our transaction
+    # committed, so drop the keys once more after commit
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def bump_version(*keys):
+    """
+    Stamp `keys` with a fresh version. Readers fold the stamps into their own cache
+    keys or validators, so one write invalidates everything derived from them.
+    A new timestamp (not incr) means an evicted stamp can't come back as an old value.
+    """
+    stamp = time.time_ns()
+    cache.set_many({key: stamp for key in keys}, None)
+
+
+def get_versions(keys):
+    """
+    {key: stamp} for every key. A key never bumped (or evicted) is seeded with a fresh
+    stamp, never read as a constant, so a validator minted before an eviction can't
+    match again afterwards.
+    """
+    found = cache.get_many(keys)
+    missing = [key for key in keys if key not in found]
+    if missing:
+        stamp = time.time_ns()
+        for key in missing:
+            # add(): a concurrent bump or seed wins, and we read theirs back
+            found[key] = stamp if cache.add(key, stamp, None) else cache.get(key, stamp)
+    return {key: found[key] for key in keys}
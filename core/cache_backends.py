@@ -0,0 +1,19 @@
+# core/cache_backends.py
+import time
+
+from django.core.cache.backends.locmem import LocMemCache
+
+
+class NonCullingLocMemCache(LocMemCache):
+    """
+    LocMem that never evicts a live key: when MAX_ENTRIES is reached only expired
+    entries are dropped, and the cache grows past it if none are. For data whose loss
+    is a correctness bug (token revocations), not just a miss.
+    """
+
+    def _cull(self):
+        # called with the cache lock held (LocMemCache._set)
+        now = time.time()
+        for key, expiry in list(self._expire_info.items()):
+            if expiry is not None and expiry <= now:
+                self._delete(key)
@@ -0,0 +1,56 @@
+# core/conditional.py
+# conditional GET for polled endpoints: a view derives a cheap validator (a few
+# columns, counters or version stamps) before doing any real work, and a client
+# whose If-None-Match / If-Modified-Since still matches gets an empty 304
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+# representation inputs besides the data itself: rendition hints and the renderer
+VARY_HEADERS = ("Accept", "Sec-CH-Width", "Width")
+
+
+def make_etag(*parts):
+    return '"%s"' % hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+
+class ConditionalGetMixin:
+    """
+    Views implement `get_validators(request, *args, **kwargs)` returning
+    (etag parts, last_modified datetime); either may be None, and (None, None)
+    skips the check (e.g. the object doesn't exist and the view should 404).
+    Only return last_modified if it moves whenever any etag part does: a client
+    revalidating with If-Modified-Since alone would get a 304 for a stale body.
+
+    The ETag is weak and always covers the viewer, the query string and
+    VARY_HEADERS, because responses carry per-user state (likes, membership).
+    """
+
+    def get_validators(self, request, *args, **kwargs):
+        return None, None
+
+    def get(self, request, *args, **kwargs):
+        parts, last_modified = self.get_validators(request, *args, **kwargs)
+        if parts is None and last_modified is None:
+            return super().get(request, *args, **kwargs)
+
+        etag = None
+        if parts is not None:
+            context = (request.user.pk, request.get_full_path(), *(request.headers.get(h, "") for h in VARY_HEADERS))
+            etag = "W/" + make_etag(context, parts)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+        if etag:
+            response["ETag"] = etag
+        if timestamp is not None:
+            response["Last-Modified"] = http_date(timestamp)
+        # per-user and always revalidated; shared caches must not store it
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ("Cookie", "Authorization", *VARY_HEADERS))
+        return response
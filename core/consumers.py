@@ -0,0 +1,36 @@
+# core/consumers.py
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+
+from .broker import user_group
+
+# close codes in the 4000 range are free for applications
+CLOSE_UNAUTHENTICATED = 4401
+
+
+class UserStreamConsumer(AsyncJsonWebsocketConsumer):
+    """
+    Websocket subscribed to one broker stream for the connected user.
+
+    Nothing runs while the socket is idle: no polling and no per-connection task;
+    frames arrive from the channel layer only when something is published to
+    this user (core.broker.publish). Subclasses set `stream`.
+    """
+    stream = None
+
+    async def connect(self):
+        user = self.scope.get("user")
+        if user is None or not user.is_authenticated:
+            await self.close(code=CLOSE_UNAUTHENTICATED)
+            return
+        self.user_id = user.pk
+        self.group = user_group(self.stream, user.pk)
+        await self.channel_layer.group_add(self.group, self.channel_name)
+        await self.accept()
+
+    async def disconnect(self, code):
+        if hasattr(self, "group"):
+            await self.channel_layer.group_discard(self.group, self.channel_name)
+
+    async def push_event(self, event):
+        # handler for broker.EVENT_TYPE ("push.event")
+        await self.send_json(event["payload"])
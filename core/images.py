@@ -0,0 +1,242 @@
+# core/images.py
+# off-request image pipeline: uploads are stored as-is, then a queued task (core/tasks.py)
+# renders EXIF-free WebP + JPEG renditions and records them (with the dimensions) on the
+# row's *_meta JSON field, so serializers can pick a size without extra queries
+import io
+import logging
+import os
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.dispatch import Signal
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+# "app_label.Model" -> (image field, meta field, rendition widths)
+SPECS = {
+    "feed.Post": ("image", "image_meta", (320, 640, 1280)),
+    "communities.CommunityPost": ("image", "image_meta", (320, 640, 1280)),
+    "communities.Community": ("picture", "picture_meta", (160, 640)),
+    "profiles.Profile": ("avatar", "avatar_meta", (96, 320)),
+}
+
+PENDING = "pending"
+READY = "ready"
+FAILED = "failed"
+
+RENDITION_DIR = "renditions"
+WEBP_QUALITY = 80
+JPEG_QUALITY = 82
+ORIENTATION_TAG = 0x0112
+
+# sent after a row's meta field is written by the worker (queryset.update skips post_save)
+renditions_ready = Signal()
+
+# -----------------------
+# rendering
+# -----------------------
+def _encode(img, fmt):
+    buf = io.BytesIO()
+    if fmt == "webp":
+        img.save(buf, "WEBP", quality=WEBP_QUALITY, method=4)
+    else:
+        if img.mode != "RGB":
+            # flatten transparency onto white; JPEG has no alpha
+            background = Image.new("RGB", img.size, (255, 255, 255))
+            background.paste(img, mask=img.getchannel("A") if "A" in img.getbands() else None)
+            img = background
+        img.save(buf, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    # nothing passes exif= / icc_profile= through, so metadata (GPS etc.) is dropped
+    return buf.getvalue()
+
+
+def render(name, widths):
+    """Render every width of the stored image `name`; returns the meta dict."""
+    with default_storage.open(name, "rb") as fh:
+        img = Image.open(fh)
+        # the source's dimensions as displayed: read before draft(), swapped when the
+        # EXIF orientation (5-8) turns the image by 90 degrees
+        width, height = img.size
+        if img.getexif().get(ORIENTATION_TAG, 1) in (5, 6, 7, 8):
+            width, height = height, width
+        # let the JPEG decoder downscale by 1/2..1/8 while decoding the largest size we need
+        img.draft("RGB", (max(widths), max(widths)))
+        img = ImageOps.exif_transpose(img)
+        img.load()
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "transparency" in img.info or img.mode in ("LA", "PA") else "RGB")
+
+    stem = os.path.splitext(name)[0]
+    renditions = []
+    for target in sorted({min(w, width) for w in widths}):
+        copy = img.copy()
+        # box height rounded up, so the width (not a floored height) is what binds
+        copy.thumbnail((target, -(-target * height // max(width, 1))), Image.LANCZOS)
+        entry = {"width": copy.width, "height": copy.height}
+        for fmt, ext in (("webp", "webp"), ("jpeg", "jpg")):
+            entry[fmt] = default_storage.save(f"{RENDITION_DIR}/{stem}_{target}.{ext}", ContentFile(_encode(copy, fmt)))
+        renditions.append(entry)
+    return {"status": READY, "source": name, "width": width, "height": height, "renditions": renditions}
+
+
+def delete_renditions(meta):
+    for entry in (meta or {}).get("renditions", []):
+        for fmt in ("webp", "jpeg"):
+            if entry.get(fmt):
+                default_storage.delete(entry[fmt])
+
+
+def process(label, pk):
+    """Render the image of one row and store the result on its meta field."""
+    model = apps.get_model(label)
+    field, meta_field, widths = SPECS[label]
+    row = model.objects.filter(pk=pk).values_list(field, meta_field).first()
+    if not row or not row[0]:
+        return None
+    name, previous = row
+    try:
+        meta = render(name, widths)
+    except Exception as exc:
+        logger.exception("image processing failed for %s %s (%s)", label, pk, name)
+        meta = {"status": FAILED, "source": name, "error": str(exc)[:200]}
+
+    # only write if the upload wasn't replaced while we were rendering
+    if not model.objects.filter(pk=pk, **{field: name}).update(**{meta_field: meta}):
+        delete_renditions(meta)
+        return None
+    # re-render (process_images --force): drop the files it replaced
+    delete_renditions(previous)
+    renditions_ready.send(sender=model, pk=pk, meta=meta)
+    return meta
+
+
+def schedule(label, pk):
+    if settings.IMAGE_PROCESSING_SYNC:
+        process(label, pk)
+        return
+    from .tasks import render_image
+
+    # survives restarts and runs on whichever run_worker process claims it; a re-upload
+    # while one is queued reuses it (process() reads the row's current file)
+    render_image.enqueue([label, pk], key=f"render_image:{label}:{pk}")
+
+
+def image_saved(sender, instance, **kwargs):
+    """post_save receiver: queue processing when the stored file changed."""
+    label = sender._meta.label
+    field, meta_field, _ = SPECS[label]
+    name = getattr(instance, field).name or ""
+    old = getattr(instance, meta_field) or {}
+    if name == old.get("source", ""):
+        return
+    meta = {"status": PENDING, "source": name} if name else {}
+    sender.objects.filter(pk=instance.pk).update(**{meta_field: meta})
+    setattr(instance, meta_field, meta)
+
+    def after_commit():
+        delete_renditions(old)
+        if name:
+            schedule(label, instance.pk)
+
+    transaction.on_commit(after_commit)
+
+
+def connect_signals():
+    from django.db.models.signals import post_save
+
+    for label in SPECS:
+        post_save.connect(image_saved, sender=label, dispatch_uid=f"images:{label}")
+
+
+# -----------------------
+# picking a rendition
+# -----------------------
+def client_width(request, default):
+    """Wanted width in px: ?image_width=, else the Sec-CH-Width / Width client hint."""
+    if request is not None:
+        params = getattr(request, "query_params", request.GET)
+        for raw in (params.get("image_width"), request.headers.get("Sec-CH-Width"), request.headers.get("Width")):
+            try:
+                if raw and int(raw) > 0:
+                    return int(raw)
+            except ValueError:
+                continue
+    return default
+
+
+def client_format(request):
+    """WebP unless the client asks for ?image_format=jpeg."""
+    if request is not None:
+        params = getattr(request, "query_params", request.GET)
+        if params.get("image_format") in ("jpeg", "jpg"):
+            return "jpeg"
+    return "webp"
+
+
+def pick(meta, width, fmt="webp"):
+    """Storage name of the smallest rendition at least `width` wide (else the largest)."""
+    renditions = (meta or {}).get("renditions") or []
+    if not renditions:
+        return None
+    entry = next((r for r in renditions if r["width"] >= width), renditions[-1])
+    return entry[fmt]
+
+
+def _absolute(request, url):
+    return request.build_absolute_uri(url) if request is not None else url
+
+
+def image_url(file, meta, request, default_width):
+    """
+    URL of the best rendition for this client, or the original while still processing.
+    `file` is a FieldFile or, on values() rows, the stored name.
+    """
+    if not file:
+        return None
+    if (meta or {}).get("status") == READY:
+        return _absolute(request, default_storage.url(pick(meta, client_width(request, default_width), client_format(request))))
+    return _absolute(request, default_storage.url(file) if isinstance(file, str) else file.url)
+
+
+def image_info(meta, request):
+    """Dimensions and every rendition, for clients that build their own srcset."""
+    if (meta or {}).get("status") != READY:
+        return None
+    return {
+        "width": meta["width"],
+        "height": meta["height"],
+        "renditions": [
+            {
+                "width": r["width"],
+                "height": r["height"],
+                "webp": _absolute(request, default_storage.url(r["webp"])),
+                "jpeg": _absolute(request, default_storage.url(r["jpeg"])),
+            }
+            for r in meta["renditions"]
+        ],
+    }
+
+
+class RenditionSerializerMixin:
+    """
+    Replaces image fields in the output with the rendition that fits the client and
+    adds `<field>_info` (dimensions + all renditions, null while processing).
+
+        rendition_fields = {"image": ("image_meta", 640)}   # field -> (meta field, default width)
+    """
+    rendition_fields = {}
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        request = self.context.get("request")
+        for field, (meta_field, default_width) in self.rendition_fields.items():
+            if field not in data:
+                continue
+            meta = getattr(instance, meta_field, None)
+            data[field] = image_url(getattr(instance, field), meta, request, default_width)
+            data[f"{field}_info"] = image_info(meta, request)
+        return data
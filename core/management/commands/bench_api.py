@@ -0,0 +1,70 @@
+# core/management/commands/bench_api.py
+import json
+import platform
+
+import django
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from core.bench import runner, seed
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a synthetic social graph in a throwaway test database and benchmark every API route "
+        "(p50/p95 latency, SQL query count, peak memory). Prints JSON, or writes it with --output."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=200)
+        parser.add_argument("--friends", type=int, default=12, help="mean friends per user (power-law)")
+        parser.add_argument("--posts-per-user", type=int, default=5)
+        parser.add_argument("--communities", type=int, default=10)
+        parser.add_argument("--posts-per-community", type=int, default=30)
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--auth", choices=("session", "token"), default="session", help="how the viewer authenticates")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--output", help="write the JSON report to this file")
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            ids = seed.seed(
+                users=options["users"],
+                mean_friends=options["friends"],
+                posts_per_user=options["posts_per_user"],
+                communities=options["communities"],
+                posts_per_community=options["posts_per_community"],
+                seed=options["seed"],
+                stdout=self.stderr,
+            )
+            viewer = User.objects.get(pk=ids["viewer_id"])
+            results, skipped = runner.run(viewer, ids, iterations=options["iterations"], auth=options["auth"])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        report = {
+            "meta": {
+                "django": django.get_version(),
+                "python": platform.python_version(),
+                "database": connection.vendor,
+                "seed": {k: options[k] for k in ("users", "friends", "posts_per_user", "communities", "posts_per_community", "seed")},
+                "iterations": options["iterations"],
+                "auth": options["auth"],
+            },
+            "endpoints": results,
+            "skipped": skipped,
+        }
+        payload = json.dumps(report, indent=2, sort_keys=True)
+        if options["output"]:
+            with open(options["output"], "w") as fh:
+                fh.write(payload)
+            self.stderr.write(self.style.SUCCESS(f"Wrote {len(results)} endpoint results to {options['output']}"))
+        else:
+            self.stdout.write(payload)
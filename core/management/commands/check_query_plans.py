@@ -0,0 +1,109 @@
+# core/management/commands/check_query_plans.py
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.communities.models import CommunityPost, JoinRequest, Membership, PostComment, PostReport
+from apps.feed.timeline import timeline_for, visible_posts
+from apps.friendships.models import Friendship
+from core.pagination import KeysetPagination
+
+PAGE = 11  # page_size + 1, like KeysetPagination
+
+
+def _page(queryset, ordering=KeysetPagination.ordering):
+    """One keyset page past a cursor, as KeysetPagination reads it."""
+    position = (timezone.now(), 2 ** 31)
+    return KeysetPagination()._range(queryset, ordering, position)[:PAGE]
+
+
+def hot_queries(user):
+    """
+    (endpoint, queryset) pairs built by the code the views run, with a cursor applied.
+    Feed ranges come from timeline_for() / visible_posts() for `user`.
+    """
+    timeline = ("-created_at", "-post_id")
+    own, shared = timeline_for(user)
+    public, friends, mine = visible_posts(user)
+    return [
+        ("FeedListView (timeline, own rows)", _page(own, timeline)),
+        ("FeedListView (timeline, shared rows)", _page(shared, timeline)),
+        ("FeedListView fallback (public posts)", _page(public)),
+        ("FeedListView fallback (friends' posts)", _page(friends)),
+        ("FeedListView fallback (own posts)", _page(mine)),
+        ("CommunityPostListCreateView",
+         _page(CommunityPost.objects.filter(community_id=1, is_removed=False).select_related("author"))),
+        ("PostCommentListCreateView",
+         _page(PostComment.objects.filter(post_id=1, is_removed=False).select_related("user"), ("created_at", "id"))),
+        ("membership lookup (is_member / is_admin)",
+         Membership.objects.filter(community_id=1, user_id=1, is_approved=True)),
+        ("CommunityReportListView",
+         PostReport.objects.filter(community_id=1).order_by("-created_at")),
+        ("CommunityJoinRequestListView",
+         JoinRequest.objects.filter(community_id=1).order_by("-created_at")),
+        ("CommunityJoinRequestListView (?processed=false)",
+         JoinRequest.objects.filter(community_id=1, processed=False).order_by("-created_at")),
+    ]
+
+
+def plan_problems(vendor, plan, table):
+    """Return the reasons a plan is not index-backed (empty list = fine)."""
+    problems = []
+    for line in plan.splitlines():
+        text = line.strip()
+        if vendor == "sqlite":
+            # "SCAN <table>" without an index is a full table scan
+            if text.startswith(f"SCAN {table}") and "USING" not in text:
+                problems.append(text)
+            if "USE TEMP B-TREE" in text:
+                problems.append(text)
+        elif vendor == "postgresql":
+            if f"Seq Scan on {table}" in text or text.startswith("Sort"):
+                problems.append(text)
+    return problems
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN the hot endpoint queries and fail if any of them is not served by an index."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, help="Viewer id for the feed queries (default: a user with friends).")
+
+    def handle(self, *args, **options):
+        vendor = connection.vendor
+        if vendor not in ("sqlite", "postgresql"):
+            raise CommandError(f"Unsupported database vendor: {vendor}")
+
+        failures = 0
+        with transaction.atomic():
+            if vendor == "postgresql":
+                # small/empty tables make seq scans "cheaper"; ask whether an index *can* serve the query
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+            for name, qs in hot_queries(self.viewer(options["user"])):
+                plan = qs.explain()
+                if not plan.strip():
+                    # e.g. the friends range of a user without friends never reaches the DB
+                    self.stdout.write(self.style.WARNING(f"skip {name} (no query for this user)"))
+                    continue
+                problems = plan_problems(vendor, plan, qs.model._meta.db_table)
+                if problems:
+                    failures += 1
+                    self.stdout.write(self.style.ERROR(f"FAIL {name}"))
+                    for line in plan.splitlines():
+                        self.stdout.write(f"    {line}")
+                else:
+                    self.stdout.write(self.style.SUCCESS(f"ok   {name}"))
+
+        if failures:
+            raise CommandError(f"{failures} hot query plan(s) are not index-backed.")
+
+    @staticmethod
+    def viewer(user_id):
+        User = get_user_model()
+        if user_id is None:
+            user_id = Friendship.objects.values_list("user_id", flat=True).first()
+        if user_id is None:
+            user_id = User.objects.values_list("pk", flat=True).order_by("pk").first() or 1
+        return User(pk=user_id)
@@ -0,0 +1,34 @@
+# core/management/commands/process_images.py
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from core.images import READY, SPECS, process
+
+
+class Command(BaseCommand):
+    help = "Render missing image renditions (uploads from before the pipeline, failed or interrupted jobs)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--model", action="append", choices=sorted(SPECS), help="limit to these models (repeatable)")
+        parser.add_argument("--force", action="store_true", help="re-render images that are already processed")
+
+    def handle(self, *args, **options):
+        total = 0
+        for label in options["model"] or SPECS:
+            model = apps.get_model(label)
+            field, meta_field, _ = SPECS[label]
+            qs = model.objects.exclude(**{field: ""}).exclude(**{f"{field}__isnull": True})
+            if not options["force"]:
+                # spelled out: a plain exclude() also drops rows where the key is missing (NULL)
+                qs = qs.filter(Q(**{f"{meta_field}__status__isnull": True}) | ~Q(**{f"{meta_field}__status": READY}))
+            done = 0
+            for pk in qs.values_list("pk", flat=True).iterator():
+                meta = process(label, pk)
+                if meta is not None and meta.get("status") == READY:
+                    done += 1
+                else:
+                    self.stderr.write(f"{label} {pk}: {(meta or {}).get('error', 'skipped')}")
+            self.stdout.write(f"{label}: {done} processed")
+            total += done
+        self.stdout.write(self.style.SUCCESS(f"Processed {total} image(s)."))
@@ -0,0 +1,162 @@
+# core/middleware.py
+import contextvars
+import json
+import logging
+import os
+import random
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack
+from logging.handlers import RotatingFileHandler
+
+from django.conf import settings
+from django.db import connections
+from rest_framework import serializers
+
+_profile = contextvars.ContextVar("request_profile", default=None)
+
+_IN_LIST_RE = re.compile(r"\(\s*%s(?:\s*,\s*%s)*\s*\)")
+_NUMBER_RE = re.compile(r"\b\d+\b")
+
+
+def fingerprint(sql):
+    """Collapse an SQL statement to its shape so N+1 repeats share one key."""
+    return _NUMBER_RE.sub("?", _IN_LIST_RE.sub("(...)", sql)).strip()
+
+
+class RequestProfile:
+    __slots__ = ("db_ms", "queries", "serializer_ms", "serializer_depth", "view_start", "view_ms")
+
+    def __init__(self):
+        self.db_ms = 0.0
+        self.queries = Counter()
+        self.serializer_ms = 0.0
+        self.serializer_depth = 0
+        self.view_start = None
+        self.view_ms = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        # connection.execute_wrapper hook: time every query and count its shape
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_ms += (time.perf_counter() - start) * 1000
+            self.queries[fingerprint(sql)] += 1
+
+    @property
+    def query_count(self):
+        return sum(self.queries.values())
+
+    def duplicates(self, limit=5):
+        return [(sql, n) for sql, n in self.queries.most_common(limit) if n > 1]
+
+
+def _timed_data(prop):
+    """Wrap a serializer `.data` property so only the outermost access is timed."""
+    def fget(self):
+        profile = _profile.get()
+        if profile is None:
+            return prop.fget(self)
+        profile.serializer_depth += 1
+        start = time.perf_counter()
+        try:
+            return prop.fget(self)
+        finally:
+            profile.serializer_depth -= 1
+            if profile.serializer_depth == 0:
+                profile.serializer_ms += (time.perf_counter() - start) * 1000
+    fget._request_profiling = True
+    return property(fget)
+
+
+def _install_serializer_timing():
+    for cls in (serializers.Serializer, serializers.ListSerializer):
+        prop = cls.__dict__["data"]
+        if not getattr(prop.fget, "_request_profiling", False):
+            cls.data = _timed_data(prop)
+
+
+def _jsonl_logger():
+    logger = logging.getLogger("fbclone.request_profile")
+    if not logger.handlers:
+        path = settings.REQUEST_PROFILING_LOG
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handler = RotatingFileHandler(
+            path,
+            maxBytes=getattr(settings, "REQUEST_PROFILING_LOG_MAX_BYTES", 10 * 1024 * 1024),
+            backupCount=getattr(settings, "REQUEST_PROFILING_LOG_BACKUPS", 5),
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+class RequestProfilingMiddleware:
+    """
+    Opt-in (REQUEST_PROFILING=True) per-request instrumentation.
+
+    Adds a Server-Timing header with db / serializer / view / total durations, the
+    query count and how many queries repeated an earlier shape (N+1 suspects), and
+    writes a sampled JSON line per request to REQUEST_PROFILING_LOG (rotating).
+    Keep it last in MIDDLEWARE so "view" covers only the view and its rendering.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, "REQUEST_PROFILING_SAMPLE_RATE", 0.1)
+        self.logger = _jsonl_logger()
+        _install_serializer_timing()
+
+    def __call__(self, request):
+        profile = RequestProfile()
+        token = _profile.set(profile)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for conn in connections.all():
+                    stack.enter_context(conn.execute_wrapper(profile))
+                response = self.get_response(request)
+        finally:
+            _profile.reset(token)
+        total_ms = (time.perf_counter() - start) * 1000
+        if profile.view_start is not None:
+            profile.view_ms = (time.perf_counter() - profile.view_start) * 1000
+
+        duplicates = profile.duplicates()
+        repeated = sum(n - 1 for n in profile.queries.values() if n > 1)
+        response["Server-Timing"] = ", ".join([
+            f'db;dur={profile.db_ms:.1f};desc="{profile.query_count} queries"',
+            f'dup;desc="{repeated} repeated queries"',
+            f"serializer;dur={profile.serializer_ms:.1f}",
+            f"view;dur={profile.view_ms:.1f}",
+            f"total;dur={total_ms:.1f}",
+        ])
+
+        if random.random() < self.sample_rate:
+            match = getattr(request, "resolver_match", None)
+            self.logger.info(json.dumps({
+                "ts": time.time(),
+                "method": request.method,
+                "path": request.path,
+                "route": match.route if match else None,
+                "view": match.view_name if match else None,
+                "status": response.status_code,
+                "total_ms": round(total_ms, 2),
+                "view_ms": round(profile.view_ms, 2),
+                "serializer_ms": round(profile.serializer_ms, 2),
+                "db_ms": round(profile.db_ms, 2),
+                "queries": profile.query_count,
+                "repeated_queries": repeated,
+                "duplicates": [{"sql": sql, "count": n} for sql, n in duplicates],
+            }))
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        profile = _profile.get()
+        if profile is not None:
+            profile.view_start = time.perf_counter()
+        return None
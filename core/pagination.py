@@ -0,0 +1,157 @@
+# core/pagination.py
+# keyset (cursor) pagination shared by the feed, post, comment and like lists
+import base64
+import heapq
+from itertools import islice
+from urllib import parse
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination keyed on (created_at, id).
+
+    The cursor stores the last row's (created_at, id) instead of an offset, so every
+    page is a single indexed range read (`WHERE (created_at, id) < cursor LIMIT n`),
+    no COUNT(*) is run, and rows inserted while the client scrolls never shift pages.
+
+    Views pick the direction with `cursor_ordering` (default newest first), e.g.
+    ("created_at", "id") for comment threads. The second field is the tie-breaker and
+    is read from each row as an attribute, so ("-created_at", "-post_id") works on
+    TimelineEntry rows.
+
+    `paginate_queryset` also takes a list of querysets that each cover one index range
+    (e.g. a user's own timeline rows and the shared public ones): every range gets the
+    cursor and the limit on its own and the pages are merged in Python, instead of one
+    OR query that has to sort the union. Both ordering fields must sort the same way.
+    """
+    cursor_query_param = "cursor"
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 50
+    ordering = ("-created_at", "-id")
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.ordering = tuple(getattr(view, "cursor_ordering", self.ordering))
+        self.page_size = self.get_page_size(request)
+
+        position, reverse = self.decode_cursor(request)
+        ordering = self.ordering if not reverse else tuple(self._flip(f) for f in self.ordering)
+
+        # one extra row tells us whether there is another page in this direction
+        ranges = queryset if isinstance(queryset, (list, tuple)) else [queryset]
+        parts = [list(self._range(qs, ordering, position)[: self.page_size + 1]) for qs in ranges]
+        if len(parts) == 1:
+            rows = parts[0]
+        else:
+            merged = heapq.merge(*parts, key=self._position, reverse=ordering[0].startswith("-"))
+            rows = list(islice(merged, self.page_size + 1))
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        if reverse:
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        self.page = rows
+        return rows
+
+    def get_page_size(self, request):
+        if self.page_size_query_param:
+            try:
+                size = int(request.query_params[self.page_size_query_param])
+                if size > 0:
+                    return min(size, self.max_page_size)
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self._position(self.page[-1]), reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self._position(self.page[0]), reverse=True)
+
+    # -----------------------
+    # cursor helpers
+    # -----------------------
+    def encode_cursor(self, position, reverse):
+        created_at, pk = position
+        raw = f"{created_at.isoformat()}|{pk}|{int(reverse)}"
+        token = base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+        try:
+            raw = base64.urlsafe_b64decode(parse.unquote(token).encode("ascii")).decode("ascii")
+            created_at, pk, reverse = raw.split("|")
+            created_at = parse_datetime(created_at)
+            if created_at is None:
+                raise ValueError
+            return (created_at, int(pk)), reverse == "1"
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _range(self, queryset, ordering, position):
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self._after(ordering, position))
+        return queryset
+
+    def _position(self, row):
+        return tuple(getattr(row, f.lstrip("-")) for f in self.ordering)
+
+    @staticmethod
+    def _flip(field):
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+    @staticmethod
+    def _after(ordering, position):
+        # rows strictly after `position` in `ordering`: a < x OR (a = x AND b < y)
+        (first, second), (v1, v2) = ordering, position
+        op1 = "lt" if first.startswith("-") else "gt"
+        op2 = "lt" if second.startswith("-") else "gt"
+        first, second = first.lstrip("-"), second.lstrip("-")
+        return Q(**{f"{first}__{op1}": v1}) | Q(**{first: v1, f"{second}__{op2}": v2})
+
+    def to_html(self):
+        return ""
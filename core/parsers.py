@@ -0,0 +1,43 @@
+# core/parsers.py
+# request decoders matching core/renderers.py
+from django.conf import settings
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+from .renderers import CBORRenderer, MessagePackRenderer, cbor2, msgpack, orjson
+
+
+class JSONParser(parsers.JSONParser):
+    """orjson when installed; like DRF's parser it rejects NaN / Infinity."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        try:
+            body = stream.read()
+            if encoding.lower().replace("-", "") != "utf8":
+                body = body.decode(encoding)
+            return orjson.loads(body)
+        except ValueError as exc:  # orjson.JSONDecodeError, UnicodeDecodeError
+            raise ParseError("JSON parse error - %s" % str(exc))
+
+
+class MessagePackParser(parsers.BaseParser):
+    media_type = MessagePackRenderer.media_type
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (ValueError, msgpack.UnpackException) as exc:
+            raise ParseError("MessagePack parse error - %s" % str(exc))
+
+
+class CBORParser(parsers.BaseParser):
+    media_type = CBORRenderer.media_type
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return cbor2.loads(stream.read())
+        except (ValueError, cbor2.CBORDecodeError) as exc:
+            raise ParseError("CBOR parse error - %s" % str(exc))
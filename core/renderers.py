@@ -0,0 +1,69 @@
+# core/renderers.py
+# response encoders: JSON through orjson when it is installed (stdlib otherwise), plus
+# opt-in MessagePack / CBOR for native clients that send a matching Accept header
+from rest_framework import renderers
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json via DRF
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover
+    cbor2 = None
+
+# values a format has no type for (lazy strings, querysets, Decimal in JSON, ...) are
+# converted by DRF's encoder, as in the stdlib JSON output
+_encoder = JSONEncoder()
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """
+    Same output as DRF's renderer (compact, UTF-8, U+2028/2029 escaped); only float
+    exponents may be spelled differently (1e20 vs 1e+20). Indented output
+    (`Accept: application/json; indent=4`) and anything orjson rejects, such as ints
+    beyond 64 bits, go through the stdlib path.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=_encoder.default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+        except TypeError:  # orjson.JSONEncodeError
+            return super().render(data, accepted_media_type, renderer_context)
+        # valid JSON, but not valid JavaScript (same escaping as DRF)
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+class MessagePackRenderer(renderers.BaseRenderer):
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=_encoder.default, use_bin_type=True)
+
+
+class CBORRenderer(renderers.BaseRenderer):
+    media_type = "application/cbor"
+    format = "cbor"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return cbor2.dumps(data, default=lambda encoder, value: encoder.encode(_encoder.default(value)))
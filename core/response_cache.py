@@ -0,0 +1,96 @@
+# core/response_cache.py
+# shared response cache for anonymous reads of public resources. Entries are keyed on
+# the normalized request plus the version stamps ("tags") the payload depends on;
+# model signals bump those stamps on writes, so stale entries are simply never read again
+import hashlib
+
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from rest_framework.response import Response
+
+from .cache import DEFAULT_TIMEOUT, bump_version, get_versions
+from .conditional import VARY_HEADERS, make_etag
+
+# how long browsers / CDNs may reuse a public response without asking again
+PUBLIC_MAX_AGE = 60
+
+
+def tag(*parts):
+    """Version-stamp key for one cached resource, e.g. tag("post", 7, "likes")."""
+    return "resp:" + ":".join(str(p) for p in parts)
+
+
+def bump_tags(*tags):
+    bump_version(*tags)
+    # again after commit, so a page rendered from pre-commit rows isn't stored under the new stamp
+    transaction.on_commit(lambda: bump_version(*tags))
+
+
+def response_key(request, tags):
+    params = sorted(request.query_params.lists())
+    versions = get_versions(list(tags))
+    raw = repr((
+        request.path,
+        params,
+        request.accepted_media_type,
+        [request.headers.get(h, "") for h in ("Sec-CH-Width", "Width")],
+        [versions[t] for t in tags],
+    ))
+    return "resp:page:" + hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+class PublicResponseCacheMixin:
+    """
+    Views implement `public_cache_tags(request, *args, **kwargs)`, returning the tags
+    the response depends on, or None when this request must not be shared (the
+    resource isn't public). Only anonymous GETs (no session, no Authorization header)
+    use the cache: authenticated payloads carry viewer state (liked_by_user,
+    membership, ...) and are marked private.
+    """
+
+    def public_cache_tags(self, request, *args, **kwargs):
+        return None
+
+    def get(self, request, *args, **kwargs):
+        self._public_cache_key = None
+        # a request carrying credentials never reads or fills a shared entry
+        if not request.user.is_authenticated and "Authorization" not in request.headers:
+            tags = self.public_cache_tags(request, *args, **kwargs)
+            if tags is not None:
+                key = response_key(request, tags)
+                hit = cache.get(key)
+                if hit is not None:
+                    return self._from_cache(request, *hit)
+                self._public_cache_key = key
+        return super().get(request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        key = getattr(self, "_public_cache_key", None)
+        if request.method != "GET":
+            return response
+        if key and isinstance(response, Response) and response.status_code == 200:
+            response.render()
+            etag = response.get("ETag") or "W/" + make_etag(response.content)
+            response["ETag"] = etag
+            cache.set(key, (response.content, response["Content-Type"], etag), DEFAULT_TIMEOUT)
+            self._public_headers(response)
+        elif not getattr(response, "_public_cache_hit", False):
+            patch_cache_control(response, private=True)
+        return response
+
+    def _from_cache(self, request, content, content_type, etag):
+        response = get_conditional_response(request, etag=etag) or HttpResponse(content, content_type=content_type)
+        response["ETag"] = etag
+        response._public_cache_hit = True
+        self._public_headers(response)
+        return response
+
+    @staticmethod
+    def _public_headers(response):
+        # replaces the private, no-cache set by ConditionalGetMixin for this anonymous response;
+        # sessions (Cookie) and bearer tokens (Authorization) both make a response per-user
+        response["Cache-Control"] = f"public, max-age={PUBLIC_MAX_AGE}"
+        patch_vary_headers(response, ("Cookie", "Authorization", *VARY_HEADERS))
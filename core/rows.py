@@ -0,0 +1,140 @@
+# core/rows.py
+# model-free read path for hot list endpoints: a page is fetched with values_list()
+# straight into __slots__ records and rendered by a field plan compiled once from the
+# serializer, so no model instances are built and no DRF field dispatch runs per row.
+# The output is the serializer's, byte for byte.
+from itertools import starmap
+from operator import attrgetter
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models.query import ValuesListIterable
+from rest_framework import serializers
+
+from .images import image_info, image_url
+
+
+class Computed:
+    """An output value built from raw columns: `fn(context, *values)`."""
+
+    def __init__(self, fn, *columns):
+        self.fn = fn
+        self.columns = columns
+
+
+def record_class(name, fields):
+    """A slotted record type whose __init__ takes the columns positionally."""
+    fields = tuple(fields)
+
+    def __init__(self, *values):
+        for field, value in zip(fields, values, strict=True):
+            setattr(self, field, value)
+
+    return type(name, (), {"__slots__": fields, "__init__": __init__})
+
+
+def _getter(columns):
+    get = attrgetter(*columns) if columns else None
+    if len(columns) == 1:
+        return lambda row: (get(row),)
+    return get or (lambda row: ())
+
+
+class Plan:
+    """
+    Compiled from a serializer class. Plain model fields reuse the DRF field's
+    to_representation, PK-related fields emit the raw id, nested serializers over
+    non-null relations are flattened into `rel__field` columns, and the serializer's
+    `rendition_fields` are rendered like RenditionSerializerMixin does. Anything else
+    (method fields, custom nested output) comes from `computed`, keyed by output name
+    ("user.avatar" inside a nested serializer) with columns relative to that level.
+
+    `prefix` reads the serialized object through a relation (e.g. "post__" on
+    TimelineEntry); `extra` columns are fetched as-is, e.g. for the cursor.
+    """
+
+    def __init__(self, serializer_class, computed=None, prefix="", extra=()):
+        columns = []
+        self.steps = self._compile(serializer_class(), computed or {}, prefix, columns)
+        self.columns = list(dict.fromkeys([*columns, *extra]))
+        self.record = record_class(f"{serializer_class.__name__}Row", self.columns)
+        record = self.record
+
+        class RecordIterable(ValuesListIterable):
+            def __iter__(self):
+                return starmap(record, super().__iter__())
+
+        self.iterable = RecordIterable
+
+    def _compile(self, serializer, computed, prefix, columns):
+        steps = []
+        rendition_fields = getattr(serializer, "rendition_fields", {})
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if name in computed:
+                steps.append((name, self._computed(computed[name], prefix, columns)))
+            elif name in rendition_fields:
+                meta_field, width = rendition_fields[name]
+                steps.append((name, self._computed(Computed(_rendition(width), field.source, meta_field), prefix, columns)))
+            elif isinstance(field, serializers.BaseSerializer):
+                if getattr(field, "many", False):
+                    raise ImproperlyConfigured(f"{type(serializer).__name__}.{name}: many=True needs a Computed")
+                nested = {k[len(name) + 1:]: v for k, v in computed.items() if k.startswith(f"{name}.")}
+                sub = self._compile(field, nested, f"{prefix}{field.source.replace('.', '__')}__", columns)
+                steps.append((name, lambda row, context, sub=sub: {k: fn(row, context) for k, fn in sub}))
+            elif isinstance(field, (serializers.SerializerMethodField, serializers.FileField)) or field.source == "*":
+                raise ImproperlyConfigured(f"{type(serializer).__name__}.{name} needs a Computed")
+            else:
+                column = prefix + field.source.replace(".", "__")
+                columns.append(column)
+                get = attrgetter(column)
+                if isinstance(field, serializers.RelatedField):
+                    steps.append((name, lambda row, context, get=get: get(row)))
+                else:
+                    rep = field.to_representation
+                    steps.append((name, lambda row, context, get=get, rep=rep: None if (v := get(row)) is None else rep(v)))
+        for name, (meta_field, _width) in rendition_fields.items():
+            if name in serializer.fields:
+                steps.append((f"{name}_info", self._computed(Computed(_rendition_info, meta_field), prefix, columns)))
+        return steps
+
+    @staticmethod
+    def _computed(spec, prefix, columns):
+        names = [prefix + c for c in spec.columns]
+        columns.extend(names)
+        get, fn = _getter(names), spec.fn
+        return lambda row, context: fn(context, *get(row))
+
+    def queryset(self, queryset):
+        """`queryset` narrowed to the plan's columns, yielding records."""
+        queryset = queryset.values_list(*self.columns)
+        queryset._iterable_class = self.iterable
+        return queryset
+
+    def data(self, rows, context):
+        steps = self.steps
+        return [{name: fn(row, context) for name, fn in steps} for row in rows]
+
+
+def _rendition(width):
+    return lambda context, name, meta: image_url(name, meta, context.get("request"), width)
+
+
+def _rendition_info(context, meta):
+    return image_info(meta, context.get("request"))
+
+
+class RowReadMixin:
+    """
+    List views with a `Plan` serve pages through it while `row_read` is True (and
+    settings.ROW_READ). `?read=model` / `?read=rows` picks the path for one request,
+    so both can be benchmarked against the same data.
+    """
+    row_read = True
+
+    def use_rows(self):
+        choice = self.request.query_params.get("read")
+        if choice in ("model", "rows"):
+            return choice == "rows"
+        return self.row_read and getattr(settings, "ROW_READ", True)
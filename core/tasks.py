@@ -0,0 +1,9 @@
+# core/tasks.py
+from apps.tasks.queue import task
+from . import images
+
+
+@task(max_attempts=3)
+def render_image(label, pk):
+    """Render the renditions of one uploaded image (core/images.py)."""
+    images.process(label, pk)
@@ -1,3 +1,5 @@
+from datetime import timedelta
+from importlib.util import find_spec
 from pathlib import Path
 import environ
 import os
@@ -15,6 +17,8 @@ SECRET_KEY = env("SECRET_KEY")
 ALLOWED_HOSTS = [h.strip() for h in env("ALLOWED_HOSTS", default="").split(",") if h.strip()]
 
 INSTALLED_APPS = [
+    # ASGI runserver (HTTP + websockets + SSE); must come before django.contrib.staticfiles
+    "daphne",
     "django.contrib.admin",
     "django.contrib.auth",
     "django.contrib.contenttypes",
@@ -22,6 +26,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "rest_framework",
+    "channels",
 
     "core",
     "apps.accounts.apps.AppsAccountsConfig",
@@ -33,6 +38,9 @@ INSTALLED_APPS = [
     "apps.chat",
     "apps.groups",
     "apps.communities",
+    "apps.notifications",
+    "apps.tasks",
+    "apps.search",
 ]
 
 # Your custom user model
@@ -50,6 +58,16 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# -----------------------------------------------------------
+# Request profiling (opt-in): Server-Timing headers + sampled JSONL log
+# -----------------------------------------------------------
+REQUEST_PROFILING = env.bool("REQUEST_PROFILING", default=False)
+REQUEST_PROFILING_SAMPLE_RATE = env.float("REQUEST_PROFILING_SAMPLE_RATE", default=0.1)
+REQUEST_PROFILING_LOG = env("REQUEST_PROFILING_LOG", default=str(BASE_DIR / "logs" / "requests.jsonl"))
+if REQUEST_PROFILING:
+    # keep last so its "view" timing covers only the view itself
+    MIDDLEWARE.append("core.middleware.RequestProfilingMiddleware")
+
 ROOT_URLCONF = "server.urls"
 
 TEMPLATES = [
@@ -73,14 +91,134 @@ ASGI_APPLICATION = "server.asgi.application"
 
 
 # -----------------------------------------------------------
-# ✅ DATABASE — SQLite ONLY (stable for local development)
+# ✅ DATABASE — picked at startup from the environment
+#   DB_ENGINE=sqlite (default) -> local db.sqlite3 (SQLITE_WAL=1 for WAL mode)
+#   DB_ENGINE=postgres         -> DB_NAME / DB_USER / DB_PASSWORD / DB_HOST / DB_PORT
+#   DATABASE_URL=postgres://…  -> overrides the DB_* variables
 # -----------------------------------------------------------
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+DB_ENGINE = env("DB_ENGINE", default="sqlite").lower()
+
+if DB_ENGINE in ("postgres", "postgresql") or env("DATABASE_URL", default=""):
+    if env("DATABASE_URL", default=""):
+        _db = env.db("DATABASE_URL")
+    else:
+        _db = {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": env("DB_NAME", default="postgres"),
+            "USER": env("DB_USER", default="postgres"),
+            "PASSWORD": env("DB_PASSWORD", default=""),
+            "HOST": env("DB_HOST", default="localhost"),
+            "PORT": env("DB_PORT", default="5432"),
+        }
+    _db.setdefault("OPTIONS", {})
+    _db["OPTIONS"].setdefault("sslmode", env("DB_SSLMODE", default="prefer"))
+    # drop dead connections before use instead of failing the request
+    _db["CONN_HEALTH_CHECKS"] = True
+
+    if env.bool("DB_POOL", default=False):
+        # psycopg 3 connection pool inside each worker (Django 5.1+); pooled
+        # connections replace persistent ones, so CONN_MAX_AGE must stay 0
+        _db["OPTIONS"]["pool"] = {
+            "min_size": env.int("DB_POOL_MIN_SIZE", default=2),
+            "max_size": env.int("DB_POOL_MAX_SIZE", default=10),
+            "timeout": env.int("DB_POOL_TIMEOUT", default=10),
+        }
+        _db["CONN_MAX_AGE"] = 0
+    else:
+        # keep connections open between requests
+        _db["CONN_MAX_AGE"] = env.int("DB_CONN_MAX_AGE", default=60)
+
+    if env.bool("DB_PGBOUNCER", default=False):
+        # transaction-pooling bouncers (e.g. Supabase pooler) can't hold named cursors
+        _db["DISABLE_SERVER_SIDE_CURSORS"] = True
+
+    DATABASES = {"default": _db}
+else:
+    # WAL lets readers run while a write is in progress; NORMAL is safe with WAL.
+    # Opt-in: it rewrites the db file header and leaves -wal/-shm files beside it
+    _sqlite_wal = env.bool("SQLITE_WAL", default=False)
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": env("SQLITE_PATH", default=str(BASE_DIR / "db.sqlite3")),
+            "OPTIONS": {
+                "init_command": "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;" if _sqlite_wal else "",
+                # wait for the write lock instead of failing with "database is locked"
+                "timeout": env.int("SQLITE_BUSY_TIMEOUT", default=20),
+                # take the write lock up front so transactions don't deadlock on upgrade
+                "transaction_mode": "IMMEDIATE",
+            },
+        }
+    }
+
+
+# -----------------------------------------------------------
+# CACHE — in-process LRU by default, Redis when REDIS_URL is set
+# -----------------------------------------------------------
+REDIS_URL = env("REDIS_URL", default="")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "fbclone",
+            "TIMEOUT": 300,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "fbclone",
+            "TIMEOUT": 300,
+            "OPTIONS": {"MAX_ENTRIES": 10000},
+        }
+    }
+
+# token revocations (apps/accounts/tokens.py) get their own store: an evicted denylist or
+# cutoff key silently un-revokes a token. Locally that is a LocMem that only drops expired
+# keys; with Redis, point REVOCATION_CACHE_URL at an instance with maxmemory-policy noeviction.
+REVOCATION_CACHE_URL = env("REVOCATION_CACHE_URL", default=REDIS_URL)
+if REVOCATION_CACHE_URL:
+    CACHES["revocations"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REVOCATION_CACHE_URL,
+        "KEY_PREFIX": "fbclone:revoked",
+    }
+else:
+    CACHES["revocations"] = {
+        "BACKEND": "core.cache_backends.NonCullingLocMemCache",
+        "LOCATION": "fbclone-revocations",
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    }
+
+# -----------------------------------------------------------
+# BACKGROUND TASKS (apps/tasks) — rows in tasks_task run by `manage.py run_worker`
+#   TASKS_EAGER=True runs each task in-process right after the request commits
+#   (no worker needed: tests, quick local setups). It defaults to DEBUG; anywhere
+#   else, queued work (account purges, recounts, renditions, ...) only happens
+#   while a worker is running.
+# -----------------------------------------------------------
+TASKS_EAGER = env.bool("TASKS_EAGER", default=DEBUG)
+TASKS_WORKER_PROCESSES = env.int("TASKS_WORKER_PROCESSES", default=2)
+
+
+# -----------------------------------------------------------
+# CHANNEL LAYER — pub/sub for websocket delivery (apps/chat/broker.py)
+#   in-process by default (single worker), Redis when REDIS_URL is set so
+#   every worker sees every publish
+# -----------------------------------------------------------
+if REDIS_URL:
+    CHANNEL_LAYERS = {
+        "default": {
+            "BACKEND": "channels_redis.core.RedisChannelLayer",
+            "CONFIG": {"hosts": [REDIS_URL], "prefix": "fbclone"},
+        }
+    }
+else:
+    CHANNEL_LAYERS = {
+        "default": {"BACKEND": "channels.layers.InMemoryChannelLayer"},
     }
-}
 
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -100,6 +238,10 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 MEDIA_URL = "media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# image renditions (core/images.py): Pillow work is a queued task (core/tasks.py) after
+# the upload request commits; IMAGE_PROCESSING_SYNC=True renders inline (tests, scripts)
+IMAGE_PROCESSING_SYNC = env.bool("IMAGE_PROCESSING_SYNC", default=False)
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 
@@ -108,13 +250,47 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # -----------------------------------------------------------
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
+        # session first keeps 403 (not 401) for anonymous requests; without a session
+        # cookie it costs nothing and bearer tokens are checked with no DB read
         "rest_framework.authentication.SessionAuthentication",
+        "apps.accounts.authentication.StatelessJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticatedOrReadOnly",
     ],
+    # JSON through orjson when installed (core/renderers.py); MessagePack / CBOR are
+    # served to clients that ask for them in Accept, if the encoder is installed
+    "DEFAULT_RENDERER_CLASSES": [
+        "core.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+        *(["core.renderers.MessagePackRenderer"] if find_spec("msgpack") else []),
+        *(["core.renderers.CBORRenderer"] if find_spec("cbor2") else []),
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "core.parsers.JSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+        *(["core.parsers.MessagePackParser"] if find_spec("msgpack") else []),
+        *(["core.parsers.CBORParser"] if find_spec("cbor2") else []),
+    ],
+}
+
+# bearer tokens (apps/accounts/tokens.py): short-lived access, rotating single-use
+# refresh; revocation is a denylist in the "revocations" cache, so use Redis with >1 worker
+SIMPLE_JWT = {
+    "ACCESS_TOKEN_LIFETIME": timedelta(minutes=env.int("JWT_ACCESS_MINUTES", default=5)),
+    "REFRESH_TOKEN_LIFETIME": timedelta(days=env.int("JWT_REFRESH_DAYS", default=7)),
+    "ROTATE_REFRESH_TOKENS": True,
+    # the token_blacklist app (a DB table) isn't installed; TokenRefreshSerializer denies used tokens
+    "BLACKLIST_AFTER_ROTATION": False,
+    "AUTH_HEADER_TYPES": ("Bearer",),
+    "TOKEN_REFRESH_SERIALIZER": "apps.accounts.serializers.TokenRefreshSerializer",
 }
 
+# list endpoints with a values() read path (core/rows.py); False serves every
+# list through its serializer again. `?read=model|rows` overrides per request.
+ROW_READ = env.bool("ROW_READ", default=True)
+
 
 # -----------------------------------------------------------
 # Email (Gmail SMTP; we’ll implement verification later)
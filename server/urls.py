@@ -10,6 +10,8 @@ urlpatterns = [
     path("health/", health, name="health"),
     #calling the  api of the user acc login, logout, reg
     path("api/accounts/", include("apps.accounts.urls", namespace="accounts")),
+    #other people's profiles and the bulk friend-button status lookup
+    path("api/profiles/", include("apps.profiles.urls", namespace="profiles")),
     #calling the apis of the Friendship
     path("api/friendships/", include("apps.friendships.urls", namespace="friendships")),
     #calling  the apis of the feed
@@ -21,5 +23,11 @@ urlpatterns = [
     path("api/communities/", include("apps.communities.urls", namespace="communities")),
     #for t he calling of the communities post  (like, unlike etc)
     path("api/posts/", include("apps.communities.posts_urls")),  
+    #direct and group chat (live delivery over ws/chat/, see server/asgi.py)
+    path("api/chat/", include("apps.chat.urls", namespace="chat")),
+    #likes / comments / requests pushed over SSE (stream/) or ws/notifications/
+    path("api/notifications/", include("apps.notifications.urls", namespace="notifications")),
+    #ranked full-text search over posts, community posts, communities and users
+    path("api/search/", include("apps.search.urls", namespace="search")),
 
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)